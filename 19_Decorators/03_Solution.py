@@ -1,17 +1,137 @@
+import sys
+import threading
 import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
 
+# 🧠 cache: memoize a function, bounded and thread-safe
+#
+#   @cache                           # up to 128 results, least recently used dropped
+#   @cache(maxsize=1024, ttl=60)     # ...and none older than 60 seconds
+#   @cache(maxsize=None)             # unbounded (like the first version)
+#
+#   long_running_function.cache_info()    # CacheInfo(hits, misses, maxsize, currsize)
+#   long_running_function.cache_clear()
+#
+# 🔑 The key is the positional args plus the keyword args, sorted by name:
+#    f(1, b=2) and f(1, b=3) are different results, f(1, a=1, b=2) and
+#    f(1, b=2, a=1) the same one. (f(1, 2) and f(1, b=2) are still two keys,
+#    as in functools.lru_cache.) Arguments must be hashable. An expired
+#    entry counts as a miss and is replaced.
+#
+# 🧹 LRU: an OrderedDict in use order; a hit moves its key to the end and
+#    a full cache drops the first one, both O(1).
+#
+# ⏱ A hit costs about 2-3x functools.lru_cache (which is C) and well under
+#    its pure-Python fallback (benchmark_cache.py). Without a ttl, entries
+#    are bare values and a hit never reads the clock.
+#
+# 🔒 Threads: misses (and evictions) take a lock. Hits don't: dict lookup,
+#    move_to_end and popitem are single C calls, atomic under the GIL, so a
+#    hit never sees a half-written cache; at worst its key was just evicted
+#    and the move is skipped. Hit counts may then miss an increment under
+#    heavy contention. Without the GIL (free-threaded builds) hits take the
+#    lock too. Two threads missing the same key both call the function once,
+#    and the later result is kept. Exceptions are not cached.
 
-def cache(func):
-    cahce_value = {}
-    print(cahce_value)
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
+MISSING = object()
+KWARGS_MARK = object()  # separates args from kwargs in a key
+LOCK_FREE_HITS = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+# Only called with kwargs: without them the args tuple is the key
+def make_key(args, kwargs):
+    if len(kwargs) == 1:
+        return (*args, KWARGS_MARK, *kwargs.items())
+    return (*args, KWARGS_MARK, *sorted(kwargs.items()))
+
+
+def cache(func=None, *, maxsize=128, ttl=None):
+    if func is None:
+        return lambda func: cache(func, maxsize=maxsize, ttl=ttl)
+
+    entries = OrderedDict()  # key -> value (with a ttl: (value, expires_at)), oldest first
+    get = entries.get
+    move_to_end = entries.move_to_end
+    lock = threading.Lock()
+    clock = time.monotonic
+    lock_free = LOCK_FREE_HITS
+    hits = misses = 0
+
+    def miss(key, args, kwargs):
+        nonlocal misses
+        value = func(*args, **kwargs)  # outside the lock: other keys keep going
+        entry = value if ttl is None else (value, clock() + ttl)
+        with lock:
+            misses += 1
+            entries[key] = entry
+            move_to_end(key)
+            if maxsize is not None and len(entries) > maxsize:
+                entries.popitem(last=False)
+        return value
+
+    # ⚡ No ttl: a hit is one lookup and one move, nothing to check the time against
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        if args in cahce_value:
-            return cahce_value[args]
-        result = func(*args, **kwargs)
-        cahce_value[args] = result
-        return result
+        nonlocal hits
+        key = make_key(args, kwargs) if kwargs else args
+        if lock_free:
+            value = get(key, MISSING)
+            if value is not MISSING:
+                try:
+                    move_to_end(key)
+                except KeyError:
+                    pass  # evicted since the get(): the value is still right
+                hits += 1
+                return value
+        else:
+            with lock:
+                value = get(key, MISSING)
+                if value is not MISSING:
+                    move_to_end(key)
+                    hits += 1
+                    return value
+        return miss(key, args, kwargs)
+
+    @wraps(func)
+    def expiring_wrapper(*args, **kwargs):
+        nonlocal hits
+        key = make_key(args, kwargs) if kwargs else args
+        if lock_free:
+            entry = get(key, MISSING)
+            if entry is not MISSING and entry[1] > clock():
+                try:
+                    move_to_end(key)
+                except KeyError:
+                    pass
+                hits += 1
+                return entry[0]
+        else:
+            with lock:
+                entry = get(key, MISSING)
+                if entry is not MISSING and entry[1] > clock():
+                    move_to_end(key)
+                    hits += 1
+                    return entry[0]
+        return miss(key, args, kwargs)
+
+    if ttl is not None:
+        wrapper = expiring_wrapper
+
+    def cache_info():
+        with lock:
+            return CacheInfo(hits, misses, maxsize, len(entries))
+
+    def cache_clear():
+        nonlocal hits, misses
+        with lock:
+            entries.clear()
+            hits = misses = 0
 
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
     return wrapper
 
 
@@ -21,6 +141,9 @@ def long_running_function(a, b):
     return a + b
 
 
-print(long_running_function(1, 2))
-print(long_running_function(1, 2))
-print(long_running_function(3, 2))
+if __name__ == "__main__":
+    print(long_running_function(1, 2))
+    print(long_running_function(1, 2))
+    print(long_running_function(3, 2))
+    print(long_running_function(1, b=2))  # a new key: kwargs are part of it
+    print(long_running_function.cache_info())
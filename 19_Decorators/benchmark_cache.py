@@ -0,0 +1,111 @@
+import functools
+import importlib.util
+import os
+import sys
+import threading
+import time as timer
+
+# ⏱ Cost of a cache HIT: 03_Solution.cache vs functools.lru_cache
+#
+#   python benchmark_cache.py
+#
+# Every call below is a hit (the keys are warmed first), so what's measured
+# is the decorator's own overhead: building the key, the lookup, the LRU
+# bookkeeping. functools.lru_cache is written in C; "lru_cache (py)" is
+# functools' own pure-Python fallback, the like-for-like comparison. The
+# first version of our cache (a plain dict, args only) is there for scale.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+spec = importlib.util.spec_from_file_location("solution_03", os.path.join(HERE, "03_Solution.py"))
+solution = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(solution)
+
+
+# functools as it is without its C accelerator (_functools)
+def pure_python_functools():
+    saved = sys.modules.get("_functools")
+    sys.modules["_functools"] = None  # makes `from _functools import ...` fail
+    try:
+        spec = importlib.util.find_spec("functools")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules["_functools"]
+        else:
+            sys.modules["_functools"] = saved
+    return module
+
+
+CALLS = 300_000
+THREADS = 8
+REPEATS = 3
+
+
+def first_version(func):
+    values = {}
+
+    def wrapper(*args, **kwargs):
+        if args in values:
+            return values[args]
+        result = func(*args, **kwargs)
+        values[args] = result
+        return result
+
+    return wrapper
+
+
+def add(a, b=0):
+    return a + b
+
+
+DECORATORS = {
+    "first version": first_version,
+    "lru_cache": functools.lru_cache(maxsize=128),
+    "lru_cache (py)": pure_python_functools().lru_cache(maxsize=128),
+    "cache": solution.cache(maxsize=128),
+    "cache ttl=60": solution.cache(maxsize=128, ttl=60),
+}
+
+CALL_SHAPES = {
+    "f(7)": lambda f, i: f(i),
+    "f(7, 3)": lambda f, i: f(i, 3),
+    "f(7, b=3)": lambda f, i: f(i, b=3),
+}
+
+
+def hits(f, call, calls):
+    for i in range(calls):
+        call(f, i & 63)
+
+
+# Best of REPEATS runs: the least disturbed by everything else on the machine
+def ns_per_hit(decorator, call, threads=1):
+    f = decorator(add)
+    for i in range(64):
+        call(f, i)  # warm: every later call is a hit
+    calls = CALLS // threads
+    best = float("inf")
+    for _ in range(REPEATS):
+        workers = [threading.Thread(target=hits, args=(f, call, calls)) for _ in range(threads)]
+        start = timer.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        best = min(best, timer.perf_counter() - start)
+    return best / (calls * threads) * 1e9
+
+
+def main():
+    columns = list(CALL_SHAPES) + [f"f(7) x{THREADS} threads"]
+    print(f"{'ns per hit':<15}" + "".join(f"{column:>20}" for column in columns))
+    for label, decorator in DECORATORS.items():
+        row = [ns_per_hit(decorator, call) for call in CALL_SHAPES.values()]
+        row.append(ns_per_hit(decorator, CALL_SHAPES["f(7)"], THREADS))
+        print(f"{label:<15}" + "".join(f"{ns:>20.0f}" for ns in row))
+    print(f"{'no cache':<15}" + "".join(f"{ns_per_hit(lambda f: f, call):>20.0f}" for call in CALL_SHAPES.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import tracemalloc
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from video_table import VideoTable
+
+# 📏 Bytes per video: list of dicts vs VideoTable
+#
+#   python benchmark_memory.py            # 1,000,000 videos
+#   python benchmark_memory.py 200000
+
+DURATIONS = ["10:00", "05:30", "2 Hours", "14 Hours", "2.5 Hours", "45:12"]
+
+
+def make_videos(count):
+    for i in range(count):
+        # A fresh name per row, like json.load produces (the durations are shared)
+        yield {"name": f"Python Tutorial Part {i}", "time": DURATIONS[i % 6]}
+
+
+def measure(build, count):
+    tracemalloc.start()
+    data = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    videos, list_bytes = measure(lambda n: list(make_videos(n)), count)
+    del videos
+    table, table_bytes = measure(lambda n: VideoTable(make_videos(n)), count)
+
+    print(f"📊 {count:,} videos")
+    print(f"   list of dicts : {list_bytes / count:7.1f} bytes/video")
+    print(f"   VideoTable    : {table_bytes / count:7.1f} bytes/video")
+    print(f"   saving        : {list_bytes / table_bytes:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
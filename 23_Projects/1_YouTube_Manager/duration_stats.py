@@ -0,0 +1,62 @@
+from video_store.durations import BUCKETS, bucket_of
+
+# 📊 Running duration totals for the in-memory catalog (see durations.py)
+
+
+class DurationStats:
+    # Updated on every add / remove, so each report is O(1).
+    # `per_value` counts videos per exact length: when the current min or
+    # max is removed, the next one is found among the DISTINCT lengths only.
+
+    def __init__(self):
+        self.count = 0
+        self.unparsed = 0
+        self.total = 0
+        self.per_value = {}
+        self.min = None
+        self.max = None
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds):
+        if seconds is None:
+            self.unparsed += 1
+            return
+        self.count += 1
+        self.total += seconds
+        self.per_value[seconds] = self.per_value.get(seconds, 0) + 1
+        self.buckets[bucket_of(seconds)] += 1
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def remove(self, seconds):
+        if seconds is None:
+            self.unparsed -= 1
+            return
+        self.count -= 1
+        self.total -= seconds
+        self.buckets[bucket_of(seconds)] -= 1
+        left = self.per_value[seconds] - 1
+        if left:
+            self.per_value[seconds] = left
+            return
+        del self.per_value[seconds]
+        if seconds == self.min:
+            self.min = min(self.per_value, default=None)
+        if seconds == self.max:
+            self.max = max(self.per_value, default=None)
+
+    def average(self):
+        return self.total / self.count if self.count else 0
+
+    def copy(self):
+        stats = DurationStats()
+        stats.count = self.count
+        stats.unparsed = self.unparsed
+        stats.total = self.total
+        stats.per_value = dict(self.per_value)
+        stats.min = self.min
+        stats.max = self.max
+        stats.buckets = list(self.buckets)
+        return stats
@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+
+from video_table import VideoTable
+
+# 🧾 Journaled storage for the YouTube Manager
+#
+#   youtube.snapshot  ->  {"seq": 42, "videos": [...]}   (last compacted state)
+#   youtube.journal   ->  one compact JSON record per mutation (append-only)
+#
+# Every add/update/delete appends ONE line instead of rewriting the whole
+# catalog. On startup the snapshot is loaded and the journal is replayed on top.
+# After `compact_every` records, a background thread writes a fresh snapshot
+# and drops the journal lines it already covers.
+
+DEFAULT_COMPACT_EVERY = 1000
+
+
+class JournalStore:
+    def __init__(self, base="youtube", compact_every=DEFAULT_COMPACT_EVERY):
+        self.snapshot_path = base + ".snapshot"
+        self.journal_path = base + ".journal"
+        self.compact_every = compact_every
+        self.videos = VideoTable()
+        self.seq = 0
+        self.pending = 0  # journal records written since last compaction
+        self.lock = threading.Lock()
+        self.journal_file = None
+        self.compactor = None
+
+    # 📂 Rebuild state = snapshot + journal replay
+    def load(self):
+        snapshot_seq = 0
+        try:
+            with open(self.snapshot_path, "r") as file:
+                snapshot = json.load(file)
+                snapshot_seq = snapshot["seq"]
+                self.videos = VideoTable(snapshot["videos"])
+        except FileNotFoundError:
+            self.videos = VideoTable()
+
+        self.seq = snapshot_seq
+        self.pending = 0
+        good_bytes = 0
+        try:
+            with open(self.journal_path, "rb") as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break  # ✂️ torn write from a crash, drop the tail
+                    good_bytes += len(line)
+                    record = json.loads(line)
+                    if record["seq"] <= snapshot_seq:
+                        continue  # already part of the snapshot
+                    self._apply(record)
+                    self.seq = record["seq"]
+                    self.pending += 1
+            os.truncate(self.journal_path, good_bytes)
+        except FileNotFoundError:
+            pass
+
+        self.journal_file = open(self.journal_path, "a")
+        return self.videos
+
+    # 🔁 Apply one journal record to the in-memory list
+    def _apply(self, record):
+        op = record["op"]
+        if op == "add":
+            self.videos.append({"name": record["name"], "time": record["time"]})
+        elif op == "update":
+            self.videos[record["index"]] = {
+                "name": record["name"],
+                "time": record["time"],
+            }
+        elif op == "delete":
+            del self.videos[record["index"]]
+        elif op == "reset":
+            self.videos.clear()
+            self.videos.extend(record["videos"])
+
+    # ✍️ Log a mutation that was already applied to `self.videos`
+    def record(self, op, index=None, video=None):
+        with self.lock:
+            self.seq += 1
+            entry = {"seq": self.seq, "op": op}
+            if index is not None:
+                entry["index"] = index
+            if video is not None:
+                entry["name"] = video["name"]
+                entry["time"] = video["time"]
+            self.journal_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self.journal_file.flush()
+            self.pending += 1
+
+            if self.pending >= self.compact_every and not self._compacting():
+                self._start_compaction()
+
+    def _compacting(self):
+        return self.compactor is not None and self.compactor.is_alive()
+
+    # 🧹 Snapshot the current state in the background
+    def _start_compaction(self):
+        # Copy the columns under the lock so the snapshot matches `seq` exactly
+        videos = self.videos.copy()
+        seq = self.seq
+        self.compactor = threading.Thread(
+            target=self._compact, args=(videos, seq), daemon=True
+        )
+        self.compactor.start()
+
+    def _compact(self, videos, seq):
+        snapshot = {"seq": seq, "videos": videos.to_list()}
+        write_json_atomic(self.snapshot_path, snapshot)
+
+        with self.lock:
+            # Keep only records newer than the snapshot
+            self.journal_file.close()
+            with open(self.journal_path, "r") as file:
+                newer = [line for line in file if json.loads(line)["seq"] > seq]
+            tmp_path = self.journal_path + ".tmp"
+            with open(tmp_path, "w") as file:
+                file.writelines(newer)
+            os.replace(tmp_path, self.journal_path)
+            self.journal_file = open(self.journal_path, "a")
+            self.pending = len(newer)
+
+    # 🧹 Compact right now (blocks until done)
+    def compact(self):
+        if self.compactor is not None:
+            self.compactor.join()
+        with self.lock:
+            videos = self.videos.copy()
+            seq = self.seq
+        self._compact(videos, seq)
+
+    # 🔒 Wait for background work and close the journal
+    def close(self):
+        if self.compactor is not None:
+            self.compactor.join()
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
+
+    # 📥 Replace everything with a plain JSON file (youtube.txt format)
+    def import_json(self, path):
+        with open(path, "r") as file:
+            videos = json.load(file)
+        with self.lock:
+            self.videos.clear()
+            self.videos.extend(videos)
+            self.seq += 1
+            entry = {"seq": self.seq, "op": "reset", "videos": videos}
+            self.journal_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self.journal_file.flush()
+        self.compact()
+
+    # 📤 Write the current state as a plain JSON file (youtube.txt format)
+    def export_json(self, path):
+        with self.lock:
+            videos = self.videos.to_list()
+        write_json_atomic(path, videos)
+
+
+# 💾 Write JSON to a temp file, then swap it in
+#    A crash leaves either the old file or the new one, never a mix.
+def write_json_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file, separators=(",", ":"))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+    # Make the rename itself durable (directories can't be fsynced on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        folder = os.open(os.path.dirname(os.path.abspath(path)), os.O_DIRECTORY)
+        try:
+            os.fsync(folder)
+        finally:
+            os.close(folder)
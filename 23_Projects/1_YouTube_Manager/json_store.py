@@ -0,0 +1,228 @@
+import atexit
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import journal_storage
+import lazy_loader
+import search_index
+import write_behind
+from video_store.render import PAGE_SIZE
+from video_table import VideoTable
+
+# 🗃 JsonVideoStore — the youtube.txt catalog behind the VideoStore interface
+#
+#   mode "json"    -> VideoTable in memory, coalesced atomic rewrites of youtube.txt
+#   mode "journal" -> one appended record per change (journal_storage.py)
+#   mode "lazy"    -> youtube.txt read on demand through an offset index (lazy_loader.py)
+#
+# Ids are the 1-based numbers the menu always showed, so deleting video 3
+# renumbers every video after it (just like the old list did).
+
+MODES = ("json", "journal", "lazy")
+
+
+class JsonVideoStore:
+    label = "JSON file"
+    id_type = int
+    renumbers = True  # ids are positions: a delete shifts the ones after it
+
+    # batch=True: no timed writes, everything is saved by one final flush
+    def __init__(
+        self,
+        mode="json",
+        path="youtube.txt",
+        batch=False,
+        compact_every=journal_storage.DEFAULT_COMPACT_EVERY,
+        window=1.0,
+        max_ops=100,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"unknown storage mode {mode!r}, pick one of {MODES}")
+        self.mode = mode
+        self.path = path
+        self.journal = None
+        self.writer = None
+        self.lock = threading.RLock()  # held while the catalog is being changed
+
+        if mode == "journal":
+            base = os.path.splitext(path)[0]
+            self.journal = journal_storage.JournalStore(base, compact_every)
+            self.videos = self.journal.load()
+            if self.journal.seq == 0 and os.path.exists(path):
+                # 📥 First journaled run (no snapshot, nothing journaled yet):
+                #    import the plain JSON catalog
+                self.journal.import_json(path)
+            return
+
+        if mode == "lazy" and os.path.exists(path):
+            self.videos = lazy_loader.LazyVideos(path)
+        else:
+            try:
+                with open(path, "r") as file:
+                    self.videos = VideoTable(json.load(file))
+            except FileNotFoundError:
+                # ⚠️ File not found? Start fresh!
+                self.videos = VideoTable()
+
+        self.writer = write_behind.WriteBehind(
+            snapshot=lambda: self.table().copy(),
+            save=lambda table: journal_storage.write_json_atomic(path, table.to_list()),
+            lock=self.lock,
+            window=None if batch else window,
+            max_ops=None if batch else max_ops,
+        )
+        atexit.register(self.writer.flush)
+
+    def table(self):
+        if isinstance(self.videos, lazy_loader.LazyVideos):
+            return self.videos.materialize()
+        return self.videos
+
+    def __len__(self):
+        return len(self.videos)
+
+    # 🧾 Apply one change and persist it (journal record, or a coalesced rewrite)
+    def _change(self, op, index=None, video=None):
+        with self.lock:
+            if op == "add":
+                self.videos.append(video)
+            elif op == "update":
+                self.videos[index] = video
+            elif op == "delete":
+                del self.videos[index]
+
+            if self.journal is not None:
+                self.journal.record(op, index, video)
+            else:
+                self.writer.mark_dirty()
+
+    def _index(self, video_id):
+        number = int(video_id)
+        return number - 1 if 1 <= number <= len(self.videos) else None
+
+    # 📜 Videos with their 1-based number as the id (only the page is read)
+    def list(self, page=None, page_size=PAGE_SIZE, after=None):
+        start = 0
+        videos = self.videos
+        if after is not None:
+            start = int(after)  # number n is at index n - 1
+        elif page is not None:
+            start = (page - 1) * page_size
+        if after is not None or page is not None:
+            videos = videos[start : start + page_size]
+        for number, video in enumerate(videos, start=start + 1):
+            yield {"id": number, "name": video["name"], "time": video["time"]}
+
+    def get(self, video_id):
+        index = self._index(video_id)
+        if index is None:
+            return None
+        return {"id": index + 1, **self.videos[index]}
+
+    def last_id(self):
+        return len(self.videos) or None
+
+    def add(self, name, time):
+        with self.lock:
+            self._change("add", video={"name": name, "time": time})
+            return len(self.videos)
+
+    def update(self, video_id, name, time):
+        with self.lock:
+            index = self._index(video_id)
+            if index is None:
+                return False
+            self._change("update", index, {"name": name, "time": time})
+            return True
+
+    def delete(self, video_id):
+        with self.lock:
+            index = self._index(video_id)
+            if index is None:
+                return False
+            self._change("delete", index)
+            return True
+
+    # 📥 Append every row, then ONE save
+    def bulk_add(self, rows):
+        with self.lock:
+            table = self.table()
+            count = len(table)
+            table.extend(rows)
+            count = len(table) - count
+        self.save_now()
+        return count
+
+    # 💾 Persist everything right now
+    def save_now(self):
+        if self.journal is not None:
+            self.journal.compact()  # the snapshot now holds everything
+        else:
+            with self.lock:
+                self.writer.pending += 1
+            self.writer.flush()
+
+    # 📦 Changes inside the block share one rewrite (journal mode logs each op)
+    @contextmanager
+    def batch(self):
+        if self.writer is None:
+            yield self
+            return
+        window, max_ops = self.writer.window, self.writer.max_ops
+        self.writer.window = self.writer.max_ops = None
+        try:
+            yield self
+        finally:
+            self.writer.window, self.writer.max_ops = window, max_ops
+            self.writer.flush()
+
+    # 🔍 Indexed for VideoTable, streaming scan for a not-yet-loaded lazy catalog
+    def search(self, query, limit=20):
+        videos = self.videos
+        if isinstance(videos, lazy_loader.LazyVideos) and videos.loaded is not None:
+            videos = videos.loaded
+        if isinstance(videos, VideoTable):
+            results = videos.search(query, limit)
+        else:
+            results = []
+            words = search_index.WORD.findall(query.lower())
+            for number, video in enumerate(videos if words else (), start=1):
+                name_words = search_index.tokenize(video["name"])
+                if all(any(w.startswith(q) for w in name_words) for q in words):
+                    results.append((number, video))
+                    if len(results) == limit:
+                        break
+        return [{"id": number, **video} for number, video in results]
+
+    # 📊 Running totals, nothing is re-parsed
+    def stats(self):
+        table = self.table()
+        stats = table.stats
+        return {
+            "count": stats.count,
+            "unparsed": stats.unparsed,
+            "total": stats.total,
+            "min": stats.min,
+            "max": stats.max,
+            "buckets": list(stats.buckets),
+            "longest": [
+                ({"id": number, **video}, seconds)
+                for number, video, seconds in table.longest(5)
+            ],
+        }
+
+    # 📤 Journal mode: write the current catalog back to youtube.txt
+    def export_json(self):
+        self.journal.export_json(self.path)
+
+    # 🔒 Flush pending writes / close the journal and the lazy index (call
+    #    before exiting)
+    def close(self):
+        if isinstance(self.videos, lazy_loader.LazyVideos):
+            self.videos.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.writer is not None:
+            self.writer.flush()
@@ -0,0 +1,171 @@
+import json
+import os
+import struct
+import codecs
+
+from video_table import VideoTable
+
+# 📚 Lazy, streaming access to a big youtube.txt
+#
+# youtube.txt is ONE JSON array, so `json.load` has to read all of it.
+# Here we scan the array once in small chunks and remember where every
+# video starts (byte offset + length) in a side file `youtube.txt.idx`.
+# After that, any video can be read with one seek + one small json.loads,
+# and the index itself is read from disk on demand too.
+
+CHUNK_SIZE = 1024 * 1024
+INDEX_MAGIC = b"YTIDX1\0\0"
+HEADER = struct.Struct("<8sQQQ")  # magic, source size, source mtime_ns, count
+ENTRY = struct.Struct("<QQ")  # byte offset, byte length
+
+decoder = json.JSONDecoder()
+
+
+# 🌊 Yield (byte_offset, byte_length, video) for every element of the array
+def iter_entries(path, chunk_size=CHUNK_SIZE):
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as file:
+        buffer = ""
+        pos = 0  # position inside `buffer`
+        byte_pos = 0  # file offset of buffer[pos]
+        eof = False
+        started = False
+
+        def more():
+            nonlocal buffer, pos, eof
+            chunk = file.read(chunk_size)
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + utf8.decode(chunk, final=eof)
+            pos = 0
+
+        while True:
+            # Skip whitespace, the opening "[" and the "," separators
+            while True:
+                if pos == len(buffer):
+                    if eof:
+                        return
+                    more()
+                    continue
+                char = buffer[pos]
+                if char == "]":
+                    return
+                if char == "[" and not started:
+                    started = True
+                elif char not in " \t\r\n,":
+                    break
+                pos += 1
+                byte_pos += 1
+
+            if not started:
+                raise ValueError(f"{path} is not a JSON array")
+
+            # Decode one element, pulling in more data if it is cut off
+            while True:
+                try:
+                    video, end = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more()
+
+            length = len(buffer[pos:end].encode("utf-8"))
+            yield byte_pos, length, video
+            byte_pos += length
+            pos = end
+
+
+# 🗂 Build youtube.txt.idx (written to a temp file, then swapped in)
+def build_index(path, index_path):
+    stat = os.stat(path)
+    tmp_path = index_path + ".tmp"
+    count = 0
+    with open(tmp_path, "wb") as index:
+        index.write(HEADER.pack(INDEX_MAGIC, 0, 0, 0))
+        for offset, length, _ in iter_entries(path):
+            index.write(ENTRY.pack(offset, length))
+            count += 1
+        index.seek(0)
+        index.write(HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, count))
+    os.replace(tmp_path, index_path)
+
+
+# ✅ Is the index still describing the current youtube.txt?
+def index_is_fresh(path, index_path):
+    try:
+        with open(index_path, "rb") as index:
+            magic, size, mtime_ns, _ = HEADER.unpack(index.read(HEADER.size))
+    except (FileNotFoundError, struct.error):
+        return False
+    stat = os.stat(path)
+    return (
+        magic == INDEX_MAGIC and size == stat.st_size and mtime_ns == stat.st_mtime_ns
+    )
+
+
+class LazyVideos:
+    # Read-only until the first change; then the catalog is loaded once
+    # into a VideoTable (see `materialize`) and everything works as before.
+
+    def __init__(self, path="youtube.txt"):
+        self.path = path
+        self.index_path = path + ".idx"
+        if not index_is_fresh(path, self.index_path):
+            build_index(path, self.index_path)
+        self.index = open(self.index_path, "rb")
+        self.data = open(path, "rb")
+        _, _, _, self.count = HEADER.unpack(self.index.read(HEADER.size))
+        self.loaded = None
+
+    def __len__(self):
+        if self.loaded is not None:
+            return len(self.loaded)
+        return self.count
+
+    # 🔎 One video = one index read + one data read
+    def __getitem__(self, i):
+        if self.loaded is not None:
+            return self.loaded[i]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("video index out of range")
+        self.index.seek(HEADER.size + i * ENTRY.size)
+        offset, length = ENTRY.unpack(self.index.read(ENTRY.size))
+        self.data.seek(offset)
+        return json.loads(self.data.read(length))
+
+    def __iter__(self):
+        if self.loaded is not None:
+            return iter(self.loaded)
+        return (video for _, _, video in iter_entries(self.path))
+
+    # 📄 Videos [start, start + size) without touching the rest
+    def page(self, start, size):
+        return self[start : start + size]
+
+    # 📦 Switch to an in-memory VideoTable (first write)
+    def materialize(self):
+        if self.loaded is None:
+            self.loaded = VideoTable(self)
+            self.close()
+        return self.loaded
+
+    def append(self, video):
+        self.materialize().append(video)
+
+    def __setitem__(self, i, video):
+        self.materialize()[i] = video
+
+    def __delitem__(self, i):
+        del self.materialize()[i]
+
+    # 🔒 Safe to call again (materialize() already closed the files)
+    def close(self):
+        if not self.index.closed:
+            self.index.close()
+        if not self.data.closed:
+            self.data.close()
@@ -0,0 +1,83 @@
+import re
+from bisect import bisect_left, insort
+
+# 🔍 In-memory inverted index over video names
+#
+#   "python"  -> {row ids that have the word "python" in their name}
+#
+# Row ids are stable (they do not shift when a video is deleted), so the
+# index only has to change for the one video that was added / updated /
+# deleted. A sorted list of all words makes prefix search a bisect:
+# "pyt" finds "python", "pytest", ... without looking at any video.
+
+WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return set(WORD.findall(text.lower()))
+
+
+class SearchIndex:
+    def __init__(self):
+        self.postings = {}  # word -> set of row ids
+        self.words = []  # every indexed word, sorted
+
+    # 🏗 Index many (row_id, name) pairs at once, sorting the words only once
+    def build(self, rows):
+        postings = self.postings
+        for row_id, name in rows:
+            for word in tokenize(name):
+                ids = postings.get(word)
+                if ids is None:
+                    ids = postings[word] = set()
+                ids.add(row_id)
+        self.words = sorted(postings)
+
+    def add(self, row_id, name):
+        for word in tokenize(name):
+            ids = self.postings.get(word)
+            if ids is None:
+                ids = self.postings[word] = set()
+                insort(self.words, word)
+            ids.add(row_id)
+
+    def remove(self, row_id, name):
+        for word in tokenize(name):
+            ids = self.postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(row_id)
+            if not ids:
+                del self.postings[word]
+                del self.words[bisect_left(self.words, word)]
+
+    def update(self, row_id, old_name, new_name):
+        self.remove(row_id, old_name)
+        self.add(row_id, new_name)
+
+    # 🔤 Row ids for every word starting with `prefix`
+    def _prefix_ids(self, prefix):
+        ids = set()
+        i = bisect_left(self.words, prefix)
+        while i < len(self.words) and self.words[i].startswith(prefix):
+            ids |= self.postings[self.words[i]]
+            i += 1
+        return ids
+
+    # 🎯 Row ids whose name has every query word (the last one as a prefix)
+    def search(self, query, limit=20):
+        words = WORD.findall(query.lower())
+        if not words:
+            return []
+
+        *exact, last = words
+        candidates = [self.postings.get(word, set()) for word in exact]
+        candidates.append(self._prefix_ids(last))
+        candidates.sort(key=len)  # intersect starting from the smallest set
+
+        result = set(candidates[0])
+        for ids in candidates[1:]:
+            result &= ids
+            if not result:
+                return []
+        return sorted(result)[:limit]
@@ -0,0 +1,220 @@
+import heapq
+from array import array
+from bisect import bisect_left
+
+from duration_stats import DurationStats
+from video_store.durations import parse_duration
+from search_index import SearchIndex
+
+# 🧱 VideoTable — a compact, column-based replacement for a list of dicts
+#
+#   names      -> one big bytearray of UTF-8 text + (start, length) per row
+#   times      -> a small pool of distinct duration strings + one code per row
+#
+# A list of {"name": ..., "time": ...} dicts costs ~270 bytes per video
+# (list slot + dict + name str). Here a row is its name bytes plus 24
+# bytes of bookkeeping (start 8 + length 4 + time code 4 + id 8), a bit
+# more with the arrays' spare room: ~52 bytes for a 26-byte name in
+# benchmark_memory.py. Durations repeat a lot ("2 Hours", "10:00"), so
+# each distinct one is stored only once.
+#
+# Each distinct duration string is parsed to integer seconds once, when it
+# enters the pool (None = not understood), and every change updates the
+# running totals in `stats`, so duration reports never re-parse strings.
+#
+# Every row also gets a stable id (ids only ever grow, so the id column is
+# sorted and an id -> position lookup is a bisect). The search index is
+# built on the first search and then kept up to date on every change.
+#
+# It behaves like the old list: 0-based indexing, len(), iteration,
+# append / update / delete, and rows come back as {"name", "time"} dicts,
+# so the menu's 1-based numbering (index - 1) keeps working unchanged.
+
+
+class VideoTable:
+    __slots__ = (
+        "blob",
+        "starts",
+        "lengths",
+        "time_codes",
+        "time_pool",
+        "time_ids",
+        "garbage",
+        "ids",
+        "next_id",
+        "index",
+        "time_seconds",
+        "stats",
+    )
+
+    def __init__(self, videos=()):
+        self.blob = bytearray()
+        self.starts = array("Q")
+        self.lengths = array("I")
+        self.time_codes = array("I")
+        self.time_pool = []  # code -> duration string
+        self.time_ids = {}  # duration string -> code
+        self.garbage = 0  # bytes in `blob` no row points to anymore
+        self.ids = array("Q")
+        self.next_id = 0
+        self.index = None  # SearchIndex, built on first search
+        self.time_seconds = []  # code -> seconds (or None)
+        self.stats = DurationStats()
+        self.extend(videos)
+
+    def __len__(self):
+        return len(self.starts)
+
+    # 🔎 Row -> {"name", "time"} dict (slices give a list of dicts)
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("video index out of range")
+        return self._row(i)
+
+    def _name(self, i):
+        start = self.starts[i]
+        return self.blob[start : start + self.lengths[i]].decode("utf-8")
+
+    def _row(self, i):
+        return {"name": self._name(i), "time": self.time_pool[self.time_codes[i]]}
+
+    # ⏱ Parsed duration of row i (None if the text was not understood)
+    def seconds(self, i):
+        return self.time_seconds[self.time_codes[i]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def _time_code(self, time):
+        code = self.time_ids.get(time)
+        if code is None:
+            code = len(self.time_pool)
+            self.time_pool.append(time)
+            self.time_ids[time] = code
+            self.time_seconds.append(parse_duration(time))
+        return code
+
+    def _store_name(self, name):
+        data = name.encode("utf-8")
+        start = len(self.blob)
+        self.blob += data
+        return start, len(data)
+
+    # ➕ Add one video at the end
+    def append(self, video):
+        start, length = self._store_name(video["name"])
+        self.starts.append(start)
+        self.lengths.append(length)
+        code = self._time_code(video["time"])
+        self.time_codes.append(code)
+        self.stats.add(self.time_seconds[code])
+        self.ids.append(self.next_id)
+        if self.index is not None:
+            self.index.add(self.next_id, video["name"])
+        self.next_id += 1
+
+    def extend(self, videos):
+        for video in videos:
+            self.append(video)
+
+    # ✏️ Replace a video (the new name goes at the end of the blob)
+    def __setitem__(self, i, video):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("video index out of range")
+        if self.index is not None:
+            self.index.update(self.ids[i], self._name(i), video["name"])
+        self.garbage += self.lengths[i]
+        self.starts[i], self.lengths[i] = self._store_name(video["name"])
+        self.stats.remove(self.seconds(i))
+        self.time_codes[i] = self._time_code(video["time"])
+        self.stats.add(self.seconds(i))
+        self._maybe_vacuum()
+
+    # 🗑 Remove a video (later rows shift down, like list)
+    def __delitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("video index out of range")
+        if self.index is not None:
+            self.index.remove(self.ids[i], self._name(i))
+        self.stats.remove(self.seconds(i))
+        self.garbage += self.lengths[i]
+        del self.starts[i]
+        del self.lengths[i]
+        del self.time_codes[i]
+        del self.ids[i]
+        self._maybe_vacuum()
+
+    def clear(self):
+        self.__init__()
+
+    # 🧹 Rewrite the blob once more than half of it is dead text
+    def _maybe_vacuum(self):
+        if self.garbage > 4096 and self.garbage * 2 > len(self.blob):
+            blob = bytearray()
+            for i in range(len(self)):
+                start = self.starts[i]
+                self.starts[i] = len(blob)
+                blob += self.blob[start : start + self.lengths[i]]
+            self.blob = blob
+            self.garbage = 0
+
+    # 📋 Cheap column copy (used for snapshots)
+    def copy(self):
+        table = VideoTable()
+        table.blob = bytearray(self.blob)
+        table.starts = array("Q", self.starts)
+        table.lengths = array("I", self.lengths)
+        table.time_codes = array("I", self.time_codes)
+        table.time_pool = list(self.time_pool)
+        table.time_ids = dict(self.time_ids)
+        table.garbage = self.garbage
+        table.ids = array("Q", self.ids)
+        table.next_id = self.next_id
+        table.time_seconds = list(self.time_seconds)
+        table.stats = self.stats.copy()
+        return table
+
+    # 🏆 The n longest videos -> [(1-based number, video, seconds), ...]
+    def longest(self, n=5):
+        # Compare per distinct duration code, not per string
+        rank = [-1 if s is None else s for s in self.time_seconds]
+        codes = self.time_codes
+        top = heapq.nlargest(n, range(len(self)), key=lambda i: rank[codes[i]])
+        return [
+            (i + 1, self._row(i), self.seconds(i))
+            for i in top
+            if self.seconds(i) is not None
+        ]
+
+    # 🔍 Find videos by name words -> [(1-based number, video), ...]
+    def search(self, query, limit=20):
+        if self.index is None:
+            self.index = SearchIndex()
+            self.index.build((self.ids[i], self._name(i)) for i in range(len(self)))
+
+        results = []
+        for row_id in self.index.search(query, limit):
+            i = bisect_left(self.ids, row_id)
+            results.append((i + 1, self._row(i)))
+        return results
+
+    # 📤 Plain list of dicts (for json.dump)
+    def to_list(self):
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (VideoTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"VideoTable({len(self)} videos)"
@@ -0,0 +1,63 @@
+import threading
+
+# ⏳ Write-behind (group commit) for youtube.txt
+#
+# Before: every add / update / delete rewrote the whole file right away.
+# Now a change only marks the catalog "dirty"; ONE write then covers every
+# change made within `window` seconds (or as soon as `max_ops` pile up).
+#
+#   change, change, change ... (window) ... one atomic write
+#
+# `save(snapshot)` does the actual write (temp file + fsync + os.replace),
+# so a crash never leaves a half-written catalog. Call flush() on exit.
+#
+# `lock` must be held by whoever mutates the catalog, so the snapshot taken
+# here never sees a half-applied change.
+
+
+class WriteBehind:
+    def __init__(self, snapshot, save, lock, window=1.0, max_ops=100):
+        self.snapshot = snapshot  # () -> copy of the catalog, called under `lock`
+        self.save = save  # (copy) -> writes it to disk
+        self.lock = lock
+        self.window = window  # seconds; None = only on flush() / max_ops
+        self.max_ops = max_ops  # None = no limit
+        self.pending = 0
+        self.timer = None
+        self.taken = 0  # snapshots taken so far
+        self.written = 0  # newest snapshot already on disk
+        self.write_lock = threading.Lock()  # one write at a time
+        self.writes = 0
+
+    # ✍️ Record that one change was applied (call with `lock` held)
+    def mark_dirty(self):
+        self.pending += 1
+        if self.max_ops is not None and self.pending >= self.max_ops:
+            self.flush()
+        elif self.window is not None and self.timer is None:
+            self.timer = threading.Timer(self.window, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    # 💾 Write now if anything changed
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return False
+            data = self.snapshot()
+            self.pending = 0
+            self.taken += 1
+            number = self.taken
+
+        # `lock` is released here, so edits continue while we write.
+        # If a newer snapshot already reached the disk, this one is stale.
+        with self.write_lock:
+            if number < self.written:
+                return False
+            self.save(data)
+            self.written = number
+            self.writes += 1
+            return True
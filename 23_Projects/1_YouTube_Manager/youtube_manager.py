@@ -1,113 +1,68 @@
-import json
+import os
+import sys
 
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# 📂 Load videos data from file
-def load_data():
-    try:
-        with open("youtube.txt", "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        # ⚠️ File not found? Start fresh!
-        return []
+import journal_storage
+from json_store import MODES, JsonVideoStore
+from video_store import cli as video_cli
+from video_store.menu import run_menu
 
+# 🧾 Storage mode: "json" rewrites youtube.txt (coalesced, see write_behind.py),
+#    "journal" appends one record per change (see journal_storage.py),
+#    "lazy" reads youtube.txt on demand through an offset index (see lazy_loader.py)
+STORAGE_MODE = os.getenv("YT_STORAGE", "json")
+COMPACT_EVERY = int(
+    os.getenv("YT_COMPACT_EVERY", journal_storage.DEFAULT_COMPACT_EVERY)
+)
 
-# 💾 Save videos data to file
-def save_data_helper(videos):
-    with open("youtube.txt", "w") as file:
-        json.dump(videos, file)
+# ⏳ "json" / "lazy" modes: changes made within WRITE_WINDOW seconds (or
+#    WRITE_MAX_OPS changes) share ONE rewrite of youtube.txt (write_behind.py)
+WRITE_WINDOW = float(os.getenv("YT_WRITE_WINDOW", "1.0"))
+WRITE_MAX_OPS = int(os.getenv("YT_WRITE_MAX_OPS", "100"))
 
 
-# 📺 Show all saved videos
-def list_all_videos(videos):
-    print("\n")
-    print("🎬" * 20 + " Your YouTube Videos " + "🎬" * 20)
+# 📂 Open youtube.txt (batch=True: saved by one final flush)
+def open_store(mode=None, batch=False):
+    return JsonVideoStore(
+        mode or STORAGE_MODE,
+        "youtube.txt",
+        batch=batch,
+        compact_every=COMPACT_EVERY,
+        window=WRITE_WINDOW,
+        max_ops=WRITE_MAX_OPS,
+    )
 
-    if not videos:
-        print("😢 No videos found. Add some first!")
-    else:
-        for index, video in enumerate(videos, start=1):
-            print(f"🔹 {index}. {video['name']} ⏱ Duration: {video['time']}")
 
-    print("🎬" * 60)
+def plain_line(row):
+    return f"🔹 {row['id']}. {row['name']} ⏱ Duration: {row['time']}"
 
 
-# ➕ Add a new video
-def add_video(videos):
-    print("\n➕ Add New Video")
-    name = input("📌 Enter video name: ")
-    time = input("⏱ Enter video duration: ")
-
-    videos.append({"name": name, "time": time})
-
-    save_data_helper(videos)
-    print("✅ Video added successfully!")
-
-
-# ✏️ Update existing video
-def update_video(videos):
-    print("\n✏️ Update Video")
-    list_all_videos(videos)
-
-    index = int(input("👉 Enter the video number to update: "))
-
-    if 1 <= index <= len(videos):
-        name = input("📝 Update video name: ")
-        time = input("⏱ Update video duration: ")
-
-        videos[index - 1] = {"name": name, "time": time}
-
-        save_data_helper(videos)
-        print("✅ Video updated successfully!")
-    else:
-        print("❌ Invalid video number!")
+# 🚀 Main application loop (the shared menu, see video_store/menu.py)
+def main():
+    store = open_store()
+    extras = []
+    if store.journal is not None:
 
+        def export():
+            store.export_json()
+            print("📤 Exported catalog to youtube.txt")
 
-# 🗑 Delete a video
-def delete_video(videos):
-    print("\n🗑 Delete Video")
-    list_all_videos(videos)
+        extras.append(("Export to youtube.txt 📤", export))
+    run_menu(store, "YouTube Manager", plain_line, extras)
 
-    index = int(input("👉 Enter the video number to delete: "))
 
-    if 1 <= index <= len(videos):
-        del videos[index - 1]
-        save_data_helper(videos)
-        print("✅ Video deleted successfully!")
-    else:
-        print("❌ Invalid video number!")
+# 🤖 Non-interactive mode (see video_store/cli.py); ids are the 1-based numbers
+def cli(argv):
+    parser = video_cli.build_parser("youtube_manager.py")
+    parser.add_argument("--storage", choices=MODES)
+    args = parser.parse_args(argv)
+    return video_cli.run(open_store(args.storage, batch=True), args, plain_line)
 
 
-# 🚀 Main application loop
-def main():
-    videos = load_data()
-
-    while True:
-        print("\n")
-        print("🎥" * 15 + " YouTube Manager " + "🎥" * 15)
-        print("1️⃣  List all videos")
-        print("2️⃣  Add a video")
-        print("3️⃣  Update a video")
-        print("4️⃣  Delete a video")
-        print("5️⃣  Exit 🚪")
-
-        choice = input("👉 Enter your choice (1-5): ")
-
-        match choice:
-            case "1":
-                list_all_videos(videos)
-            case "2":
-                add_video(videos)
-            case "3":
-                update_video(videos)
-            case "4":
-                delete_video(videos)
-            case "5":
-                print("👋 Exiting YouTube Manager. Bye bye!")
-                break
-            case _:
-                print("⚠️ Invalid choice! Please enter 1 to 5.")
-
-
-# 🏁 Program entry point
+# 🏁 Program entry point (no arguments = interactive menu)
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
     main()
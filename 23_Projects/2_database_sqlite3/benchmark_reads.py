@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import tempfile
+import time as timer
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_store import SqliteVideoStore
+
+# 📜 Deep pages and full scans: OFFSET / fetchall vs keyset / fetchmany,
+#    then point reads from 1-8 threads (one connection each)
+#
+#   python benchmark_reads.py             # 1,000,000 videos
+#   python benchmark_reads.py 200000
+
+PAGE_SIZE = 50
+OFFSET_SQL = "SELECT id, name, time FROM videos ORDER BY id LIMIT ? OFFSET ?"
+
+
+def ms(start):
+    return (timer.perf_counter() - start) * 1e3
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        store = SqliteVideoStore(os.path.join(folder, "bench.db"))
+        store.bulk_add({"name": f"Video {i}", "time": "10:00"} for i in range(count))
+
+        print(f"{'page at':>10} {'OFFSET ms':>10} {'keyset ms':>10}")
+        for depth in (0, 0.1, 0.5, 0.9, 0.999):
+            skip = int(count * depth)
+            start = timer.perf_counter()
+            store.conn.execute(OFFSET_SQL, (PAGE_SIZE, skip)).fetchall()
+            offset_ms = ms(start)
+            start = timer.perf_counter()
+            list(store.scan(after=skip, limit=PAGE_SIZE))  # ids are 1..count here
+            print(f"{skip:>10,} {offset_ms:>10.3f} {ms(start):>10.3f}")
+
+        for label, read in (
+            ("fetchall()", lambda: len(store.conn.execute(OFFSET_SQL, (-1, 0)).fetchall())),
+            ("keyset scan()", lambda: sum(1 for _ in store.scan())),
+        ):
+            tracemalloc.start()
+            start = timer.perf_counter()
+            rows = read()
+            elapsed = ms(start)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"full {label:<14} {rows:>10,} rows {elapsed:>9.0f} ms  peak {peak / 2**20:8.1f} MiB")
+
+        # 🧵 Parallel point reads: one connection per worker thread (WAL)
+        ids = [random.randint(1, count) for _ in range(20_000)]
+        for workers in (1, 2, 4, 8):
+            start = timer.perf_counter()
+            with ThreadPoolExecutor(workers) as pool:
+                found = sum(video is not None for video in pool.map(store.get, ids))
+            rate = found / (timer.perf_counter() - start)
+            print(f"get() x {len(ids):,} with {workers} threads {rate:>12,.0f} reads/sec")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
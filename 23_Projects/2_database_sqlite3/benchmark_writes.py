@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import time as timer
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_store import SqliteVideoStore
+
+# ✍️ SQLite writes/sec: one commit per op vs batched commits
+#
+#   python benchmark_writes.py            # 2,000 inserts per profile
+#   python benchmark_writes.py 10000
+#
+# "rollback journal, FULL, per-op" is how the manager used to run: every
+# INSERT was followed by conn.commit(), i.e. at least one fsync per video.
+
+PROFILES = [
+    # (label, journal_mode, synchronous, ops per commit)
+    ("rollback journal, FULL, per-op", "delete", "full", 1),
+    ("WAL, FULL, per-op", "wal", "full", 1),
+    ("WAL, NORMAL, per-op", "wal", "normal", 1),
+    ("WAL, NORMAL, batch of 100", "wal", "normal", 100),
+    ("WAL, NORMAL, batch of 10000", "wal", "normal", 10_000),
+]
+
+
+def run(count, journal_mode, synchronous, batch_size, folder):
+    path = os.path.join(folder, f"bench_{journal_mode}_{synchronous}_{batch_size}.db")
+    store = SqliteVideoStore(path, journal_mode, synchronous)
+    start = timer.perf_counter()
+    for first in range(0, count, batch_size):
+        with store.batch():
+            for i in range(first, min(first + batch_size, count)):
+                store.add(f"Video {i}", "10:00")
+    elapsed = timer.perf_counter() - start
+    store.close()
+    return count / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    with tempfile.TemporaryDirectory() as folder:
+        baseline = None
+        for label, journal_mode, synchronous, batch_size in PROFILES:
+            rate = run(count, journal_mode, synchronous, batch_size, folder)
+            baseline = baseline or rate
+            print(f"{label:<32} {rate:>12,.0f} writes/sec  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import sqlite3
+import threading
+
+# 🔌 Lazy, per-thread SQLite connections
+#
+# Nothing is opened when the manager is created (so importing a module that
+# builds one costs nothing). The first get() in a thread opens that thread's
+# own connection; the very first one in the process also runs `setup(conn)`
+# (schema creation), exactly once, while other threads wait for it.
+#
+#   connections = ConnectionManager("youtube_manager.db", setup=create_schema)
+#   conn = connections.get()      # this thread's connection
+#   connections.close_all()       # on exit
+#
+# One connection per thread is what makes WAL useful: readers in different
+# threads run in parallel with each other and with the single writer.
+# `busy_timeout` makes a second writer wait for the lock instead of failing.
+# Needs a database file: every ":memory:" connection is its own database.
+
+
+class ConnectionManager:
+    def __init__(
+        self,
+        path,
+        setup=None,
+        pragmas=(),
+        statement_cache=128,
+        busy_timeout=5.0,
+        isolation_level="",
+    ):
+        self.path = path
+        self.setup = setup
+        self.pragmas = list(pragmas)  # run on every new connection
+        self.statement_cache = statement_cache
+        self.busy_timeout = busy_timeout
+        self.isolation_level = isolation_level  # None = autocommit
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.ready = False  # setup() has run
+        self.connections = []  # every open connection, for close_all()
+
+    def _connect(self):
+        # check_same_thread=False only so close_all() may close it from the
+        # main thread; each connection is still used by its own thread only
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            cached_statements=self.statement_cache,
+            check_same_thread=False,
+            isolation_level=self.isolation_level,
+        )
+        for pragma in self.pragmas:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    # 🧵 This thread's connection (opened on first use)
+    def get(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = self._connect()
+        with self.lock:
+            if not self.ready:
+                if self.setup is not None:
+                    self.setup(conn)
+                self.ready = True
+            self.connections.append(conn)
+        self.local.conn = conn
+        return conn
+
+    @property
+    def opened(self):
+        return getattr(self.local, "conn", None) is not None
+
+    # 🔒 Close this thread's connection (the next get() opens a new one)
+    def close(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            return
+        self.local.conn = None
+        with self.lock:
+            self.connections.remove(conn)
+        conn.close()
+
+    # 🔒 Close every thread's connection (call once the workers are done)
+    def close_all(self):
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+        self.local = threading.local()
@@ -0,0 +1,306 @@
+import os
+import sys
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from video_store.durations import BUCKETS, parse_duration
+
+# 🧬 Versioned schema migrations for youtube_manager.db
+#
+# The database remembers how far it got in `PRAGMA user_version`; migrate()
+# runs every newer step in order, each in its own short BEGIN IMMEDIATE
+# transaction that also bumps the version. A crash mid-step rolls that step
+# back, and under WAL readers keep going while a step runs (online).
+#
+# Databases made before versioning start at user_version 0 with part of the
+# schema already there, so every step checks before it creates.
+#
+#   python migrations.py [youtube_manager.db]   # migrate + EXPLAIN QUERY PLAN check
+#
+# ➕ New step = new function appended to MIGRATIONS. Never edit or reorder
+#    steps that already shipped.
+
+NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%SZ', 'now')"
+
+# 📊 Bucket number of a `seconds` value, in SQL (see durations.BUCKETS)
+BUCKET_SQL = (
+    "CASE "
+    + " ".join(
+        f"WHEN {{s}} < {limit} THEN {i}" for i, (limit, _) in enumerate(BUCKETS[:-1])
+    )
+    + f" ELSE {len(BUCKETS) - 1} END"
+)
+
+
+def stats_delta(row, sign):
+    bucket = BUCKET_SQL.format(s=f"{row}.seconds")
+    return f"""
+    UPDATE video_stats SET
+        count = count {sign} ({row}.seconds IS NOT NULL),
+        unparsed = unparsed {sign} ({row}.seconds IS NULL),
+        total = total {sign} COALESCE({row}.seconds, 0);
+    UPDATE duration_buckets SET count = count {sign} 1
+        WHERE {row}.seconds IS NOT NULL AND bucket = {bucket};"""
+
+
+def columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def exists(conn, name):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+
+
+# 1️⃣ The original table
+def create_videos(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS videos (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            time TEXT NOT NULL
+        )
+    """)
+
+
+# 2️⃣ Integer duration: parsed seconds (NULL = not understood), indexed for sorting
+def add_seconds(conn):
+    if "seconds" not in columns(conn, "videos"):
+        conn.execute("ALTER TABLE videos ADD COLUMN seconds INTEGER")
+        rows = conn.execute("SELECT id, time FROM videos").fetchall()
+        conn.executemany(
+            "UPDATE videos SET seconds = ? WHERE id = ?",
+            [(parse_duration(time), video_id) for video_id, time in rows],
+        )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_seconds ON videos (seconds)")
+
+
+# 3️⃣ Running duration totals kept up to date by triggers -> reports are O(1)
+def add_duration_stats(conn):
+    if exists(conn, "video_stats"):
+        return
+    conn.execute("""
+        CREATE TABLE video_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            count INTEGER NOT NULL,
+            unparsed INTEGER NOT NULL,
+            total INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS duration_buckets (
+            bucket INTEGER PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS video_stats_insert AFTER INSERT ON videos BEGIN
+            {stats_delta("new", "+")}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS video_stats_delete AFTER DELETE ON videos BEGIN
+            {stats_delta("old", "-")}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS video_stats_update AFTER UPDATE OF seconds ON videos BEGIN
+            {stats_delta("old", "-")}
+            {stats_delta("new", "+")}
+        END
+    """)
+    # 📚 Count the videos that are already there
+    conn.execute("""
+        INSERT INTO video_stats (id, count, unparsed, total)
+        SELECT 1, COUNT(seconds), COUNT(*) - COUNT(seconds), COALESCE(SUM(seconds), 0)
+        FROM videos
+    """)
+    conn.executemany(
+        "INSERT OR IGNORE INTO duration_buckets (bucket, count) VALUES (?, 0)",
+        [(i,) for i in range(len(BUCKETS))],
+    )
+    bucket = BUCKET_SQL.format(s="seconds")
+    conn.execute(f"""
+        UPDATE duration_buckets SET count = (
+            SELECT COUNT(*) FROM videos
+            WHERE seconds IS NOT NULL AND {bucket} = duration_buckets.bucket
+        )
+    """)
+
+
+# 4️⃣ Full-text index on video names, kept in sync by triggers
+def add_name_fts(conn):
+    if exists(conn, "videos_fts"):
+        return
+    conn.execute("""
+        CREATE VIRTUAL TABLE videos_fts USING fts5(
+            name, content='videos', content_rowid='id', prefix='2 3'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS videos_fts_insert AFTER INSERT ON videos BEGIN
+            INSERT INTO videos_fts (rowid, name) VALUES (new.id, new.name);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS videos_fts_delete AFTER DELETE ON videos BEGIN
+            INSERT INTO videos_fts (videos_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS videos_fts_update AFTER UPDATE OF name ON videos BEGIN
+            INSERT INTO videos_fts (videos_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            INSERT INTO videos_fts (rowid, name) VALUES (new.id, new.name);
+        END
+    """)
+    # 📚 Index the videos that are already there
+    conn.execute("INSERT INTO videos_fts (videos_fts) VALUES ('rebuild')")
+
+
+# 5️⃣ Exact name lookups ignoring case ("python basics" = "Python Basics")
+def add_name_index(conn):
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_videos_name ON videos (name COLLATE NOCASE)"
+    )
+
+
+# 6️⃣ When each video was added / last changed (UTC, ISO 8601).
+#    ALTER TABLE can't add a column whose default is "now", so the write
+#    statements fill them in; videos from before this step get the migration time.
+def add_timestamps(conn):
+    existing = columns(conn, "videos")
+    for column in ("created_at", "updated_at"):
+        if column not in existing:
+            conn.execute(f"ALTER TABLE videos ADD COLUMN {column} TEXT")
+    conn.execute(f"""
+        UPDATE videos SET
+            created_at = COALESCE(created_at, {NOW_SQL}),
+            updated_at = COALESCE(updated_at, {NOW_SQL})
+    """)
+
+
+# 7️⃣ Change log for incremental sync (video_store/sync.py): one row per
+#    insert / update / delete, written by triggers. Readers keep the last
+#    `seq` they saw and read on from there; AUTOINCREMENT means a seq is
+#    never handed out twice, even after old rows are pruned.
+def add_change_log(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS video_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            video_id INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS video_changes_insert AFTER INSERT ON videos BEGIN
+            INSERT INTO video_changes (video_id) VALUES (new.id);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS video_changes_update AFTER UPDATE OF name, time ON videos BEGIN
+            INSERT INTO video_changes (video_id) VALUES (new.id);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS video_changes_delete AFTER DELETE ON videos BEGIN
+            INSERT INTO video_changes (video_id) VALUES (old.id);
+        END
+    """)
+
+
+MIGRATIONS = [
+    create_videos,
+    add_seconds,
+    add_duration_stats,
+    add_name_fts,
+    add_name_index,
+    add_timestamps,
+    add_change_log,
+]
+LATEST = len(MIGRATIONS)
+
+
+def version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+# 🚚 Bring the schema up to LATEST -> list of step names applied
+#    (expects an autocommit connection: isolation_level=None)
+def migrate(conn, migrations=MIGRATIONS):
+    applied = []
+    while version(conn) < len(migrations):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = version(conn)  # another process may have just migrated
+            if current < len(migrations):
+                step = migrations[current]
+                step(conn)
+                conn.execute(f"PRAGMA user_version = {current + 1}")
+                applied.append(step.__name__)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    return applied
+
+
+# 🔬 The hot queries and the index each one must use
+HOT_QUERIES = [
+    ("get by id", "SELECT id, name, time FROM videos WHERE id = ?", "INTEGER PRIMARY KEY"),
+    (
+        "keyset page",
+        "SELECT id, name, time FROM videos WHERE id > ? ORDER BY id LIMIT ?",
+        "INTEGER PRIMARY KEY",
+    ),
+    (
+        "name lookup",
+        "SELECT id, name, time FROM videos WHERE name = ? COLLATE NOCASE",
+        "idx_videos_name",
+    ),
+    (
+        "longest first",
+        "SELECT id, name, time, seconds FROM videos WHERE seconds IS NOT NULL "
+        "ORDER BY seconds DESC LIMIT 5",
+        "idx_videos_seconds",
+    ),
+    # one MIN() or MAX() per SELECT: SQLite only turns a lone one into an
+    # index probe, MIN and MAX together would scan the whole index
+    ("shortest", "SELECT MIN(seconds) FROM videos", "idx_videos_seconds"),
+    ("longest", "SELECT MAX(seconds) FROM videos", "idx_videos_seconds"),
+    (
+        "changes since",
+        "SELECT c.seq, c.video_id, v.name, v.time FROM video_changes c "
+        "LEFT JOIN videos v ON v.id = c.video_id WHERE c.seq > ? ORDER BY c.seq LIMIT ?",
+        "INTEGER PRIMARY KEY",
+    ),
+]
+
+
+# 🔬 EXPLAIN QUERY PLAN for every hot query -> [(label, plan, uses index?)]
+def check_query_plans(conn):
+    results = []
+    for label, sql, index in HOT_QUERIES:
+        params = (None,) * sql.count("?")
+        plan = " / ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+        results.append((label, plan, index in plan and "SCAN videos" not in plan))
+    return results
+
+
+def main():
+    import sqlite3
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "youtube_manager.db"
+    conn = sqlite3.connect(path, isolation_level=None)
+    before = version(conn)
+    applied = migrate(conn)
+    print(f"🧬 {path}: version {before} -> {version(conn)} {applied or '(up to date)'}")
+
+    ok = True
+    for label, plan, uses_index in check_query_plans(conn):
+        ok &= uses_index
+        print(f"{'✅' if uses_index else '❌'} {label:<20} {plan}")
+    conn.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
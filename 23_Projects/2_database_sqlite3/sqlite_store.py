@@ -0,0 +1,256 @@
+import threading
+from contextlib import contextmanager
+
+import migrations
+from connection_manager import ConnectionManager
+
+from video_store.durations import parse_duration
+from video_store.render import PAGE_SIZE
+
+# 🗄️ SqliteVideoStore — youtube_manager.db behind the VideoStore interface
+#
+# Ids are the INTEGER PRIMARY KEY. Single changes commit right away; inside
+# `with store.batch():` they all share one transaction.
+#
+# ⚡ Connection profile
+#   journal_mode=WAL      -> a commit appends to youtube_manager.db-wal instead
+#                            of rewriting pages + a rollback journal, and
+#                            readers no longer block the writer
+#   synchronous=NORMAL    -> in WAL mode, fsync only at checkpoints: a power
+#                            cut may lose the last commits, never corrupts
+#                            (FULL = fsync every commit, OFF = never)
+#   cached_statements     -> every SQL text below is a constant, so sqlite3's
+#                            statement cache compiles each one once and then
+#                            only re-binds parameters
+
+JOURNAL_MODES = ("wal", "delete", "truncate", "persist", "memory", "off")
+SYNCHRONOUS = ("off", "normal", "full", "extra")
+STATEMENT_CACHE = 256
+
+# 🗄️ Schema: migrations.py (versioned with PRAGMA user_version, applied on
+#    the first connection). Hot queries and the indexes they use are listed
+#    in migrations.HOT_QUERIES; `python migrations.py` checks the plans.
+NOW = migrations.NOW_SQL
+INSERT_SQL = (
+    "INSERT INTO videos (name, time, seconds, created_at, updated_at) "
+    f"VALUES (?, ?, ?, {NOW}, {NOW})"
+)
+UPDATE_SQL = (
+    f"UPDATE videos SET name = ?, time = ?, seconds = ?, updated_at = {NOW} WHERE id = ?"
+)
+DELETE_SQL = "DELETE FROM videos WHERE id = ?"
+GET_SQL = "SELECT id, name, time FROM videos WHERE id = ?"
+NAME_SQL = "SELECT id, name, time FROM videos WHERE name = ? COLLATE NOCASE ORDER BY id"
+
+# 📜 Keyset pagination: jump straight to `id > last seen id` through the
+#    primary key, instead of OFFSET (which walks and throws away every
+#    skipped row, so deep pages get slower and slower)
+KEYSET_SQL = "SELECT id, name, time FROM videos WHERE id > ? ORDER BY id LIMIT ?"
+SCAN_CHUNK = 1000  # rows per keyset query / fetchmany() while streaming
+
+# 🔄 Change log (migration 7): which videos changed after a given seq, with
+#    their current name / time (NULL once deleted)
+CHANGES_SQL = (
+    "SELECT c.seq, c.video_id, v.name, v.time FROM video_changes c "
+    "LEFT JOIN videos v ON v.id = c.video_id WHERE c.seq > ? ORDER BY c.seq LIMIT ?"
+)
+
+
+class SqliteVideoStore:
+    label = "SQLite"
+    id_type = int
+
+    def __init__(
+        self,
+        path="youtube_manager.db",
+        journal_mode="wal",
+        synchronous="normal",
+        statement_cache=STATEMENT_CACHE,
+    ):
+        if journal_mode.lower() not in JOURNAL_MODES:
+            raise ValueError(f"unknown journal_mode {journal_mode!r}, pick one of {JOURNAL_MODES}")
+        if synchronous.lower() not in SYNCHRONOUS:
+            raise ValueError(f"unknown synchronous {synchronous!r}, pick one of {SYNCHRONOUS}")
+        self.journal_mode = journal_mode
+        # 🔌 Nothing is opened here: each thread connects on first use and
+        #    the schema is created once, by whichever thread comes first
+        self.connections = ConnectionManager(
+            path,
+            setup=self._setup,
+            pragmas=[f"synchronous = {synchronous}"],
+            statement_cache=statement_cache,
+            isolation_level=None,
+        )
+        self.state = threading.local()  # per-thread batch() depth
+
+    def _setup(self, conn):
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")  # stored in the file
+        migrations.migrate(conn)
+
+    # We open transactions ourselves (BEGIN IMMEDIATE in batch()), so
+    # outside a batch every write commits on its own (autocommit)
+    @property
+    def conn(self):
+        return self.connections.get()
+
+    @property
+    def batching(self):
+        return getattr(self.state, "batching", 0)
+
+    # 📜 Stream rows in keyset chunks: at most `chunk_size` rows in memory,
+    #    and every chunk costs the same however deep into the table it is
+    def scan(self, after=0, limit=None, chunk_size=SCAN_CHUNK):
+        left = limit
+        while left is None or left > 0:
+            size = chunk_size if left is None else min(chunk_size, left)
+            cursor = self.conn.execute(KEYSET_SQL, (after, size))
+            count = 0
+            while rows := cursor.fetchmany(size):
+                for video_id, name, time in rows:
+                    yield {"id": video_id, "name": name, "time": time}
+                count += len(rows)
+                after = rows[-1][0]
+            if count < size:
+                return
+            if left is not None:
+                left -= count
+
+    # 🔢 Page number -> the id just before that page. OFFSET here only walks
+    #    the integer primary key (no row is read), then the page is a keyset query
+    def _page_start(self, page, page_size):
+        if page <= 1:
+            return 0
+        row = self.conn.execute(
+            "SELECT id FROM videos ORDER BY id LIMIT 1 OFFSET ?",
+            ((page - 1) * page_size - 1,),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def list(self, page=None, page_size=PAGE_SIZE, after=None):
+        if after is not None:
+            return self.scan(int(after), page_size)
+        if page is None:
+            return self.scan()
+        start = self._page_start(page, page_size)
+        return iter(()) if start is None else self.scan(start, page_size)
+
+    def get(self, video_id):
+        row = self.conn.execute(GET_SQL, (int(video_id),)).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "name": row[1], "time": row[2]}
+
+    def last_id(self):
+        return self.conn.execute("SELECT MAX(id) FROM videos").fetchone()[0]
+
+    # 🔄 Up to `limit` changes after seq `after` -> [(seq, id, video or None if deleted)]
+    def changes(self, after=0, limit=SCAN_CHUNK):
+        changes = []
+        for seq, video_id, name, time in self.conn.execute(CHANGES_SQL, (after, limit)):
+            video = None if name is None else {"id": video_id, "name": name, "time": time}
+            changes.append((seq, video_id, video))
+        return changes
+
+    # 🔄 Newest seq in the change log (0 = nothing logged yet)
+    def change_seq(self):
+        row = self.conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'video_changes'")
+        return (row.fetchone() or (0,))[0]
+
+    # ✂️ Forget changes up to `seq` (only once every reader is past it)
+    def prune_changes(self, seq):
+        return self.conn.execute("DELETE FROM video_changes WHERE seq <= ?", (seq,)).rowcount
+
+    # 🔎 Exact name, any letter case (walks idx_videos_name)
+    def find_by_name(self, name):
+        rows = self.conn.execute(NAME_SQL, (name,))
+        return [{"id": row[0], "name": row[1], "time": row[2]} for row in rows]
+
+    # Each write commits alone, or with the rest of the open batch()
+    def add(self, name, time):
+        cursor = self.conn.execute(INSERT_SQL, (name, time, parse_duration(time)))
+        return cursor.lastrowid
+
+    def update(self, video_id, name, time):
+        params = (name, time, parse_duration(time), int(video_id))
+        return self.conn.execute(UPDATE_SQL, params).rowcount > 0
+
+    def delete(self, video_id):
+        return self.conn.execute(DELETE_SQL, (int(video_id),)).rowcount > 0
+
+    # 📥 executemany inside ONE transaction
+    def bulk_add(self, rows):
+        with self.batch():
+            result = self.conn.executemany(
+                INSERT_SQL,
+                ((r["name"], r["time"], parse_duration(r["time"])) for r in rows),
+            )
+        return result.rowcount
+
+    # 📦 Everything inside the block commits together (rolls back on error)
+    #    BEGIN IMMEDIATE takes the write lock up front, so a batch never
+    #    fails half-way with "database is locked" when another writer shows up
+    @contextmanager
+    def batch(self):
+        if self.batching:
+            yield self  # nested: joins the outer transaction
+            return
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        self.state.batching = 1
+        try:
+            yield self
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self.state.batching = 0
+
+    # 🔍 Every word must match; each one is also a prefix ("pyt" finds "python")
+    def search(self, query, limit=20):
+        words = query.replace('"', " ").split()
+        if not words:
+            return []
+        match = " ".join(f'"{word}"*' for word in words)
+        rows = self.conn.execute(
+            """
+            SELECT videos.id, videos.name, videos.time
+            FROM videos_fts JOIN videos ON videos.id = videos_fts.rowid
+            WHERE videos_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (match, limit),
+        )
+        return [{"id": row[0], "name": row[1], "time": row[2]} for row in rows]
+
+    # 📊 Reads the running totals, never re-parses `time`
+    def stats(self):
+        count, unparsed, total = self.conn.execute(
+            "SELECT count, unparsed, total FROM video_stats"
+        ).fetchone()
+        shortest, longest = self.conn.execute(
+            "SELECT (SELECT MIN(seconds) FROM videos), (SELECT MAX(seconds) FROM videos)"
+        ).fetchone()
+        buckets = self.conn.execute("SELECT count FROM duration_buckets ORDER BY bucket")
+        top = self.conn.execute(
+            "SELECT id, name, time, seconds FROM videos WHERE seconds IS NOT NULL "
+            "ORDER BY seconds DESC LIMIT 5"
+        )
+        return {
+            "count": count,
+            "unparsed": unparsed,
+            "total": total,
+            "min": shortest,
+            "max": longest,
+            "buckets": [bucket_count for (bucket_count,) in buckets],
+            "longest": [
+                ({"id": video_id, "name": name, "time": time}, seconds)
+                for video_id, name, time, seconds in top
+            ],
+        }
+
+    # 🔒 Close every thread's database connection
+    def close(self):
+        self.connections.close_all()
@@ -1,95 +1,47 @@
-import sqlite3
+import os
+import sys
 
-# 📦 Database connection
-conn = sqlite3.connect("youtube_manager.db")
-cursor = conn.cursor()
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# 🗄️ Create table if it doesn't exist
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS videos (
-    id INTEGER PRIMARY KEY,
-    name TEXT NOT NULL,
-    time TEXT NOT NULL
-)
-""")
+from sqlite_store import SqliteVideoStore
+from video_store import cli as video_cli
+from video_store.cache import CachedStore
+from video_store.menu import run_menu
 
+# ⚡ Connection profile (see sqlite_store.py): WAL + synchronous=NORMAL by default
+JOURNAL_MODE = os.getenv("YT_SQLITE_JOURNAL", "wal")
+SYNCHRONOUS = os.getenv("YT_SQLITE_SYNC", "normal")
 
-# 📋 List all videos
-def list_videos():
-    print("\n📺 Your YouTube Videos:")
-    print("-" * 30)
-    cursor.execute("SELECT * FROM videos")
-    for row in cursor.fetchall():
-        print(f"ID: {row[0]} | 🎬 Name: {row[1]} | ⏱️ Time: {row[2]}")
-    print("-" * 30)
+# 🧠 Read-through cache for lookups and list pages (video_store/cache.py);
+#    YT_CACHE_SIZE=0 turns it off, YT_CACHE_TTL=0 keeps entries until evicted
+CACHE_SIZE = int(os.getenv("YT_CACHE_SIZE", "1024"))
+CACHE_TTL = float(os.getenv("YT_CACHE_TTL", "30")) or None
 
+# 📦 Database store: nothing is opened at import. Each thread connects on
+#    first use; tables, indexes and triggers are created once (sqlite_store.py)
+store = SqliteVideoStore("youtube_manager.db", JOURNAL_MODE, SYNCHRONOUS)
+if CACHE_SIZE:
+    store = CachedStore(store, CACHE_SIZE, CACHE_TTL, id_key=lambda v: str(int(v)))
 
-# ➕ Add a new video
-def add_video(name, time):
-    cursor.execute("INSERT INTO videos (name, time) VALUES (?, ?)", (name, time))
-    conn.commit()
-    print("✅ Video added successfully!")
 
+def plain_line(row):
+    return f"ID: {row['id']} | 🎬 Name: {row['name']} | ⏱️ Time: {row['time']}"
 
-# ✏️ Update an existing video
-def update_video(video_id, name, time):
-    cursor.execute(
-        "UPDATE videos SET name = ?, time = ? WHERE id = ?", (name, time, video_id)
-    )
-    conn.commit()
-    print("🔄 Video updated successfully!")
 
-
-# ❌ Delete a video
-def delete_video(video_id):
-    cursor.execute("DELETE FROM videos WHERE id = ?", (video_id,))
-    conn.commit()
-    print("🗑️ Video deleted successfully!")
-
-
-# 🚀 Main application loop
+# 🚀 Main application loop (the shared menu, see video_store/menu.py)
 def main():
-    while True:
-        print("\n🎥 YouTube Manager App (SQLite Powered)")
-        print("====================================")
-        print("1️⃣  List Videos")
-        print("2️⃣  Add Video")
-        print("3️⃣  Update Video")
-        print("4️⃣  Delete Video")
-        print("5️⃣  Exit")
-        print("====================================")
-
-        choice = input("👉 Enter your choice: ")
-
-        if choice == "1":
-            list_videos()
-
-        elif choice == "2":
-            name = input("🎬 Enter video name: ")
-            time = input("⏱️ Enter video time: ")
-            add_video(name, time)
-
-        elif choice == "3":
-            video_id = input("🆔 Enter video ID to update: ")
-            name = input("✏️ Enter new video name: ")
-            time = input("⏱️ Enter new video time: ")
-            update_video(video_id, name, time)
-
-        elif choice == "4":
-            video_id = input("🗑️ Enter video ID to delete: ")
-            delete_video(video_id)
-
-        elif choice == "5":
-            print("👋 Exiting the application. Bye bye!")
-            break
+    run_menu(store, "YouTube Manager App (SQLite Powered)", plain_line)
 
-        else:
-            print("❌ Invalid choice. Please try again!")
 
-    # 🔒 Close database connection
-    conn.close()
+# 🤖 Non-interactive mode: every operation in ONE transaction (video_store/cli.py)
+def cli(argv):
+    args = video_cli.build_parser("youtube_manager_db.py").parse_args(argv)
+    return video_cli.run(store, args, plain_line)
 
 
-# 🏁 Entry point
+# 🏁 Entry point (no arguments = interactive menu)
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
     main()
@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time as timer
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mongo_standin import StandinDatabase
+from mongo_store import MongoVideoStore
+
+from video_store.aio import AsyncVideoStore
+
+# ⚡ Load test: list / add / update / delete from N coroutines at once
+#
+#   python benchmark_async.py                          # stand-in, 1 ms per round trip
+#   python benchmark_async.py --concurrency 1,50,500 --workers 100
+#   python benchmark_async.py --mongo-uri mongodb://localhost:27017
+#
+# Each level runs -n ops (40% list a page, 20% each add / update / delete)
+# spread over that many coroutines, through AsyncVideoStore. With 1
+# coroutine that is the synchronous manager's one-call-at-a-time speed;
+# throughput should then grow with concurrency until the worker threads
+# (or the server) are all busy.
+
+MIX = ["list"] * 4 + ["add"] * 2 + ["update"] * 2 + ["delete"] * 2
+
+
+async def one_op(videos, kind, ids, rng):
+    if kind == "list":
+        await videos.list(after=rng.choice(ids), page_size=20)
+    elif kind == "add":
+        ids.append(await videos.add("New video", f"{rng.randint(1, 90)}:00"))
+    elif kind == "update":
+        await videos.update(rng.choice(ids), "Edited", f"{rng.randint(1, 90)}:00")
+    elif len(ids) > 1:
+        await videos.delete(ids.pop(rng.randrange(len(ids))))
+
+
+async def level(videos, ids, ops, concurrency, seed):
+    rng = random.Random(seed)
+    kinds = [rng.choice(MIX) for _ in range(ops)]
+    latencies = []
+
+    async def worker():
+        while kinds:
+            kind = kinds.pop()
+            start = timer.perf_counter()
+            await one_op(videos, kind, ids, rng)
+            latencies.append(timer.perf_counter() - start)
+
+    start = timer.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = timer.perf_counter() - start
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3
+    print(f"{concurrency:>11} {ops:>7,} {ops / elapsed:>10,.0f} {p50:>9.2f} {p99:>9.2f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000, help="ops per concurrency level")
+    parser.add_argument("--concurrency", default="1,10,50,100,200,500")
+    parser.add_argument("--workers", type=int, default=100, help="worker threads")
+    parser.add_argument("--rtt", type=float, default=1.0, help="ms per stand-in call")
+    parser.add_argument("--videos", type=int, default=5000, help="videos to start with")
+    parser.add_argument("--mongo-uri", help="real MongoDB instead of the stand-in")
+    args = parser.parse_args()
+
+    if args.mongo_uri:
+        from pymongo import MongoClient
+
+        client = MongoClient(args.mongo_uri, maxPoolSize=args.workers)
+        client.drop_database("bench_async")
+        db = client["bench_async"]
+    else:
+        db = StandinDatabase(latency=args.rtt / 1e3)
+    store = MongoVideoStore(db)
+    store.ensure_indexes()
+    store.bulk_add({"name": f"Video {i}", "time": "10:00"} for i in range(args.videos))
+
+    async with AsyncVideoStore(store, args.workers) as videos:
+        ids = [row["id"] for row in await videos.list()]
+        print(f"{'concurrency':>11} {'ops':>7} {'ops/sec':>10} {'p50 ms':>9} {'p99 ms':>9}")
+        for seed, concurrency in enumerate(map(int, args.concurrency.split(","))):
+            await level(videos, ids, args.n, concurrency, seed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+import argparse
+import os
+import random
+import sys
+import time as timer
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mongo_bulk import BulkWriter
+from mongo_standin import StandinDatabase
+from mongo_store import MongoVideoStore
+
+# 📬 One write per call vs BulkWriter, on a mass edit
+#
+#   python benchmark_bulk.py                       # stand-in, 0.5 ms per round trip
+#   python benchmark_bulk.py --rtt 0               # client-side cost only
+#   python benchmark_bulk.py --mongo-uri mongodb://localhost:27017
+#
+# The stand-in answers in-process, so --rtt adds a sleep to each call to
+# stand for the network (StandinDatabase(latency=...)). Each run adds -n
+# videos, updates half of them, deletes a quarter, then checks the running
+# totals still add up.
+
+
+def edit(target, count, rng):
+    ids = [target.add(f"Video {i}", f"{rng.randint(1, 90)}:00") for i in range(count)]
+    for video_id in rng.sample(ids, count // 2):
+        target.update(video_id, "Edited", f"{rng.randint(1, 90)}:00")
+    for video_id in rng.sample(ids, count // 4):
+        target.delete(video_id)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000, help="videos to add")
+    parser.add_argument("--rtt", type=float, default=0.5, help="ms per stand-in call")
+    parser.add_argument("--max-ops", type=int, default=1000)
+    parser.add_argument("--mongo-uri", help="real MongoDB instead of the stand-in")
+    args = parser.parse_args()
+
+    print(f"{'writes':<12} {'ops':>7} {'seconds':>8} {'ops/sec':>10} {'round trips':>12}")
+    for label in ("one by one", "BulkWriter"):
+        if args.mongo_uri:
+            from pymongo import MongoClient
+
+            client = MongoClient(args.mongo_uri)
+            client.drop_database("bench_bulk")
+            db = client["bench_bulk"]
+        else:
+            db = StandinDatabase(latency=args.rtt / 1e3)
+        store = MongoVideoStore(db)
+        store.ensure_indexes()
+        before = getattr(db, "round_trips", 0)
+
+        writer = BulkWriter(store, args.max_ops, window=None)
+        start = timer.perf_counter()
+        edit(store if label == "one by one" else writer, args.n, random.Random(7))
+        failed = sum(not result["ok"] for result in writer.flush())
+        elapsed = timer.perf_counter() - start
+
+        ops = args.n + args.n // 2 + args.n // 4
+        trips = getattr(db, "round_trips", 0) - before
+        print(f"{label:<12} {ops:>7,} {elapsed:>8.2f} {ops / elapsed:>10,.0f} {trips or '-':>12}")
+
+        stats, left = store.stats(), args.n - args.n // 4
+        if stats["count"] + stats["unparsed"] != left or failed:
+            print(f"❌ totals say {stats['count']} videos, expected {left} ({failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import threading
+
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from mongo_store import object_id, stats_delta
+from video_store.durations import parse_duration
+
+# 📬 Bulk writer: many adds / updates / deletes, few round trips
+#
+# MongoVideoStore.add / update / delete each cost two round trips (the
+# write, then the $inc on the running totals). For mass edits BulkWriter
+# queues them instead and sends the whole queue as ONE bulk_write, as soon
+# as `max_ops` pile up or `window` seconds after the first one (like
+# write_behind.py does for youtube.txt). Call flush() at the end.
+#
+#   writer = BulkWriter(store, on_flush=print_results)
+#   writer.add("Python Basics", "2 Hours")   # -> new id, right away
+#   writer.update(video_id, "Git", "1:30:00")
+#   writer.delete(other_id)
+#   writer.flush()                           # -> [{"op", "ok", "id"/"error"}]
+#
+# Flushes the writer starts on its own (max_ops, window, a second op on a
+# queued video) hand their results to `on_flush`; without one they are kept
+# and returned by the next flush() / close(), so no result is ever lost.
+#
+# One flush = 3 round trips, whatever its size:
+#   1. find {_id: {$in: ...}}   old `seconds` of every video to update /
+#                               delete (missing ids are reported, not sent)
+#   2. bulk_write(ordered=False)
+#   3. one $inc on the totals, for the ops that went through
+#
+# 🔀 Unordered is only safe while no two queued ops touch the same video,
+#    so an op on a video that is already queued flushes the queue first.
+#
+# ⚠️ Another client deleting a video between steps 1 and 2 skews the
+#    totals, just as it would between MongoVideoStore's write and its $inc.
+
+
+class BulkWriter:
+    def __init__(self, store, max_ops=1000, window=0.5, on_flush=None):
+        self.store = store
+        self.max_ops = max_ops  # None = no limit
+        self.window = window  # seconds; None = only on flush() / max_ops
+        self.on_flush = on_flush  # (results) -> None, after every flush
+        self.pending = []  # results of automatic flushes, when on_flush is None
+        self.lock = threading.RLock()  # held from queueing through sending
+        self.queue = []  # (kind, _id, fields)
+        self.keys = set()  # _ids in the queue
+        self.timer = None
+        self.flushes = self.sent = self.failed = 0
+
+    # ➕ The id is made here (ObjectIds are client-side), before the insert
+    def add(self, name, time):
+        _id = ObjectId()
+        self._queue("add", _id, {"name": name, "time": time})
+        return str(_id)
+
+    def update(self, video_id, name, time):
+        self._queue("update", object_id(video_id) or video_id, {"name": name, "time": time})
+
+    def delete(self, video_id):
+        self._queue("delete", object_id(video_id) or video_id, None)
+
+    def _queue(self, kind, _id, fields):
+        with self.lock:
+            if _id in self.keys:
+                self._flush()  # keep the two ops on this video in order
+            self.queue.append((kind, _id, fields))
+            self.keys.add(_id)
+            if self.max_ops is not None and len(self.queue) >= self.max_ops:
+                self._flush()
+            elif self.window is not None and self.timer is None:
+                self.timer = threading.Timer(self.window, self._flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    # 🚚 Send everything queued -> one result dict per op, in queue order,
+    #    after those of automatic flushes nobody has been given yet
+    def flush(self):
+        with self.lock:
+            results = self._flush()
+            if self.on_flush is None:
+                results, self.pending = self.pending, []
+            return results
+
+    def _flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            queue, self.queue, self.keys = self.queue, [], set()
+            if not queue:
+                return []
+            results = self._send(queue)
+            self.flushes += 1
+            self.failed += sum(not result["ok"] for result in results)
+            if self.on_flush is not None:
+                self.on_flush(results)
+            else:
+                self.pending.extend(results)
+            return results
+
+    def _send(self, queue):
+        store = self.store
+        targets = [_id for kind, _id, _ in queue if kind != "add" and isinstance(_id, ObjectId)]
+        old = {}
+        if targets:
+            found = store.videos.find({"_id": {"$in": targets}}, {"seconds": 1})
+            old = {doc["_id"]: doc.get("seconds") for doc in found}
+
+        results, requests, sent, deltas = [], [], [], []
+        for kind, _id, fields in queue:
+            result = {"op": kind, "ok": True, "id": str(_id)}
+            results.append(result)
+            if kind != "add" and _id not in old:
+                result.update(ok=False, error=f"no video with id {_id}")
+                continue
+            if kind == "delete":
+                requests.append(DeleteOne({"_id": _id}))
+                deltas.append(stats_delta(old[_id], -1))
+            else:
+                seconds = parse_duration(fields["time"])
+                doc = {**fields, "seconds": seconds}
+                if kind == "add":
+                    requests.append(InsertOne({"_id": _id, **doc}))
+                    deltas.append(stats_delta(seconds, +1))
+                else:
+                    requests.append(UpdateOne({"_id": _id}, {"$set": doc}))
+                    deltas.append(stats_delta(seconds, +1, stats_delta(old[_id], -1)))
+            sent.append(result)
+        if not requests:
+            return results
+
+        # ❌ writeErrors point at the requests that failed, by position
+        try:
+            store.videos.bulk_write(requests, ordered=False)
+        except BulkWriteError as error:
+            for failure in error.details.get("writeErrors", []):
+                index = failure["index"]
+                sent[index].update(ok=False, error=failure.get("errmsg", "write failed"))
+                deltas[index] = {}
+        self.sent += len(requests)
+
+        inc = {}
+        for delta in deltas:
+            for key, value in delta.items():
+                inc[key] = inc.get(key, 0) + value
+        store.apply_stats({key: value for key, value in inc.items() if value})
+        return results
+
+    def close(self):
+        return self.flush()
@@ -0,0 +1,101 @@
+import os
+import threading
+
+# 🌐 One MongoClient per process, made on first use
+#
+#   from mongo_client import get_database
+#   db = get_database()          # .env is read and the client built here, once
+#
+# Importing this module reads nothing and connects to nothing, so scripts
+# that never talk to MongoDB (or run without MONGO_URI) don't pay for it.
+#
+# 🏊 Pool settings come from the environment (or .env):
+#   MONGO_URI                       required, read on first use
+#   YT_MONGO_DB                     database name (PyYouTube)
+#   YT_MONGO_MAX_POOL               maxPoolSize: connections per server (100)
+#   YT_MONGO_MIN_POOL               minPoolSize: kept open even when idle (0)
+#   YT_MONGO_MAX_IDLE_MS            maxIdleTimeMS: close idle connections after
+#   YT_MONGO_CONNECT_TIMEOUT_MS     connectTimeoutMS (5000)
+#   YT_MONGO_SELECT_TIMEOUT_MS      serverSelectionTimeoutMS (10000)
+#   YT_MONGO_SOCKET_TIMEOUT_MS      socketTimeoutMS (none: wait for the server)
+#   YT_MONGO_WAIT_QUEUE_TIMEOUT_MS  waitQueueTimeoutMS: max wait for a free connection
+#   YT_MONGO_COMPRESSORS            wire compression to offer (zlib; zstd and
+#                                   snappy need the zstandard / python-snappy packages)
+#
+# 🍴 Forking: a child must never use the parent's sockets. os.register_at_fork
+#    drops the client in every child, which then builds its own on first use
+#    (multiprocessing workers, gunicorn --preload, ...). The pid check in
+#    get_client() covers children started some other way.
+
+DATABASE = "PyYouTube"
+
+client = None
+client_pid = None
+lock = threading.Lock()
+
+
+def env_int(name, default=None):
+    value = os.getenv(name)
+    return default if value in (None, "") else int(value)
+
+
+# 🏊 MongoClient keyword arguments from the environment (None = pymongo's default)
+def pool_settings():
+    settings = {
+        "maxPoolSize": env_int("YT_MONGO_MAX_POOL", 100),
+        "minPoolSize": env_int("YT_MONGO_MIN_POOL", 0),
+        "maxIdleTimeMS": env_int("YT_MONGO_MAX_IDLE_MS"),
+        "connectTimeoutMS": env_int("YT_MONGO_CONNECT_TIMEOUT_MS", 5000),
+        "serverSelectionTimeoutMS": env_int("YT_MONGO_SELECT_TIMEOUT_MS", 10000),
+        "socketTimeoutMS": env_int("YT_MONGO_SOCKET_TIMEOUT_MS"),
+        "waitQueueTimeoutMS": env_int("YT_MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+        "compressors": os.getenv("YT_MONGO_COMPRESSORS", "zlib") or None,
+    }
+    return {key: value for key, value in settings.items() if value is not None}
+
+
+def get_client():
+    global client, client_pid
+    if client is not None and client_pid == os.getpid():
+        return client
+    with lock:
+        if client is None or client_pid != os.getpid():
+            from dotenv import load_dotenv
+            from pymongo import MongoClient
+
+            load_dotenv()
+            uri = os.getenv("MONGO_URI")
+            if not uri:
+                raise RuntimeError("MONGO_URI is not set (put it in .env or the environment)")
+            client = MongoClient(
+                uri,
+                tlsAllowInvalidCertificates=True,  # ⚠️ Not recommended for production
+                **pool_settings(),
+            )
+            client_pid = os.getpid()
+    return client
+
+
+def get_database(name=None):
+    return get_client()[name or os.getenv("YT_MONGO_DB", DATABASE)]
+
+
+# 🏁 Close the pool (at exit, or to pick up new settings on next use)
+def close():
+    global client
+    with lock:
+        if client is not None and client_pid == os.getpid():
+            client.close()
+        client = None
+
+
+# 🍴 In a fresh child: forget the parent's client without closing it (its
+#    sockets still belong to the parent) and start over with a new lock
+def reset_after_fork():
+    global client, lock
+    client = None
+    lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_after_fork)
@@ -0,0 +1,377 @@
+import re
+import threading
+import time as timer
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from types import SimpleNamespace
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+# 🧪 In-process MongoDB stand-in (no server, no network)
+#
+# Just enough of the pymongo Collection API for MongoVideoStore: insert,
+# find with projection / sort / skip / limit, find_one_and_update / _delete,
+# update_one with $set / $inc (+ upsert), bulk_write, and a $text search that
+# matches whole words. Documents live in a dict in insertion (= _id) order.
+#
+#   db = StandinDatabase()
+#   store = MongoVideoStore(db)
+#   db = StandinDatabase(latency=0.0005)   # + 0.5 ms "network" per call
+#
+# Numbers measured against it leave out the network and the server's own
+# work, so they only compare the client-side code paths.
+
+WORD = re.compile(r"\w+")
+MISSING = object()
+
+
+def get_field(doc, key):
+    for part in key.split("."):
+        if isinstance(doc, list):
+            doc = doc[int(part)] if part.isdigit() and int(part) < len(doc) else None
+        elif isinstance(doc, dict):
+            doc = doc.get(part)
+        else:
+            return None
+    return doc
+
+
+def set_field(doc, key, value):
+    *parents, last = key.split(".")
+    for part in parents:
+        doc = doc[int(part)] if isinstance(doc, list) else doc.setdefault(part, {})
+    if isinstance(doc, list):
+        doc[int(last)] = value
+    else:
+        doc[last] = value
+
+
+def matches_value(value, cond, present, fold=None):
+    if not (isinstance(cond, dict) and cond and all(k.startswith("$") for k in cond)):
+        return value == cond if fold is None else fold(value) == fold(cond)
+    for op, arg in cond.items():
+        if op == "$exists":
+            ok = present == bool(arg)
+        elif op == "$ne":
+            ok = value != arg
+        elif op == "$in":
+            ok = value in arg
+        elif op in ("$gt", "$gte", "$lt", "$lte"):
+            if value is None:
+                return False
+            ok = {
+                "$gt": value > arg,
+                "$gte": value >= arg,
+                "$lt": value < arg,
+                "$lte": value <= arg,
+            }[op]
+        else:
+            raise NotImplementedError(f"stand-in does not support {op}")
+        if not ok:
+            return False
+    return True
+
+
+def text_score(doc, query):
+    words = set(WORD.findall(doc.get("name", "").lower()))
+    return sum(word in words for word in WORD.findall(query.lower()))
+
+
+# 🔡 collation strength 1-2 = equality ignores letter case
+def case_fold(value):
+    return value.casefold() if isinstance(value, str) else value
+
+
+def matches(doc, filter, fold=None):
+    for key, cond in (filter or {}).items():
+        if key == "$text":
+            if not text_score(doc, cond["$search"]):
+                return False
+            continue
+        present = get_field(doc, key) is not None or key in doc
+        if not matches_value(get_field(doc, key), cond, present, fold):
+            return False
+    return True
+
+
+def project(doc, projection, score=None):
+    if not projection:
+        return dict(doc)
+    include = [k for k, v in projection.items() if v and k != "_id"]
+    if include:
+        out = {k: doc[k] for k in include if k in doc}
+        if projection.get("_id", 1):
+            out["_id"] = doc["_id"]
+    else:
+        out = {k: v for k, v in doc.items() if projection.get(k, 1)}
+    for k, v in projection.items():
+        if isinstance(v, dict) and v.get("$meta") == "textScore":
+            out[k] = score
+    return out
+
+
+def apply_update(doc, update):
+    for op, fields in update.items():
+        for key, value in fields.items():
+            if op == "$set":
+                set_field(doc, key, value)
+            elif op == "$inc":
+                set_field(doc, key, (get_field(doc, key) or 0) + value)
+            else:
+                raise NotImplementedError(f"stand-in does not support {op}")
+
+
+def sort_key(value):
+    # MongoDB orders null / missing before numbers and strings
+    return (0, 0) if value is None else (1, value)
+
+
+class StandinCursor:
+    def __init__(self, collection, filter, projection):
+        self.collection = collection
+        self.filter = filter
+        self.projection = projection
+        self.sorts = []
+        self.skipped = 0
+        self.limited = 0
+        self.fold = None
+
+    def sort(self, key, direction=1):
+        self.sorts = list(key) if isinstance(key, list) else [(key, direction)]
+        return self
+
+    def skip(self, n):
+        self.skipped = n
+        return self
+
+    def limit(self, n):
+        self.limited = n
+        return self
+
+    def batch_size(self, n):
+        return self
+
+    def collation(self, collation):
+        self.fold = case_fold if collation.get("strength", 3) <= 2 else None
+        return self
+
+    def __iter__(self):
+        query = (self.filter or {}).get("$text", {}).get("$search")
+        end = self.skipped + self.limited if self.limited else None
+        collection = self.collection
+        with collection.lock:
+            found = (
+                (doc, text_score(doc, query) if query else None)
+                for doc in collection.candidates(self.filter)
+                if matches(doc, self.filter, self.fold)
+            )
+            # 🏃 Sorted on _id and the docs are already in _id order (the
+            #    _id index): stop as soon as skip + limit docs matched
+            if self.sorts == [("_id", 1)] and collection.in_id_order:
+                docs = list(islice(found, self.skipped, end))
+            else:
+                docs = self.sorted(list(found))[self.skipped : end]
+        for doc, score in docs:
+            yield project(doc, self.projection, score)
+
+    def sorted(self, docs):
+        for key, direction in reversed(self.sorts):
+            if isinstance(direction, dict):  # {"$meta": "textScore"}
+                docs.sort(key=lambda pair: pair[1], reverse=True)
+            else:
+                docs.sort(
+                    key=lambda pair: sort_key(get_field(pair[0], key)),
+                    reverse=direction == -1,
+                )
+        return docs
+
+
+class StandinCollection:
+    def __init__(self):
+        self.docs = {}
+        self.indexes = []
+        self.lock = threading.RLock()
+        self.in_id_order = True  # every insert so far had a bigger _id
+        self.ids = None  # sorted list of self.docs' keys, rebuilt on demand
+
+    def create_index(self, keys, **options):
+        self.indexes.append((keys, options))
+        return options.get("name", str(keys))
+
+    def insert_one(self, doc):
+        with self.lock:
+            doc.setdefault("_id", ObjectId())
+            if doc["_id"] in self.docs:
+                raise KeyError(f"duplicate key {doc['_id']}")
+            if self.docs and self.in_id_order:
+                last = next(reversed(self.docs))
+                try:
+                    self.in_id_order = doc["_id"] > last
+                except TypeError:
+                    self.in_id_order = False
+            self.docs[doc["_id"]] = dict(doc)
+            self.ids = None
+        return SimpleNamespace(inserted_id=doc["_id"], acknowledged=True)
+
+    def insert_many(self, docs, ordered=True):
+        ids = [self.insert_one(doc).inserted_id for doc in docs]
+        return SimpleNamespace(inserted_ids=ids, acknowledged=True)
+
+    def find(self, filter=None, projection=None):
+        return StandinCursor(self, filter, projection)
+
+    def find_one(self, filter=None, projection=None, sort=None):
+        cursor = self.find(filter, projection)
+        if sort:
+            cursor.sort(sort)
+        return next(iter(cursor.limit(1)), None)
+
+    def count_documents(self, filter):
+        with self.lock:
+            return sum(matches(doc, filter) for doc in self.docs.values())
+
+    # What the _id index would narrow a filter down to: exact _id / $in ->
+    # dict lookups, _id $gt / $gte -> a bisect (docs in _id order only),
+    # anything else -> every doc
+    def candidates(self, filter):
+        _id = (filter or {}).get("_id", MISSING)
+        if _id is MISSING:
+            return self.docs.values()
+        if not isinstance(_id, dict):
+            ids = [_id]
+        elif set(_id) == {"$in"}:
+            ids = _id["$in"]
+        elif len(_id) == 1 and set(_id) <= {"$gt", "$gte"} and self.in_id_order:
+            if self.ids is None:
+                self.ids = list(self.docs)
+            (op, start), = _id.items()
+            try:
+                first = (bisect_right if op == "$gt" else bisect_left)(self.ids, start)
+            except TypeError:
+                return self.docs.values()
+            return (self.docs[i] for i in self.ids[first:])
+        else:
+            return self.docs.values()
+        return [self.docs[i] for i in dict.fromkeys(ids) if i in self.docs]
+
+    def _first(self, filter):
+        return next((d for d in self.candidates(filter) if matches(d, filter)), None)
+
+    def update_one(self, filter, update, upsert=False):
+        with self.lock:
+            doc = self._first(filter)
+            if doc is None:
+                if not upsert:
+                    return SimpleNamespace(matched_count=0, modified_count=0)
+                doc = {k: v for k, v in filter.items() if not k.startswith("$")}
+                self.insert_one(doc)
+                doc = self.docs[doc["_id"]]
+            apply_update(doc, update)
+            return SimpleNamespace(matched_count=1, modified_count=1)
+
+    def find_one_and_update(
+        self, filter, update, projection=None, return_document=False, upsert=False
+    ):
+        with self.lock:
+            doc = self._first(filter)
+            if doc is None:
+                return None
+            before = project(doc, projection)
+            apply_update(doc, update)
+            return project(doc, projection) if return_document else before
+
+    def find_one_and_delete(self, filter, projection=None):
+        with self.lock:
+            doc = self._first(filter)
+            if doc is None:
+                return None
+            del self.docs[doc["_id"]]
+            self.ids = None
+            return project(doc, projection)
+
+    def delete_one(self, filter):
+        return SimpleNamespace(deleted_count=int(self.find_one_and_delete(filter) is not None))
+
+    # pymongo's InsertOne / UpdateOne / DeleteOne keep their arguments in
+    # `_doc` / `_filter` / `_upsert`. Failed requests end up in a
+    # BulkWriteError's writeErrors, by index; ordered=True stops at the first.
+    def bulk_write(self, requests, ordered=True):
+        counts = {"inserted": 0, "matched": 0, "modified": 0, "deleted": 0, "upserted": 0}
+        errors = []
+        for index, request in enumerate(requests):
+            kind = type(request).__name__
+            try:
+                if kind == "InsertOne":
+                    self.insert_one(dict(request._doc))
+                    counts["inserted"] += 1
+                elif kind == "UpdateOne":
+                    result = self.update_one(request._filter, request._doc, request._upsert)
+                    counts["matched"] += result.matched_count
+                    counts["modified"] += result.modified_count
+                elif kind == "DeleteOne":
+                    counts["deleted"] += self.delete_one(request._filter).deleted_count
+                else:
+                    raise NotImplementedError(f"stand-in does not support {kind}")
+            except KeyError as error:
+                errors.append({"index": index, "code": 11000, "errmsg": error.args[0]})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError(
+                {
+                    "writeErrors": errors,
+                    "writeConcernErrors": [],
+                    "nInserted": counts["inserted"],
+                    "nMatched": counts["matched"],
+                    "nModified": counts["modified"],
+                    "nRemoved": counts["deleted"],
+                    "nUpserted": counts["upserted"],
+                    "upserted": [],
+                }
+            )
+        return SimpleNamespace(
+            acknowledged=True, **{f"{k}_count": v for k, v in counts.items()}
+        )
+
+
+# 🐢 The network, faked: every collection call first sleeps `latency`
+#    seconds, outside the collection lock, so callers on other threads
+#    overlap their waits the way they would on a real server
+class SlowCollection:
+    def __init__(self, collection, database):
+        self.collection = collection
+        self.database = database
+
+    def __getattr__(self, name):
+        attr = getattr(self.collection, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.database.round_trip()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class StandinDatabase:
+    def __init__(self, latency=0.0):
+        self.collections = {}
+        self.latency = latency  # seconds per call
+        self.round_trips = 0
+        self.lock = threading.Lock()
+
+    def __getitem__(self, name):
+        with self.lock:
+            if name not in self.collections:
+                collection = StandinCollection()
+                self.collections[name] = (
+                    SlowCollection(collection, self) if self.latency else collection
+                )
+            return self.collections[name]
+
+    def round_trip(self):
+        with self.lock:
+            self.round_trips += 1
+        timer.sleep(self.latency)
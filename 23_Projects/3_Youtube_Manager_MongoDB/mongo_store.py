@@ -0,0 +1,243 @@
+from contextlib import contextmanager
+from itertools import islice
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+
+from video_store.durations import BUCKETS, bucket_of, parse_duration
+from video_store.render import PAGE_SIZE
+
+# 🍃 MongoVideoStore — a MongoDB database behind the VideoStore interface
+#
+# Ids are ObjectId strings. `db` is anything that hands out collections by
+# name: a real pymongo Database, or the in-process stand-in from
+# mongo_standin.py (used by the benchmark when no server is around).
+
+# 📦 Documents per insert_many round trip
+BULK_BATCH_SIZE = 10_000
+
+# 📜 Listing: only the fields a row shows, LIST_BATCH documents per round
+#    trip (the server's default is 101 in the first reply), walked in _id
+#    order so a page can start right after the last _id seen (range
+#    pagination on the _id index, no skip over whole documents)
+LIST_PROJECTION = {"_id": 1, "name": 1, "time": 1}
+LIST_BATCH = 1000
+
+# 🔎 Exact name lookups ignoring case use this collation, and so does the
+#    index that serves them (a query only uses an index of the same collation)
+NAME_COLLATION = {"locale": "en", "strength": 2}
+
+# 📊 RUNNING DURATION TOTALS (ONE DOCUMENT, UPDATED WITH $inc)
+#    Every video stores `seconds` (parsed once, None if not understood)
+#    next to its `time` string, and every write bumps these counters,
+#    so reports never scan or re-parse the collection.
+STATS_ID = "durations"
+
+
+def stats_delta(seconds, sign, inc=None):
+    inc = {} if inc is None else inc
+    if seconds is None:
+        inc["unparsed"] = inc.get("unparsed", 0) + sign
+        return inc
+    bucket = f"buckets.{bucket_of(seconds)}"
+    inc["count"] = inc.get("count", 0) + sign
+    inc["total"] = inc.get("total", 0) + sign * seconds
+    inc[bucket] = inc.get(bucket, 0) + sign
+    return inc
+
+
+# 🆔 "65f0..." -> ObjectId (None for anything that can't be one)
+def object_id(video_id):
+    try:
+        return ObjectId(video_id)
+    except (InvalidId, TypeError):
+        return None
+
+
+def as_video(doc):
+    return {"id": str(doc["_id"]), "name": doc["name"], "time": doc["time"]}
+
+
+class MongoVideoStore:
+    label = "MongoDB"
+    id_type = str
+
+    def __init__(self, db, batch_size=LIST_BATCH):
+        self.videos = db["videos"]
+        self.stats_collection = db["video_stats"]
+        self.batch_size = batch_size
+
+    # 🗂️ MAKE SURE THE INDEXES EXIST (no-op if they already do)
+    def ensure_indexes(self):
+        self.videos.create_index([("name", "text")], name="name_text")
+        self.videos.create_index("name", name="name_ci", collation=NAME_COLLATION)
+        self.videos.create_index("seconds")
+        self.ensure_stats()
+
+    def apply_stats(self, inc):
+        if inc:
+            self.stats_collection.update_one({"_id": STATS_ID}, {"$inc": inc})
+
+    # 📚 FIRST RUN: PARSE OLD VIDEOS AND COUNT THEM ONCE
+    def ensure_stats(self):
+        if self.stats_collection.find_one({"_id": STATS_ID}, {"_id": 1}):
+            return
+
+        missing = self.videos.find({"seconds": {"$exists": False}}, {"time": 1})
+        updates = []
+        for video in missing:
+            seconds = parse_duration(video["time"])
+            updates.append(UpdateOne({"_id": video["_id"]}, {"$set": {"seconds": seconds}}))
+        if updates:
+            self.videos.bulk_write(updates, ordered=False)
+
+        inc = {}
+        for video in self.videos.find({}, {"_id": 0, "seconds": 1}):
+            stats_delta(video.get("seconds"), +1, inc)
+        self.stats_collection.insert_one(
+            {
+                "_id": STATS_ID,
+                "count": 0,
+                "unparsed": 0,
+                "total": 0,
+                "buckets": [0] * len(BUCKETS),
+            }
+        )
+        self.apply_stats(inc)
+
+    # 📜 STREAM VIDEOS AS DICTS STRAIGHT FROM THE CURSOR, _id > `after`
+    def scan(self, after=None, limit=None):
+        query = {} if after is None else {"_id": {"$gt": after}}
+        cursor = (
+            self.videos.find(query, LIST_PROJECTION)
+            .sort("_id", 1)
+            .batch_size(self.batch_size if limit is None else min(self.batch_size, limit))
+        )
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        for doc in cursor:
+            yield as_video(doc)
+
+    # 🔢 Page number -> the _id just before that page. Only this lookup
+    #    skips, and it returns nothing but _ids (the _id index covers it)
+    def _page_start(self, page, page_size):
+        cursor = self.videos.find({}, {"_id": 1}).sort("_id", 1)
+        doc = next(iter(cursor.skip((page - 1) * page_size - 1).limit(1)), None)
+        return None if doc is None else doc["_id"]
+
+    def list(self, page=None, page_size=PAGE_SIZE, after=None):
+        if after is not None:
+            start = object_id(after)
+            if start is None:
+                raise ValueError(f"not a video id: {after}")
+            return self.scan(start, page_size)
+        if page is None:
+            return self.scan()
+        if page <= 1:
+            return self.scan(limit=page_size)
+        start = self._page_start(page, page_size)
+        return iter(()) if start is None else self.scan(start, page_size)
+
+    def get(self, video_id):
+        doc = self.videos.find_one({"_id": object_id(video_id)}, LIST_PROJECTION)
+        return None if doc is None else as_video(doc)
+
+    def last_id(self):
+        doc = self.videos.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        return None if doc is None else str(doc["_id"])
+
+    # 🔎 Exact name, any letter case (walks the name_ci index)
+    def find_by_name(self, name):
+        cursor = (
+            self.videos.find({"name": name}, LIST_PROJECTION)
+            .collation(NAME_COLLATION)
+            .sort("_id", 1)
+        )
+        return [as_video(doc) for doc in cursor]
+
+    def add(self, name, time):
+        seconds = parse_duration(time)
+        result = self.videos.insert_one({"name": name, "time": time, "seconds": seconds})
+        self.apply_stats(stats_delta(seconds, +1))
+        return str(result.inserted_id)
+
+    def update(self, video_id, name, time):
+        seconds = parse_duration(time)
+        old = self.videos.find_one_and_update(
+            {"_id": object_id(video_id)},
+            {"$set": {"name": name, "time": time, "seconds": seconds}},
+            projection={"seconds": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if old is not None:
+            inc = stats_delta(old.get("seconds"), -1)
+            self.apply_stats(stats_delta(seconds, +1, inc))
+        return old is not None
+
+    def delete(self, video_id):
+        old = self.videos.find_one_and_delete(
+            {"_id": object_id(video_id)}, projection={"seconds": 1}
+        )
+        if old is not None:
+            self.apply_stats(stats_delta(old.get("seconds"), -1))
+        return old is not None
+
+    # 📥 insert_many IN BATCHES
+    def bulk_add(self, rows, batch_size=BULK_BATCH_SIZE, ordered=False):
+        # ordered=False lets the server apply a batch in parallel and keep going
+        # past a bad document; ordered=True stops at the first error.
+        count = 0
+        docs = (
+            {"name": r["name"], "time": r["time"], "seconds": parse_duration(r["time"])}
+            for r in rows
+        )
+        while batch := list(islice(docs, batch_size)):
+            result = self.videos.insert_many(batch, ordered=ordered)
+            count += len(result.inserted_ids)
+            inc = {}
+            for video in batch:
+                stats_delta(video["seconds"], +1, inc)
+            self.apply_stats(inc)
+        return count
+
+    # 📦 A standalone MongoDB has no multi-document transactions: ops apply one by one
+    @contextmanager
+    def batch(self):
+        yield self
+
+    # 🔍 SEARCH VIDEO NAMES (TEXT INDEX, BEST MATCHES FIRST)
+    def search(self, query, limit=20):
+        cursor = (
+            self.videos.find(
+                {"$text": {"$search": query}},
+                {"name": 1, "time": 1, "score": {"$meta": "textScore"}},
+            )
+            .sort([("score", {"$meta": "textScore"})])
+            .limit(limit)
+        )
+        return [as_video(doc) for doc in cursor]
+
+    # 📊 READS THE RUNNING TOTALS; min / max / top 5 walk the `seconds` index
+    def stats(self):
+        stats = self.stats_collection.find_one({"_id": STATS_ID})
+        if stats is None:  # ensure_indexes() never ran on this database
+            self.ensure_stats()
+            stats = self.stats_collection.find_one({"_id": STATS_ID})
+        with_seconds = {"seconds": {"$ne": None}}
+        shortest = self.videos.find_one(with_seconds, sort=[("seconds", 1)])
+        longest = list(self.videos.find(with_seconds).sort("seconds", -1).limit(5))
+        return {
+            "count": stats["count"],
+            "unparsed": stats["unparsed"],
+            "total": stats["total"],
+            "min": shortest["seconds"] if shortest else None,
+            "max": longest[0]["seconds"] if longest else None,
+            "buckets": list(stats["buckets"]),
+            "longest": [(as_video(doc), doc["seconds"]) for doc in longest],
+        }
+
+    # 🔒 Nothing to do: the client is shared by the whole process and
+    #    mongo_client.close() shuts it
+    def close(self):
+        pass
@@ -1,99 +1,131 @@
+import json
 import os
-from dotenv import load_dotenv
-from pymongo import MongoClient
-from bson import ObjectId
-
-# 🌿 Load Environment Variables
-load_dotenv()
-
-# 🔑 Fetch MongoDB URI from .env file
-mongo_uri = os.getenv("MONGO_URI")
-
-
-# 🌐 Connect to MongoDB
-client = MongoClient(
-    mongo_uri, tlsAllowInvalidCertificates=True  # ⚠️ Not recommended for production
-)
-
-db = client["PyYouTube"]
-videos_collection = db["videos"]
-
-
-# 📋 LIST ALL VIDEOS
-def list_videos():
-    print("\n📜 Available Videos:\n" + "-" * 40)
-
-    for video in videos_collection.find():
-        print(f"""
-🆔 ID   : {video['_id']}
-🎬 Name : {video['name']}
-⏱️  Time : {video['time']}
+import sys
+import threading
+
+# 📦 Shared helpers live in 23_Projects/video_store
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mongo_client
+from mongo_bulk import BulkWriter
+from mongo_store import MongoVideoStore
+from video_store import cli as video_cli
+from video_store.cache import CachedStore
+from video_store.menu import run_menu
+
+# 🌐 The MongoClient (.env, MONGO_URI, pool settings) is built on first use,
+#    once per process: see mongo_client.py. Importing this module connects
+#    to nothing and works without MONGO_URI.
+
+# 🧠 Read-through cache for lookups and list pages: saves a round trip per
+#    repeated read (video_store/cache.py); YT_CACHE_SIZE=0 turns it off
+CACHE_SIZE = int(os.getenv("YT_CACHE_SIZE", "1024"))
+CACHE_TTL = float(os.getenv("YT_CACHE_TTL", "30")) or None
+
+# 📬 `apply` sends its ops with bulk_write: one flush per BULK_MAX_OPS ops,
+#    or BULK_WINDOW seconds after the first queued op (mongo_bulk.py)
+BULK_MAX_OPS = int(os.getenv("YT_BULK_MAX_OPS", "1000"))
+BULK_WINDOW = float(os.getenv("YT_BULK_WINDOW", "0.5")) or None
+
+# 📜 Documents per cursor round trip when listing (mongo_store.LIST_BATCH)
+LIST_BATCH = int(os.getenv("YT_MONGO_BATCH", "1000"))
+
+current = None  # (client, MongoVideoStore, the store callers use)
+current_lock = threading.Lock()
+
+
+# 🍃 THE STORES FOR THIS PROCESS'S CLIENT -> (MongoVideoStore, cached store)
+#    A forked child gets a new client, and with it new stores and an empty cache.
+def get_stores():
+    global current
+    client = mongo_client.get_client()
+    with current_lock:
+        if current is None or current[0] is not client:
+            mongo = MongoVideoStore(mongo_client.get_database(), LIST_BATCH)
+            cached = CachedStore(mongo, CACHE_SIZE, CACHE_TTL) if CACHE_SIZE else mongo
+            current = (client, mongo, cached)
+        return current[1], current[2]
+
+
+def get_store():
+    return get_stores()[1]
+
+
+def plain_block(row):
+    return f"""
+🆔 ID   : {row['id']}
+🎬 Name : {row['name']}
+⏱️  Time : {row['time']}
 ----------------------------------------
-""")
-
-
-# ➕ ADD NEW VIDEO
-def add_video(name, time):
-    videos_collection.insert_one({"name": name, "time": time})
-    print("✅ Video added successfully!")
-
-
-# ✏️ UPDATE VIDEO
-def update_video(video_id, name, time):
-    videos_collection.update_one(
-        {"_id": ObjectId(video_id)}, {"$set": {"name": name, "time": time}}
-    )
-    print("🔄 Video updated successfully!")
-
-
-# 🗑️ DELETE VIDEO
-def delete_video(video_id):
-    videos_collection.delete_one({"_id": ObjectId(video_id)})
-    print("🗑️ Video deleted successfully!")
+"""
 
 
-# 🚀 MAIN APPLICATION LOOP
+# 🚀 MAIN APPLICATION LOOP (THE SHARED MENU, SEE video_store/menu.py)
 def main():
-    while True:
-        print("\n" + "=" * 50)
-        print("🎥       YouTube Manager App       🎥")
-        print("📦         MongoDB Powered         📦")
-        print("=" * 50)
-        print("1️⃣  List Videos")
-        print("2️⃣  Add Video")
-        print("3️⃣  Update Video")
-        print("4️⃣  Delete Video")
-        print("5️⃣  Exit")
-        print("=" * 50)
-
-        choice = input("👉 Enter your choice: ").strip()
-
-        if choice == "1":
-            list_videos()
-
-        elif choice == "2":
-            name = input("🎬 Enter video name: ")
-            time = input("⏱️  Enter video time: ")
-            add_video(name, time)
-
-        elif choice == "3":
-            video_id = input("🆔 Enter video ID to update: ")
-            name = input("✏️ Enter new video name: ")
-            time = input("⏱️  Enter new video time: ")
-            update_video(video_id, name, time)
-
-        elif choice == "4":
-            video_id = input("🗑️ Enter video ID to delete: ")
-            delete_video(video_id)
-
-        elif choice == "5":
-            print("\n👋 Exiting the application... Bye bye 🚀")
-            break
-
-        else:
-            print("❌ Invalid choice. Please try again!")
-
-
-# 🏁 ENTRY POINT
+    store = get_store()
+    store.ensure_indexes()
+    run_menu(store, "YouTube Manager App (MongoDB Powered)", plain_block)
+
+
+# 📬 APPLY A FILE OF OPS THROUGH THE BULK WRITER -> exit code (1 if any op failed)
+#
+# Same JSON Lines in and out as video_store/cli.py, in the same order;
+# an op is reported once the flush that carried it is back.
+def apply_bulk(path, out=None):
+    out = sys.stdout if out is None else out
+    failed = 0
+
+    def report(results):
+        nonlocal failed
+        for result in results:
+            failed += not result["ok"]
+            out.write(json.dumps(result) + "\n")
+
+    mongo_store, store = get_stores()
+    writer = BulkWriter(mongo_store, BULK_MAX_OPS, BULK_WINDOW, on_flush=report)
+
+    def reject(kind, error):
+        with writer.lock:
+            writer.flush()  # the ops before this one are reported first
+            report([{"op": kind, "ok": False, "error": error}])
+
+    try:
+        for line in video_cli.read_ops(path):
+            kind = None
+            try:
+                op = video_cli.parse_op(line)
+                kind = op.get("op")
+                if kind == "add":
+                    writer.add(op["name"], op["time"])
+                elif kind == "update":
+                    writer.update(op["id"], op["name"], op["time"])
+                elif kind == "delete":
+                    writer.delete(op["id"])
+                else:
+                    reject(kind, "unknown op")
+            except (KeyError, ValueError, TypeError) as error:
+                reject(kind, f"bad op: {error}")
+        writer.flush()
+    finally:
+        store.close()
+    return 1 if failed else 0
+
+
+# 🤖 NON-INTERACTIVE MODE: ONE PROCESS, ONE CONNECTION (video_store/cli.py)
+#
+# A standalone MongoDB has no multi-document transactions, so single ops
+# are applied on their own; `apply` batches its ops with bulk_write.
+def cli(argv):
+    args = video_cli.build_parser("youtube_manager_mongodb.py").parse_args(argv)
+    store = get_store()
+    store.ensure_indexes()
+    if args.command == "apply":
+        return apply_bulk(args.file)
+    return video_cli.run(store, args, plain_block)
+
+
+# 🏁 ENTRY POINT (NO ARGUMENTS = INTERACTIVE MENU)
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
     main()
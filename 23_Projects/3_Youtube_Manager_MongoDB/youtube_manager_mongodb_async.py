@@ -0,0 +1,62 @@
+import threading
+
+import mongo_client
+from youtube_manager_mongodb import get_store
+
+from video_store.aio import AsyncVideoStore
+from video_store.render import PAGE_SIZE
+
+# ⚡ ASYNC CRUD FOR THE MONGODB MANAGER (same client, cache and settings)
+#
+#   from youtube_manager_mongodb_async import add_video, list_videos
+#
+#   async def handler():
+#       video_id = await add_video("Python Basics", "2 Hours")
+#       return await list_videos(after=video_id)
+#
+# Each call runs on one of YT_ASYNC_WORKERS threads (video_store/aio.py), so
+# a service on asyncio keeps serving while MongoDB answers. By default there
+# are as many threads as the client has connections (YT_MONGO_MAX_POOL):
+# more would only queue inside the driver. Both are read once the client
+# exists, so values from .env count too.
+
+current = None  # (store, AsyncVideoStore): rebuilt with the store after a fork
+current_lock = threading.Lock()
+
+
+# 🧵 Read after get_store(): building the client is what loads .env
+def async_workers():
+    return mongo_client.env_int("YT_ASYNC_WORKERS", mongo_client.pool_settings()["maxPoolSize"])
+
+
+def get_videos():
+    global current
+    store = get_store()
+    with current_lock:
+        if current is None or current[0] is not store:
+            current = (store, AsyncVideoStore(store, async_workers()))
+        return current[1]
+
+
+# 📜 ONE PAGE (page number, or keyset: the page after `after`)
+async def list_videos(page=1, page_size=PAGE_SIZE, after=None):
+    return await get_videos().list(None if after else page, page_size, after)
+
+
+async def get_video(video_id):
+    return await get_videos().get(video_id)
+
+
+# ➕ -> new video id
+async def add_video(name, time):
+    return await get_videos().add(name, time)
+
+
+# ✏️ -> False if there is no such video
+async def update_video(video_id, name, time):
+    return await get_videos().update(video_id, name, time)
+
+
+# 🗑️ -> False if there is no such video
+async def delete_video(video_id):
+    return await get_videos().delete(video_id)
@@ -0,0 +1,59 @@
+from typing import Any, ContextManager, Iterable, Iterator, Optional, Protocol
+
+from video_store.render import PAGE_SIZE
+
+# 🧩 VideoStore — the one interface every YouTube Manager backend speaks
+#
+#   1_YouTube_Manager/json_store.py          -> JsonVideoStore   (youtube.txt)
+#   2_database_sqlite3/sqlite_store.py       -> SqliteVideoStore (youtube_manager.db)
+#   3_Youtube_Manager_MongoDB/mongo_store.py -> MongoVideoStore  (MongoDB)
+#
+# A video is always a dict {"id": ..., "name": ..., "time": ...}. What an id
+# looks like is up to the backend (1-based number, INTEGER PRIMARY KEY,
+# ObjectId string); callers just pass back what they were given. Because
+# everyone speaks this interface, the menu (menu.py), the CLI (cli.py) and
+# the benchmark (benchmark.py) are written once for all three backends, and
+# so are the read cache (cache.py) and the asyncio front (aio.py).
+
+
+class VideoStore(Protocol):
+    label: str  # shown in the menu title, e.g. "SQLite"
+    id_type: type  # what add() returns: int, or str for MongoDB's ObjectIds
+
+    # 📜 Stream videos in id order (page is 1-based; None = everything).
+    #    `after` = keyset cursor: start right after that id (pass the last id
+    #    of the previous page), which stays fast however deep you go.
+    def list(
+        self,
+        page: Optional[int] = None,
+        page_size: int = PAGE_SIZE,
+        after: Any = None,
+    ) -> Iterator[dict]: ...
+
+    def get(self, video_id: Any) -> Optional[dict]: ...
+
+    # 🔚 Id of the last video in list() order (None = empty)
+    def last_id(self) -> Any: ...
+
+    # ➕ Returns the new video's id
+    def add(self, name: str, time: str) -> Any: ...
+
+    # ✏️ / 🗑 Return False when there is no such video
+    def update(self, video_id: Any, name: str, time: str) -> bool: ...
+
+    def delete(self, video_id: Any) -> bool: ...
+
+    # 📥 Insert many {"name", "time"} rows with batched writes -> rows added
+    def bulk_add(self, rows: Iterable[dict]) -> int: ...
+
+    # 🔍 Best matches for the words in `query`
+    def search(self, query: str, limit: int = 20) -> list: ...
+
+    # 📊 {"count", "unparsed", "total", "min", "max", "buckets",
+    #     "longest": [(video, seconds), ...]} -- all from running totals
+    def stats(self) -> dict: ...
+
+    # 📦 Group many changes into one storage transaction / one write
+    def batch(self) -> ContextManager: ...
+
+    def close(self) -> None: ...
@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from video_store.render import PAGE_SIZE
+
+# ⚡ asyncio front for any VideoStore
+#
+#   async with AsyncVideoStore(MongoVideoStore(db), workers=100) as videos:
+#       video_id = await videos.add("Python Basics", "2 Hours")
+#       page = await videos.list(after=video_id, page_size=20)
+#       async for video in videos.scan():
+#           ...
+#
+# Every call runs the blocking store method on a worker thread, so while
+# one waits on MongoDB (or SQLite's disk) the event loop serves the rest:
+# hundreds of coroutines can have calls in flight, `workers` of them
+# actually waiting on the store at a time. Make `workers` about the size
+# of the driver's connection pool (pymongo's maxPoolSize, default 100);
+# more threads than connections just queue inside the driver.
+#
+# The stores are thread-safe (locks in the JSON store and the stand-in,
+# one connection per thread for SQLite, pymongo's own pool). There is no
+# async batch(): a batch belongs to one thread, and these calls hop
+# between threads. Use bulk_add, or mongo_bulk.BulkWriter, for mass edits.
+
+WORKERS = 32
+
+
+class AsyncVideoStore:
+    def __init__(self, store, workers=WORKERS):
+        self.store = store
+        self.label = store.label
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="video-store")
+
+    async def run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, partial(method, *args, **kwargs))
+
+    # 📜 A page (or everything) as a list: the rows are read on the worker thread
+    async def list(self, page=None, page_size=PAGE_SIZE, after=None):
+        return await self.run(lambda: list(self.store.list(page, page_size, after)))
+
+    # 📜 Everything, one keyset page per call -> memory stays at one page
+    async def scan(self, page_size=PAGE_SIZE):
+        after = None
+        while True:
+            if after is None:
+                rows = await self.list(1, page_size)
+            else:
+                rows = await self.list(after=after, page_size=page_size)
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                return
+            after = rows[-1]["id"]
+
+    async def get(self, video_id):
+        return await self.run(self.store.get, video_id)
+
+    async def add(self, name, time):
+        return await self.run(self.store.add, name, time)
+
+    async def update(self, video_id, name, time):
+        return await self.run(self.store.update, video_id, name, time)
+
+    async def delete(self, video_id):
+        return await self.run(self.store.delete, video_id)
+
+    async def bulk_add(self, rows):
+        return await self.run(self.store.bulk_add, rows)
+
+    async def search(self, query, limit=20):
+        return await self.run(self.store.search, query, limit)
+
+    async def stats(self):
+        return await self.run(self.store.stats)
+
+    # 🏁 Let calls in flight finish, then close the store
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.shutdown)
+        self.store.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,165 @@
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time as timer
+from contextlib import nullcontext
+
+# ⏱ Same workload against every VideoStore backend
+#
+#   cd 23_Projects
+#   python -m video_store.benchmark                       # 10,000 videos, all backends
+#   python -m video_store.benchmark -n 100000 --backends sqlite,json
+#   python -m video_store.benchmark --batch               # each phase in store.batch()
+#   python -m video_store.benchmark --mongo-uri mongodb://localhost:27017
+#   python -m video_store.benchmark --cache 1024          # SQLite / Mongo behind CachedStore
+#
+# Phases: insert N, update N/2 random videos, get N/2 videos (90% of them
+# from a hot 10%), delete N/4 random videos, then one full scan. Every
+# single op is timed, so each phase reports throughput plus p50 / p99
+# latency. Without --mongo-uri, MongoDB runs against the in-process
+# stand-in (3_Youtube_Manager_MongoDB/mongo_standin.py): that measures the
+# client-side code only, not a real server.
+
+from video_store.cache import CachedStore
+
+PROJECTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("1_YouTube_Manager", "2_database_sqlite3", "3_Youtube_Manager_MongoDB"):
+    sys.path.insert(0, os.path.join(PROJECTS, folder))
+
+DURATIONS = ["10:00", "05:30", "2 Hours", "14 Hours", "2.5 Hours", "45:12", "90"]
+WORDS = ["python", "git", "docker", "sql", "mongo", "async", "tutorial", "basics"]
+BACKENDS = ("json", "journal", "sqlite", "mongo")
+
+
+def make_video(rng, i):
+    name = " ".join(rng.choices(WORDS, k=3)) + f" #{i}"
+    return name, rng.choice(DURATIONS)
+
+
+# 🏭 Open a fresh, empty store of `backend` inside `folder`
+def open_store(backend, folder, mongo_uri=None):
+    if backend in ("json", "journal"):
+        from json_store import JsonVideoStore
+
+        return JsonVideoStore(backend, os.path.join(folder, "youtube.txt"))
+    if backend == "sqlite":
+        from sqlite_store import SqliteVideoStore
+
+        return SqliteVideoStore(os.path.join(folder, "youtube_manager.db"))
+    if backend == "mongo":
+        from mongo_store import MongoVideoStore
+
+        if mongo_uri:
+            from pymongo import MongoClient
+
+            client = MongoClient(mongo_uri)
+            name = f"PyYouTubeBenchmark_{os.getpid()}"
+            client.drop_database(name)
+            store = MongoVideoStore(client[name])
+            store.close = lambda: client.drop_database(name)
+        else:
+            from mongo_standin import StandinDatabase
+
+            store = MongoVideoStore(StandinDatabase())
+        store.ensure_indexes()
+        return store
+    raise ValueError(f"unknown backend {backend!r}, pick from {', '.join(BACKENDS)}")
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+# 📏 Run `op(i)` `count` times -> (ops, seconds, p50 ms, p99 ms)
+def timed(count, op):
+    latencies = []
+    start = timer.perf_counter()
+    for i in range(count):
+        t = timer.perf_counter_ns()
+        op(i)
+        latencies.append(timer.perf_counter_ns() - t)
+    elapsed = timer.perf_counter() - start
+    latencies.sort()
+    return count, elapsed, percentile(latencies, 0.50) / 1e6, percentile(latencies, 0.99) / 1e6
+
+
+def run_workload(store, n, rng, batch=False):
+    group = store.batch if batch else nullcontext
+    results = {}
+    ids = []
+
+    with group():
+        results["insert"] = timed(n, lambda i: ids.append(store.add(*make_video(rng, i))))
+
+    def update(i):
+        store.update(rng.choice(ids), *make_video(rng, n + i))
+
+    with group():
+        results["update"] = timed(n // 2, update)
+
+    hot = ids[: max(1, len(ids) // 10)]
+
+    def get(i):
+        store.get(rng.choice(hot) if rng.random() < 0.9 else rng.choice(ids))
+
+    results["get"] = timed(n // 2, get)
+
+    # Positional ids (JSON catalog) shift down after a delete, so pick
+    # among 1..len; stable ids are drawn without replacement
+    def delete(i):
+        if getattr(store, "renumbers", False):
+            store.delete(rng.randint(1, len(ids) - i))
+        else:
+            j = rng.randrange(len(ids))
+            ids[j], ids[-1] = ids[-1], ids[j]
+            store.delete(ids.pop())
+
+    with group():
+        results["delete"] = timed(n // 4, delete)
+
+    # One pass over everything: throughput is rows/sec, latency the whole scan
+    start = timer.perf_counter()
+    rows = sum(1 for _ in store.list())
+    elapsed = timer.perf_counter() - start
+    results["scan"] = (rows, elapsed, elapsed * 1e3, elapsed * 1e3)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m video_store.benchmark")
+    parser.add_argument("-n", type=int, default=10_000, help="videos to insert")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--batch", action="store_true", help="group each phase in store.batch()")
+    parser.add_argument("--mongo-uri", help="real MongoDB instead of the in-process stand-in")
+    parser.add_argument("--cache", type=int, default=0, help="CachedStore size (0 = off)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':<8} {'phase':<7} {'ops':>9} {'ops/sec':>12} {'p50 ms':>9} {'p99 ms':>9}")
+    for backend in args.backends.split(","):
+        folder = tempfile.mkdtemp(prefix=f"yt_bench_{backend}_")
+        try:
+            store = open_store(backend, folder, args.mongo_uri)
+            if args.cache and backend in ("sqlite", "mongo"):
+                store = CachedStore(store, args.cache)
+            results = run_workload(store, args.n, random.Random(args.seed), args.batch)
+            store.close()
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+        for phase, (ops, elapsed, p50, p99) in results.items():
+            rate = ops / elapsed if elapsed else float("inf")
+            print(f"{backend:<8} {phase:<7} {ops:>9,} {rate:>12,.0f} {p50:>9.3f} {p99:>9.3f}")
+        if isinstance(store, CachedStore):
+            info = store.cache_info()
+            print(f"{backend:<8} cache   hits {info['hits']:,} misses {info['misses']:,} "
+                  f"({info['hit_ratio']:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
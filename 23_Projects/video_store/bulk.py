@@ -0,0 +1,32 @@
+import csv
+import json
+
+# 📄 CSV / JSON Lines files of {name, time} rows, read and written lazily
+
+
+# 📄 Read {name, time} rows from a .csv (with a header) or .jsonl file
+def read_rows(path):
+    with open(path, "r", newline="", encoding="utf-8") as file:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+        for row in rows:
+            yield {"name": row["name"], "time": row["time"]}
+
+
+# 📤 Write {name, time} rows to a .csv or .jsonl file -> rows written
+def write_rows(rows, path):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        if path.endswith(".csv"):
+            writer = csv.writer(file)
+            writer.writerow(["name", "time"])
+            for row in rows:
+                writer.writerow([row["name"], row["time"]])
+                count += 1
+        else:
+            for row in rows:
+                file.write(json.dumps({"name": row["name"], "time": row["time"]}) + "\n")
+                count += 1
+    return count
@@ -0,0 +1,213 @@
+import threading
+import time as timer
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from video_store.render import PAGE_SIZE
+
+# 🧠 Read-through cache in front of any VideoStore
+#
+#   store = CachedStore(SqliteVideoStore(), maxsize=1024, ttl=30)
+#   store.get(7)          # miss -> database, then kept
+#   store.get(7)          # hit  -> no database round trip
+#   store.update(7, ...)  # drops exactly what video 7 can have changed
+#   store.cache_info()    # {"hits", "misses", "hit_ratio", ...}
+#
+# Cached: single videos (get) and list pages (page / after). Full listings,
+# search and stats always go to the store.
+#
+# 🎯 What a write drops:
+#   update(x)  -> get(x) and every cached page that holds x
+#   delete(x)  -> the same, plus every page-NUMBER page (later videos
+#                 shift up one place); `after=` pages without x stay valid
+#   add()      -> get(new id) and every page that is not full yet (the
+#                 new video lands at the end)
+#
+# `ttl` (seconds) bounds how stale an entry can get when ANOTHER process
+# writes to the same database; None = keep until evicted or invalidated.
+# Ids must only ever grow (INTEGER PRIMARY KEY, ObjectId), so positional
+# ids like the JSON catalog's are not a fit.
+
+MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self.lock = threading.Lock()
+        self.generation = 0  # bumped by every invalidation
+        self.hits = self.misses = self.evictions = self.expired = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > timer.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.entries[key]
+                self.expired += 1
+            self.misses += 1
+            return MISSING
+
+    # Store `value`, unless something was invalidated since `generation`
+    # was read: then the value may already be stale and is dropped
+    def put(self, key, value, generation=None):
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            expires_at = None if self.ttl is None else timer.monotonic() + self.ttl
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    # 📖 Cached value, or load it (outside the lock) and keep it
+    def get_or_load(self, key, load):
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        generation = self.generation
+        value = load()
+        self.put(key, value, generation)
+        return value
+
+    def invalidate_key(self, key):
+        with self.lock:
+            self.generation += 1
+            if self.entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    # 🗑 Drop every key for which `drop(key, value)` is true
+    def invalidate(self, drop):
+        with self.lock:
+            self.generation += 1
+            stale = [key for key, (_, value) in self.entries.items() if drop(key, value)]
+            for key in stale:
+                del self.entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+
+    def info(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "invalidations": self.invalidations,
+            }
+
+
+class CachedStore:
+    # `id_key` turns any spelling of an id into one cache key ("7", 7 -> "7").
+    # Videos and pages live in separate LRUs: a write drops its video by key
+    # in O(1) and only has to look through the (few, small) cached pages.
+    def __init__(self, store, maxsize=1024, ttl=None, id_key=str, page_slots=None):
+        self.store = store
+        self.videos = LRUCache(maxsize, ttl)
+        self.pages = LRUCache(page_slots or max(16, maxsize // 16), ttl)
+        self.id_key = id_key
+        self.label = store.label
+
+    # Anything not cached here (ensure_indexes, find_by_name, ...) goes straight through
+    def __getattr__(self, name):
+        return getattr(self.store, name)
+
+    def get(self, video_id):
+        key = self.id_key(video_id)
+        return self.videos.get_or_load(key, lambda: self.store.get(video_id))
+
+    def list(self, page=None, page_size=PAGE_SIZE, after=None):
+        if page is None and after is None:
+            return self.store.list()  # full listing: streamed, never cached
+        if after is not None:
+            key = ("after", self.id_key(after), page_size)
+        else:
+            key = ("page", page, page_size)
+        rows = self.pages.get_or_load(
+            key, lambda: list(self.store.list(page, page_size, after))
+        )
+        return iter(rows)
+
+    # 🎯 Exact invalidation (see the table at the top)
+    def _drop(self, video_id, deleted=False, added=False):
+        video_id = self.id_key(video_id)
+        self.videos.invalidate_key(video_id)
+
+        def drop(key, rows):
+            if added:
+                return len(rows) < key[2]  # not full: the new video may land here
+            if deleted and key[0] == "page":
+                return True
+            return any(self.id_key(row["id"]) == video_id for row in rows)
+
+        self.pages.invalidate(drop)
+
+    def add(self, name, time):
+        video_id = self.store.add(name, time)
+        self._drop(video_id, added=True)
+        return video_id
+
+    def update(self, video_id, name, time):
+        found = self.store.update(video_id, name, time)
+        if found:
+            self._drop(video_id)
+        return found
+
+    def delete(self, video_id):
+        found = self.store.delete(video_id)
+        if found:
+            self._drop(video_id, deleted=True)
+        return found
+
+    # 📥 Many new videos at the end: every not-full page may change, and
+    #    any id we remembered as missing may exist now
+    def bulk_add(self, rows):
+        count = self.store.bulk_add(rows)
+        self.videos.invalidate(lambda key, video: video is None)
+        self.pages.invalidate(lambda key, rows: len(rows) < key[2])
+        return count
+
+    # 📦 A rolled-back batch may have left uncommitted reads in the cache
+    @contextmanager
+    def batch(self):
+        try:
+            with self.store.batch():
+                yield self
+        except BaseException:
+            self.videos.clear()
+            self.pages.clear()
+            raise
+
+    def search(self, query, limit=20):
+        return self.store.search(query, limit)
+
+    def stats(self):
+        return self.store.stats()
+
+    # 🧠 Counters of both caches, added up
+    def cache_info(self):
+        videos, pages = self.videos.info(), self.pages.info()
+        info = {key: videos[key] + pages[key] for key in videos if key != "hit_ratio"}
+        lookups = info["hits"] + info["misses"]
+        info["hit_ratio"] = info["hits"] / lookups if lookups else 0.0
+        info["videos"], info["pages"] = videos, pages
+        return info
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,109 @@
+import argparse
+import json
+import sys
+
+from video_store import render
+
+# 🤖 The one non-interactive mode, for any VideoStore: JSON Lines out
+#
+#   python <manager>.py list [--format plain|json|tsv] [--page N] [--page-size N]
+#   python <manager>.py list --after <last id of the previous page>
+#   python <manager>.py add "Python Basics" "2 Hours"
+#   python <manager>.py update <id> "Git Deep Dive" "1:30:00"
+#   python <manager>.py delete <id>
+#   python <manager>.py apply ops.jsonl     # {"op": "add", ...} per line
+#
+# All ops of one run go through store.batch(): one SQLite transaction,
+# one rewrite of youtube.txt.
+
+
+def build_parser(prog):
+    parser = argparse.ArgumentParser(prog=prog)
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list")
+    listing.add_argument("--format", choices=render.FORMATS, default="json")
+    listing.add_argument("--page", type=int, help="1-based page to show (default: all)")
+    listing.add_argument("--page-size", type=int, default=render.PAGE_SIZE)
+    listing.add_argument("--after", help="show the page right after this id (keyset)")
+    add = commands.add_parser("add")
+    add.add_argument("name")
+    add.add_argument("time")
+    update = commands.add_parser("update")
+    update.add_argument("id")
+    update.add_argument("name")
+    update.add_argument("time")
+    delete = commands.add_parser("delete")
+    delete.add_argument("id")
+    apply = commands.add_parser("apply")
+    apply.add_argument("file", help='JSON Lines of ops, "-" for stdin')
+    return parser
+
+
+# 📄 One JSON Lines line -> op dict (ValueError / TypeError if it isn't one)
+def parse_op(line):
+    op = json.loads(line)
+    if not isinstance(op, dict):
+        raise TypeError(f"expected a JSON object, got {type(op).__name__}")
+    return op
+
+
+# ⚙️ Apply one {"op": ...} without prompts -> result dict
+def apply_op(store, op):
+    kind = op.get("op")
+    if kind == "add":
+        return {"op": kind, "ok": True, "id": store.add(op["name"], op["time"])}
+    if kind not in ("update", "delete"):
+        return {"op": kind, "ok": False, "error": "unknown op"}
+    video_id = store.id_type(op["id"])  # "7" -> 7: results look like add's
+    if kind == "update":
+        found = store.update(video_id, op["name"], op["time"])
+    else:
+        found = store.delete(video_id)
+    if not found:
+        return {"op": kind, "ok": False, "error": f"no video with id {video_id}"}
+    return {"op": kind, "ok": True, "id": video_id}
+
+
+# 📄 Non-blank lines of a JSON Lines file ("-" = stdin); parse each with parse_op()
+def read_ops(path):
+    file = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    with file:
+        for line in file:
+            if line.strip():
+                yield line
+
+
+# ▶️ Run parsed `args` against `store` -> exit code (1 if any op failed)
+def run(store, args, plain, out=None):
+    out = sys.stdout if out is None else out
+    try:
+        if args.command == "list":
+            rows = store.list(args.page, args.page_size, args.after)
+            render.render(rows, args.format, plain, args.page_size, out)
+            return 0
+
+        if args.command == "apply":
+            lines = read_ops(args.file)
+        else:
+            fields = {k: v for k, v in vars(args).items() if k in ("id", "name", "time")}
+            lines = [json.dumps({"op": args.command, **fields})]
+
+        # Failed ops (bad lines included) are reported and skipped; the good
+        # ones are kept. Results are printed only once the batch has
+        # committed: an "ok" must never be rolled back afterwards.
+        results = []
+        with store.batch():
+            for line in lines:
+                op = None
+                try:
+                    op = parse_op(line)
+                    result = apply_op(store, op)
+                except (KeyError, ValueError, TypeError) as error:
+                    kind = op.get("op") if isinstance(op, dict) else None
+                    result = {"op": kind, "ok": False, "error": f"bad op: {error}"}
+                results.append(result)
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+        return 1 if any(not result["ok"] for result in results) else 0
+    finally:
+        store.close()
@@ -0,0 +1,72 @@
+import re
+
+# ⏱ Parse hand-typed video durations into integer seconds
+#
+# Video times are typed by hand: "14 Hours", "2.5 Hours", "10:00", "1:02:03",
+# "45 min", "1h 30m". We parse them ONCE when a video is saved and keep the
+# numbers, so "total watch time" or "longest video" never re-parses strings.
+
+UNITS = {
+    **dict.fromkeys(["h", "hr", "hrs", "hour", "hours"], 3600),
+    **dict.fromkeys(["m", "min", "mins", "minute", "minutes"], 60),
+    **dict.fromkeys(["s", "sec", "secs", "second", "seconds"], 1),
+}
+
+CLOCK = re.compile(r"\d+(?::\d{1,2}){1,2}")  # mm:ss or hh:mm:ss
+PART = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]+)")
+NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+# (upper bound in seconds, label); the last bucket has no upper bound
+BUCKETS = [
+    (5 * 60, "< 5 min"),
+    (20 * 60, "5-20 min"),
+    (60 * 60, "20-60 min"),
+    (3 * 3600, "1-3 hours"),
+    (None, "3+ hours"),
+]
+
+
+# 🔢 "2.5 Hours" -> 9000, "10:00" -> 600, a bare number means minutes.
+#    Returns None when the text is not a duration we understand.
+def parse_duration(text):
+    text = text.strip().lower()
+    if not text:
+        return None
+
+    if CLOCK.fullmatch(text):
+        seconds = 0
+        for part in text.split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+
+    if NUMBER.fullmatch(text):
+        return round(float(text) * 60)
+
+    total = 0
+    end = 0
+    for match in PART.finditer(text):
+        if text[end : match.start()].strip(" ,"):
+            return None  # something we don't understand in between
+        unit = UNITS.get(match.group(2))
+        if unit is None:
+            return None
+        total += float(match.group(1)) * unit
+        end = match.end()
+    if end == 0 or text[end:].strip():
+        return None
+    return round(total)
+
+
+def bucket_of(seconds):
+    for i, (limit, _) in enumerate(BUCKETS):
+        if limit is None or seconds < limit:
+            return i
+
+
+# 🕒 "9000" -> "2h 30m 0s" for reports
+def format_duration(seconds):
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes}m {seconds}s"
+    return f"{minutes}m {seconds}s"
@@ -0,0 +1,169 @@
+import time as timer
+
+from video_store import bulk, render
+from video_store.cache import CachedStore
+from video_store.durations import BUCKETS, format_duration
+
+# 🎛 The one interactive menu, for any VideoStore
+#
+#   run_menu(store, "YouTube Manager App (SQLite Powered)", plain_line)
+#
+# `plain` formats one {"id", "name", "time"} row the way each manager always
+# printed it. `extras` adds backend-only entries after 9: [(label, action)].
+
+SCREEN_PAGE = 50
+
+
+# 📺 Show all videos, one page at a time (only that page is read)
+def list_videos(store, plain, page_size=SCREEN_PAGE):
+    print("\n📺 Your YouTube Videos:")
+    print("-" * 40)
+    shown = 0
+    for page in render.pages(store.list(), page_size):
+        if shown:
+            more = input(f"📄 {shown} shown — Enter for more, q to stop: ")
+            if more.strip().lower() == "q":
+                break
+        render.render(page, plain=plain)
+        shown += len(page)
+    if not shown:
+        print("😢 No videos found. Add some first!")
+    print("-" * 40)
+
+
+def add_video(store):
+    name = input("🎬 Enter video name: ")
+    time = input("⏱️ Enter video time: ")
+    store.add(name, time)
+    print("✅ Video added successfully!")
+
+
+def update_video(store):
+    video_id = input("🆔 Enter video ID to update: ").strip()
+    if store.get(video_id) is None:
+        print("❌ No video with that ID!")
+        return
+    name = input("✏️ Enter new video name: ")
+    time = input("⏱️ Enter new video time: ")
+    store.update(video_id, name, time)
+    print("🔄 Video updated successfully!")
+
+
+def delete_video(store):
+    video_id = input("🗑️ Enter video ID to delete: ").strip()
+    if store.delete(video_id):
+        print("🗑️ Video deleted successfully!")
+    else:
+        print("❌ No video with that ID!")
+
+
+# 📥 Bulk import: the store batches the writes
+def bulk_import(store, path):
+    start = timer.perf_counter()
+    count = store.bulk_add(bulk.read_rows(path))
+    elapsed = timer.perf_counter() - start
+    print(f"📥 Imported {count} videos in {elapsed:.2f}s ({count / elapsed:,.0f} rows/sec)")
+    return count
+
+
+# 📤 Bulk export: stream every video to a .csv or .jsonl file
+def bulk_export(store, path):
+    start = timer.perf_counter()
+    count = bulk.write_rows(store.list(), path)
+    elapsed = timer.perf_counter() - start
+    print(f"📤 Exported {count} videos in {elapsed:.2f}s ({count / elapsed:,.0f} rows/sec)")
+    return count
+
+
+def search_videos(store, plain):
+    results = store.search(input("🔎 Search for: "))
+    if not results:
+        print("😢 No matching videos.")
+    render.render(results, plain=plain)
+
+
+# 📊 Duration report (running totals, nothing is re-parsed)
+def duration_report(store):
+    stats = store.stats()
+    count = stats["count"]
+    print("\n📊 Duration Report")
+    print(f"🎬 Videos with a duration : {count}")
+    if stats["unparsed"]:
+        print(f"❓ Unrecognised durations : {stats['unparsed']}")
+    if not count:
+        return
+    print(f"⏱ Total watch time        : {format_duration(stats['total'])}")
+    print(f"📏 Average                 : {format_duration(round(stats['total'] / count))}")
+    print(f"🐇 Shortest                : {format_duration(stats['min'])}")
+    print(f"🐢 Longest                 : {format_duration(stats['max'])}")
+    for (_, label), bucket_count in zip(BUCKETS, stats["buckets"]):
+        print(f"   {label:>10} | {bucket_count}")
+    print("🏆 Top 5 longest:")
+    for video, seconds in stats["longest"]:
+        print(f"🆔 {video['id']} | 🎬 {video['name']} | ⏱ {format_duration(seconds)}")
+
+
+# 🧠 Hit / miss counters of a CachedStore (see cache.py)
+def cache_report(store):
+    info = store.cache_info()
+    print("\n🧠 Cache")
+    print(f"🎯 Hits / misses : {info['hits']} / {info['misses']} ({info['hit_ratio']:.0%})")
+    print(f"📦 Entries       : {info['size']} of {info['maxsize']}")
+    print(f"♻️ Evicted       : {info['evictions']} (expired {info['expired']})")
+    print(f"🗑 Invalidated   : {info['invalidations']}")
+
+
+# 🚀 Main application loop
+def run_menu(store, title, plain, extras=()):
+    if isinstance(store, CachedStore):
+        extras = [*extras, ("Cache stats 🧠", lambda: cache_report(store))]
+    last = 9 + len(extras)
+    while True:
+        print("\n" + "=" * 50)
+        print(f"🎥 {title}")
+        print("=" * 50)
+        print("1️⃣  List Videos")
+        print("2️⃣  Add Video")
+        print("3️⃣  Update Video")
+        print("4️⃣  Delete Video")
+        print("5️⃣  Exit 🚪")
+        print("6️⃣  Bulk Import (.csv / .jsonl) 📥")
+        print("7️⃣  Bulk Export (.csv / .jsonl) 📤")
+        print("8️⃣  Search Videos 🔎")
+        print("9️⃣  Duration Report 📊")
+        for number, (label, _) in enumerate(extras, start=10):
+            print(f"{number}. {label}")
+        print("=" * 50)
+
+        choice = input(f"👉 Enter your choice (1-{last}): ").strip()
+
+        try:
+            match choice:
+                case "1":
+                    list_videos(store, plain)
+                case "2":
+                    add_video(store)
+                case "3":
+                    update_video(store)
+                case "4":
+                    delete_video(store)
+                case "5":
+                    print("👋 Exiting YouTube Manager. Bye bye!")
+                    break
+                case "6":
+                    bulk_import(store, input("📄 File to import: ").strip())
+                case "7":
+                    bulk_export(store, input("📄 File to export to: ").strip())
+                case "8":
+                    search_videos(store, plain)
+                case "9":
+                    duration_report(store)
+                case _ if choice.isdigit() and 10 <= int(choice) <= last:
+                    extras[int(choice) - 10][1]()
+                case _:
+                    print(f"⚠️ Invalid choice! Please enter 1 to {last}.")
+        except (ValueError, OSError) as error:
+            print(f"❌ {error}")
+
+    # 🔒 Flush pending writes / close the connection
+    store.close()
@@ -0,0 +1,51 @@
+import json
+import sys
+from itertools import islice
+
+# 🖨 Buffered rendering for video listings
+#
+# One print() per video means one formatted write (and often one flush to
+# the terminal) per row. Here each page of rows is formatted into a list of
+# strings and written with ONE out.write(), and rows are pulled from the
+# backend lazily, so nothing has to hold the whole catalog.
+#
+#   plain -> the manager's own decorated line (passed in as `plain`)
+#   json  -> one JSON object per line
+#   tsv   -> a header line, then tab-separated values
+
+FORMATS = ("plain", "json", "tsv")
+PAGE_SIZE = 1000
+
+
+# 📦 Split any iterable into lists of `size` items, without reading ahead
+def pages(rows, size):
+    rows = iter(rows)
+    while page := list(islice(rows, size)):
+        yield page
+
+
+def tsv_value(value):
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def format_page(page, fmt, plain, header):
+    if fmt == "json":
+        return [json.dumps(row) + "\n" for row in page]
+    if fmt == "tsv":
+        lines = ["\t".join(header) + "\n"] if header is not None else []
+        lines += ["\t".join(tsv_value(v) for v in row.values()) + "\n" for row in page]
+        return lines
+    return [plain(row) + "\n" for row in page]
+
+
+# ✍️ Write `rows` (dicts) page by page -> number of rows written
+def render(rows, fmt="plain", plain=None, page_size=PAGE_SIZE, out=None):
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}, pick one of {', '.join(FORMATS)}")
+    out = sys.stdout if out is None else out
+    count = 0
+    for page in pages(rows, page_size):
+        header = list(page[0]) if fmt == "tsv" and count == 0 else None
+        out.write("".join(format_page(page, fmt, plain, header)))
+        count += len(page)
+    return count
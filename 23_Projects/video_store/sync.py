@@ -0,0 +1,429 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time as timer
+from contextlib import contextmanager
+
+# 🔄 Incremental sync: copy the catalog from any backend to any other
+#
+#   cd 23_Projects
+#   python -m video_store.sync json:1_YouTube_Manager/youtube.txt sqlite:copy.db
+#   python -m video_store.sync sqlite:2_database_sqlite3/youtube_manager.db mongo:
+#   python -m video_store.sync sqlite:a.db mongo:mongodb://localhost:27017/PyYouTube
+#
+# Backends: json:<file> / journal:<file> / lazy:<file>, sqlite:<file>,
+# mongo: (MONGO_URI, see mongo_client.py) or mongo:<uri>.
+#
+# Videos travel in batches of --batch, so memory stays at one batch however
+# big the catalog is. What the target already holds lives in a checkpoint
+# file (--checkpoint, a small SQLite database), not in memory:
+#
+#   id_map  source id -> target id + digest of name / time
+#   state   where the last run got to
+#
+# 🔎 Finding what changed
+#   change feed    SQLite sources keep a change log (migration 7): after the
+#                  first full copy a run only reads the log past its last seq,
+#                  deletes included
+#   snapshot diff  other sources: stream the whole source in keyset pages,
+#                  write only videos whose digest changed, then delete every
+#                  mapped video the scan didn't see (youtube.txt ids are
+#                  positions: after a delete, every later video reads as changed)
+#
+# ⏯ Resuming: the checkpoint commits after every batch. Each batch is noted
+#    as "pending" before the target is written, so after a crash the next
+#    run finds which of its adds landed (they are the newest videos in the
+#    target) instead of adding them twice. Updates and deletes are simply
+#    applied again. The target should only be written by this tool.
+
+PROJECTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("1_YouTube_Manager", "2_database_sqlite3", "3_Youtube_Manager_MongoDB"):
+    sys.path.insert(0, os.path.join(PROJECTS, folder))
+
+BATCH_SIZE = 1000
+PROGRESS_EVERY = 5.0  # seconds between progress lines
+JSON_MODES = ("json", "journal", "lazy")
+
+
+def digest(video):
+    data = f"{video['name']}\0{video['time']}".encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# 🏭 "sqlite:copy.db" -> (store, BulkWriter for MongoDB targets or None)
+def open_store(spec):
+    backend, _, where = spec.partition(":")
+    if backend in JSON_MODES:
+        from json_store import JsonVideoStore
+
+        return JsonVideoStore(backend, where or "youtube.txt"), None
+    if backend == "sqlite":
+        from sqlite_store import SqliteVideoStore
+
+        return SqliteVideoStore(where or "youtube_manager.db"), None
+    if backend == "mongo":
+        import mongo_client
+        from mongo_bulk import BulkWriter
+        from mongo_store import MongoVideoStore
+
+        if where:
+            from pymongo import MongoClient
+
+            client = MongoClient(where, **mongo_client.pool_settings())
+            db = client.get_default_database(mongo_client.DATABASE)
+        else:
+            db = mongo_client.get_database()
+        store = MongoVideoStore(db)
+        store.ensure_indexes()
+        return store, BulkWriter(store, max_ops=None, window=None)
+    raise ValueError(f"unknown backend in {spec!r}: use json:, journal:, lazy:, sqlite: or mongo:")
+
+
+class Checkpoint:
+    def __init__(self, path):
+        # FULL: a committed batch must survive a power cut, or its adds
+        # would be sent again
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = FULL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS id_map (
+                source_id TEXT PRIMARY KEY,
+                target_id NOT NULL,
+                digest TEXT NOT NULL,
+                run INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_id_map_run ON id_map (run)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_id_map_target ON id_map (target_id)")
+
+    @contextmanager
+    def transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def get(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+
+    # 🔗 source ids -> {source id: (target id, digest)} for the ones already copied
+    def lookup(self, source_ids):
+        found = {}
+        for first in range(0, len(source_ids), 500):  # under SQLite's variable limit
+            chunk = source_ids[first : first + 500]
+            rows = self.conn.execute(
+                "SELECT source_id, target_id, digest FROM id_map "
+                f"WHERE source_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            found.update((row[0], (row[1], row[2])) for row in rows)
+        return found
+
+    def map(self, source_id, target_id, digest, run):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO id_map (source_id, target_id, digest, run) VALUES (?, ?, ?, ?)",
+            (source_id, target_id, digest, run),
+        )
+
+    # 🔢 `renumber`: the target numbers videos by position (youtube.txt), so
+    #    every video after a deleted one moves up a place
+    def unmap(self, source_id, target_id, renumber=False):
+        self.conn.execute("DELETE FROM id_map WHERE source_id = ?", (source_id,))
+        if renumber:
+            self.conn.execute(
+                "UPDATE id_map SET target_id = target_id - 1 WHERE target_id > ?", (target_id,)
+            )
+
+    def mark_seen(self, source_ids, run):
+        self.conn.executemany(
+            "UPDATE id_map SET run = ? WHERE source_id = ?", [(run, sid) for sid in source_ids]
+        )
+
+    # 🧹 Copied videos the current run's scan didn't see (gone from the source)
+    def stale(self, run, limit):
+        return self.conn.execute(
+            "SELECT source_id, target_id FROM id_map WHERE run < ? ORDER BY run LIMIT ?",
+            (run, limit),
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+class Sync:
+    def __init__(self, source, target, checkpoint, batch_size=BATCH_SIZE, bulk=None, out=None):
+        self.source = source
+        self.target = target
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self.bulk = bulk  # mongo_bulk.BulkWriter: one bulk_write per batch
+        self.out = sys.stdout if out is None else out
+        self.positional = getattr(target, "renumbers", False)
+        self.counts = dict.fromkeys(("read", "added", "updated", "deleted", "unchanged"), 0)
+        self.started = self.reported = timer.perf_counter()
+
+    # ▶️ Bring the target up to date -> counts
+    def run(self):
+        checkpoint = self.checkpoint
+        self.recover()
+        feed = hasattr(self.source, "changes")
+        if checkpoint.get("phase", "done") == "done":
+            if feed and checkpoint.get("seq") is not None:
+                self.follow_changes()
+                return self.counts
+            with checkpoint.transaction():
+                checkpoint.set("run", checkpoint.get("run", 0) + 1)
+                checkpoint.set("phase", "scan")
+                checkpoint.set("after", None)
+                if feed:  # changes made during the scan are picked up right after it
+                    checkpoint.set("seq_start", self.source.change_seq())
+        if checkpoint.get("phase") == "scan":
+            self.scan()
+            with checkpoint.transaction():
+                checkpoint.set("phase", "sweep")
+        if checkpoint.get("phase") == "sweep":
+            self.sweep()
+            with checkpoint.transaction():
+                checkpoint.set("phase", "done")
+                if feed:
+                    checkpoint.set("seq", checkpoint.get("seq_start"))
+        if feed:
+            self.follow_changes()
+        return self.counts
+
+    # 📸 Snapshot diff, part 1: the whole source, page by page
+    def scan(self):
+        after = self.checkpoint.get("after")
+        while True:
+            if after is None:
+                rows = list(self.source.list(1, self.batch_size))
+            else:
+                rows = list(self.source.list(after=after, page_size=self.batch_size))
+            if not rows:
+                return
+            known = self.checkpoint.lookup([str(row["id"]) for row in rows])
+            adds, updates, seen = [], [], []
+            for row in rows:
+                source_id, row_digest = str(row["id"]), digest(row)
+                if source_id not in known:
+                    adds.append((source_id, row, row_digest))
+                elif known[source_id][1] != row_digest:
+                    updates.append((source_id, known[source_id][0], row, row_digest))
+                else:
+                    seen.append(source_id)
+            after = str(rows[-1]["id"])
+            self.counts["read"] += len(rows)
+            self.apply(adds, updates, [], {"after": after}, seen)
+            if len(rows) < self.batch_size:
+                return
+
+    # 🧹 Snapshot diff, part 2: delete what the scan no longer found
+    def sweep(self):
+        run = self.checkpoint.get("run")
+        while stale := self.checkpoint.stale(run, self.batch_size):
+            self.apply([], [], [tuple(row) for row in stale], {})
+
+    # 🔄 Change feed: only the videos logged after the saved seq
+    def follow_changes(self):
+        seq = self.checkpoint.get("seq")
+        while changes := self.source.changes(seq, self.batch_size):
+            latest = {str(video_id): video for _, video_id, video in changes}
+            known = self.checkpoint.lookup(list(latest))
+            adds, updates, deletes = [], [], []
+            for source_id, video in latest.items():
+                if video is None:
+                    if source_id in known:
+                        deletes.append((source_id, known[source_id][0]))
+                    continue
+                row_digest = digest(video)
+                if source_id not in known:
+                    adds.append((source_id, video, row_digest))
+                elif known[source_id][1] != row_digest:
+                    updates.append((source_id, known[source_id][0], video, row_digest))
+                else:
+                    self.counts["unchanged"] += 1
+            seq = changes[-1][0]
+            self.counts["read"] += len(latest)
+            self.apply(adds, updates, deletes, {"seq": seq})
+            if len(changes) < self.batch_size:
+                return
+
+    # ✍️ One batch: note it as pending, write the target, then commit the
+    #    new ids, digests and `state` to the checkpoint in one transaction
+    def apply(self, adds, updates, deletes, state, seen=()):
+        checkpoint = self.checkpoint
+        run = checkpoint.get("run", 0)
+        if self.positional:  # from the back, so no delete moves another's position
+            deletes.sort(key=lambda pair: pair[1], reverse=True)
+        if adds or updates or deletes:
+            with checkpoint.transaction():
+                checkpoint.set(
+                    "pending",
+                    {
+                        "tail": self.target.last_id(),
+                        "adds": [[source_id, row_digest] for source_id, _, row_digest in adds],
+                        "deletes": [list(pair) for pair in deletes],
+                    },
+                )
+            new_ids, missing = self.write(adds, updates, deletes)
+        else:
+            new_ids, missing = [], set()
+
+        with checkpoint.transaction():
+            for source_id, target_id, _, row_digest in updates:
+                if source_id in missing:  # gone from the target: copy again next run
+                    checkpoint.unmap(source_id, target_id)
+                else:
+                    checkpoint.map(source_id, target_id, row_digest, run)
+            for source_id, target_id in deletes:
+                checkpoint.unmap(source_id, target_id, self.positional)
+            for (source_id, _, row_digest), target_id in zip(adds, new_ids):
+                checkpoint.map(source_id, target_id, row_digest, run)
+            checkpoint.mark_seen(seen, run)
+            for key, value in state.items():
+                checkpoint.set(key, value)
+            checkpoint.set("pending", None)
+
+        self.counts["added"] += len(adds)
+        self.counts["updated"] += len(updates) - len(missing)
+        self.counts["deleted"] += len(deletes)
+        self.counts["unchanged"] += len(seen)
+        self.progress()
+
+    # Updates first, then deletes, then adds: with positional ids (youtube.txt)
+    # that is the only order in which every id still points at its video
+    def write(self, adds, updates, deletes):
+        missing = set()
+        if self.bulk is not None:
+            for _, target_id, video, _ in updates:
+                self.bulk.update(target_id, video["name"], video["time"])
+            for _, target_id in deletes:
+                self.bulk.delete(target_id)
+            new_ids = [self.bulk.add(video["name"], video["time"]) for _, video, _ in adds]
+            results = self.bulk.flush()
+            for (source_id, *_), result in zip(updates, results):
+                if not result["ok"]:
+                    missing.add(source_id)
+            failed = [result for result in results[len(updates) + len(deletes) :] if not result["ok"]]
+            if failed:
+                raise RuntimeError(f"{len(failed)} adds failed, first: {failed[0]['error']}")
+            return new_ids, missing
+
+        with self.target.batch():
+            for source_id, target_id, video, _ in updates:
+                if not self.target.update(target_id, video["name"], video["time"]):
+                    missing.add(source_id)
+            for _, target_id in deletes:
+                self.target.delete(target_id)
+            new_ids = [self.target.add(video["name"], video["time"]) for _, video, _ in adds]
+        return new_ids, missing
+
+    # ⏯ A batch was pending when the last run stopped: keep what reached the target
+    def recover(self):
+        checkpoint = self.checkpoint
+        pending = checkpoint.get("pending")
+        if not pending:
+            return
+        adds, deletes, tail = pending["adds"], pending["deletes"], pending["tail"]
+        if self.positional:
+            tail = (tail or 0) - len(deletes)  # deletes ran before the adds
+        rows = []
+        if adds:
+            if tail is None:
+                rows = list(self.target.list(1, len(adds)))
+            else:
+                rows = list(self.target.list(after=tail, page_size=len(adds)))
+
+        # The adds that landed are the newest videos, in the order they were sent
+        landed, queue = [], iter(adds)
+        for row in rows:
+            for source_id, row_digest in queue:
+                if digest(row) == row_digest:
+                    landed.append((source_id, row["id"], row_digest))
+                    break
+
+        # youtube.txt is rewritten once per batch: all of it landed or none did
+        if self.positional:
+            applied = len(landed) == len(adds) if adds else self.target.last_id() == (tail or None)
+        else:
+            applied = False  # deletes are simply sent again
+        run = checkpoint.get("run", 0)
+        with checkpoint.transaction():
+            if applied:
+                for source_id, target_id in deletes:
+                    checkpoint.unmap(source_id, target_id, renumber=True)
+            if applied or not self.positional:
+                for source_id, target_id, row_digest in landed:
+                    checkpoint.map(source_id, target_id, row_digest, run)
+            checkpoint.set("pending", None)
+        print(f"⏯  resumed: {len(landed)} of {len(adds)} pending adds had landed", file=self.out)
+
+    def progress(self, final=False):
+        now = timer.perf_counter()
+        if not final and now - self.reported < PROGRESS_EVERY:
+            return
+        self.reported = now
+        counts, elapsed = self.counts, now - self.started
+        rate = counts["read"] / elapsed if elapsed else 0.0
+        print(
+            f"{'✅' if final else '🔄'} {counts['read']:,} read: +{counts['added']:,} "
+            f"~{counts['updated']:,} -{counts['deleted']:,} ={counts['unchanged']:,} "
+            f"in {elapsed:.1f}s ({rate:,.0f} videos/sec)",
+            file=self.out,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m video_store.sync")
+    parser.add_argument("source", help="e.g. sqlite:youtube_manager.db")
+    parser.add_argument("target", help="e.g. mongo: or json:copy.txt")
+    parser.add_argument("--checkpoint", default="video_sync.db", help="checkpoint file")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="videos per batch")
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="drop change-log entries this sync has read (only if it is the log's only reader)",
+    )
+    args = parser.parse_args(argv)
+
+    checkpoint = Checkpoint(args.checkpoint)
+    pair = [args.source, args.target]
+    if checkpoint.get("pair", pair) != pair:
+        print(f"❌ {args.checkpoint} belongs to {' -> '.join(checkpoint.get('pair'))}")
+        return 2
+    with checkpoint.transaction():
+        checkpoint.set("pair", pair)
+
+    source, _ = open_store(args.source)
+    target, bulk = open_store(args.target)
+    sync = Sync(source, target, checkpoint, args.batch, bulk)
+    try:
+        sync.run()
+        if args.prune and checkpoint.get("seq"):
+            source.prune_changes(checkpoint.get("seq"))
+        sync.progress(final=True)
+    finally:
+        source.close()
+        target.close()
+        checkpoint.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import argparse
+import os
+import random
+import tempfile
+import time as timer
+
+from freeapi_username import fetch_users_by_id, make_session
+from http_cache import HTTPCache
+from stub_server import StubServer
+
+# 💾 A repeated batch job by user id: no cache, cold, warm and expired cache
+#
+#   python benchmark_cache.py                  # 500 lookups of 150 ids, 20 ms stub
+#   python benchmark_cache.py -n 2000 --ids 300 --latency 0.05
+#
+# "expired" runs with ttl=0, so every lookup is a conditional GET: still a
+# round trip each, but the stub answers 304 and no body comes back.
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=500, help="lookups per run")
+    parser.add_argument("--ids", type=int, default=150, help="distinct user ids")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub seconds per request")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    ids = [rng.randint(1, args.ids) for _ in range(args.n)]
+    http = make_session(args.concurrency)
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "bench_cache.sqlite3")
+
+    print(
+        f"{'cache':<8} {'lookups':>8} {'seconds':>8} {'users/sec':>10}"
+        f" {'requests':>9} {'304s':>6} {'hit ratio':>10}"
+    )
+    server = StubServer(latency=args.latency)
+    with server as base_url:
+        for label, ttl in (("none", None), ("cold", 3600), ("warm", 3600), ("expired", 0)):
+            cache = False if ttl is None else HTTPCache(path, ttl, http=http)
+            served, not_modified = server.served, server.not_modified
+            start = timer.perf_counter()
+            users = fetch_users_by_id(ids, args.concurrency, base_url, http=http, cache=cache)
+            got = sum(1 for _ in users)
+            elapsed = timer.perf_counter() - start
+            ratio = f"{cache.cache_info()['hit_ratio']:.0%}" if cache else "-"
+            print(
+                f"{label:<8} {got:>8,} {elapsed:>8.2f} {got / elapsed:>10,.0f}"
+                f" {server.served - served:>9,}"
+                f" {server.not_modified - not_modified:>6,} {ratio:>10}"
+            )
+            if cache:
+                cache.close()
+
+
+if __name__ == "__main__":
+    main()
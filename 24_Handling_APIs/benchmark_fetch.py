@@ -0,0 +1,61 @@
+import argparse
+import time as timer
+
+import requests
+
+from freeapi_username import RANDOM_USER_PATH, fetch_random_users, fetch_user, make_session
+from stub_server import StubServer
+
+# 🏎️ Random users per second: a new connection each time vs a pooled session
+#
+#   python benchmark_fetch.py                    # local stub, 20 ms per request
+#   python benchmark_fetch.py -n 1000 --latency 0.05 --concurrency 1 8 32
+#
+# Runs against stub_server.StubServer, so no internet is needed and every
+# run sees the same server. `--latency` stands for the network and the real
+# API's work: the more of it, the more concurrency pays off.
+
+
+def naive(base_url, n, timeout):
+    for _ in range(n):
+        requests.get(base_url + RANDOM_USER_PATH, timeout=timeout).json()
+
+
+def pooled(base_url, n, timeout):
+    http = make_session(1)
+    for _ in range(n):
+        fetch_user(base_url, timeout, http)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=400, help="users per run")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub seconds per request")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+    timeout = (3.05, 10)
+
+    runs = [("requests.get", lambda url: naive(url, args.n, timeout))]
+    runs.append(("session", lambda url: pooled(url, args.n, timeout)))
+    for workers in args.concurrency:
+        http = make_session(workers)
+        runs.append(
+            (
+                f"threads={workers}",
+                lambda url, w=workers, h=http: sum(
+                    1 for _ in fetch_random_users(args.n, w, url, timeout, http=h)
+                ),
+            )
+        )
+
+    print(f"{'client':<14} {'users':>6} {'seconds':>8} {'users/sec':>10}")
+    with StubServer(latency=args.latency, seed=7) as base_url:
+        for label, run in runs:
+            start = timer.perf_counter()
+            run(base_url)
+            elapsed = timer.perf_counter() - start
+            print(f"{label:<14} {args.n:>6,} {elapsed:>8.2f} {args.n / elapsed:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import time as timer
+
+from freeapi_username import fetch_random_users, make_session
+from resilience import CircuitBreaker, ResilientSession, RetryPolicy, TokenBucket
+from stub_server import StubServer
+
+# 🛡️ A throttling, flaky API: no retries vs retries vs retries + adaptive rate
+#
+#   python benchmark_retry.py                        # stub allows 100 req/s, 5% 5xx
+#   python benchmark_retry.py -n 2000 --rate-limit 200 --error-rate 0.1
+#   python benchmark_retry.py --no-retry-after       # 429s without Retry-After
+#
+# "users" counts records that arrived, "lost" the ones that failed for good.
+# The 429 column is what the server had to turn away: an adaptive client
+# gets close to the allowed rate while keeping that number low.
+
+
+def clients(args):
+    yield "plain", make_session(args.concurrency)
+    yield "retry", ResilientSession(
+        make_session(args.concurrency), RetryPolicy(args.attempts, base=0.1)
+    )
+    yield "retry+bucket", ResilientSession(
+        make_session(args.concurrency),
+        RetryPolicy(args.attempts, base=0.1),
+        TokenBucket(adaptive=True),  # as get_session(): no limit until the first 429
+        CircuitBreaker(failures=20, reset_after=2),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=1000, help="users per run")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01, help="stub seconds per request")
+    parser.add_argument("--rate-limit", type=int, default=100, help="stub requests per second")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="stub 5xx fraction")
+    parser.add_argument("--attempts", type=int, default=6, help="tries per request")
+    parser.add_argument("--no-retry-after", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'client':<13} {'users':>6} {'lost':>5} {'seconds':>8}"
+        f" {'users/sec':>10} {'429s':>6} {'5xx':>5}"
+    )
+    for label, http in clients(args):
+        server = StubServer(
+            latency=args.latency,
+            seed=7,
+            rate_limit=args.rate_limit,
+            error_rate=args.error_rate,
+            retry_after=not args.no_retry_after,
+        )
+        with server as base_url:
+            lost = []
+            start = timer.perf_counter()
+            users = fetch_random_users(
+                args.n, args.concurrency, base_url, on_error=lost.append, http=http
+            )
+            got = sum(1 for _ in users)
+            elapsed = timer.perf_counter() - start
+        print(
+            f"{label:<13} {got:>6,} {len(lost):>5,} {elapsed:>8.2f} {got / elapsed:>10,.1f}"
+            f" {server.throttled:>6,} {server.errors:>5,}"
+        )
+        if isinstance(http, ResilientSession):
+            print(f"{'':<13} {http.info()}")
+
+
+if __name__ == "__main__":
+    main()
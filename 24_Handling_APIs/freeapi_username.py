@@ -1,18 +1,206 @@
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import HTTPCache
+from resilience import CircuitBreaker, ResilientSession, RetryPolicy, TokenBucket
+
+# 🌐 FreeAPI random users: one at a time, or thousands over pooled connections
+#
+#   username, country = fetch_random_user_freeapi()
+#
+#   for user in fetch_random_users(5000, concurrency=16):
+#       print(user["login"]["username"], user["location"]["country"])
+#
+#   user = fetch_user_by_id(42)                        # cached on disk
+#   for user in fetch_users_by_id(range(1, 501), concurrency=16): ...
+#
+# Every request goes through one shared requests.Session, whose connection
+# pool keeps TCP/TLS connections open between requests (keep-alive) instead
+# of a new handshake per user. BASE_URL points somewhere else, e.g. at the
+# local stub (stub_server.py) for tests and benchmarks.
+#
+# 🛡️ The shared session also retries (backoff with jitter, Retry-After),
+# paces itself with an adaptive token bucket and stops calling a failing
+# upstream for a while (resilience.py):
+#   FREEAPI_RETRIES        tries per request, the first included (5)
+#   FREEAPI_RATE           starting requests/second (unset: no limit until the first 429)
+#   FREEAPI_MAX_RATE       the rate never climbs above this (unset: no cap)
+#   FREEAPI_BREAKER        failures in a row that open the circuit (5)
+#   FREEAPI_BREAKER_RESET  seconds before an open circuit lets a call through (30)
+#
+# 💾 Lookups by id go through an on-disk HTTPCache (http_cache.py), so a
+# batch job that runs again skips the round trips it already made. Random
+# users are never cached: each request must give a new one.
+#   HTTP_CACHE       cache file (http_cache.sqlite3); "" turns the cache off
+#   HTTP_CACHE_TTL   seconds before an entry is revalidated (3600)
+
+BASE_URL = os.getenv("BASE_URL", "https://api.freeapi.app")
+RANDOM_USER_PATH = "/api/v1/public/randomusers/user/random"
+USER_PATH = "/api/v1/public/randomusers/{}"
+CACHE_PATH = os.getenv("HTTP_CACHE", "http_cache.sqlite3")
+CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "3600"))
+
+# (connect, read) seconds: a stuck server costs one slot, not the whole job
+TIMEOUT = (3.05, 10)
+POOL_SIZE = 32  # keep-alive connections per host (>= the largest concurrency)
+RETRIES = int(os.getenv("FREEAPI_RETRIES", "5"))
+RATE = os.getenv("FREEAPI_RATE", "")
+MAX_RATE = os.getenv("FREEAPI_MAX_RATE", "")
+BREAKER_FAILURES = int(os.getenv("FREEAPI_BREAKER", "5"))
+BREAKER_RESET = float(os.getenv("FREEAPI_BREAKER_RESET", "30"))
+
+MISSING = object()
+
+session = None
+cache = None
+session_lock = threading.Lock()
+
+
+class FetchError(Exception):
+    pass
+
+
+def make_session(pool_size=POOL_SIZE):
+    new_session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+    new_session.mount("https://", adapter)
+    new_session.mount("http://", adapter)
+    return new_session
+
+
+# 🛡️ A pooled session with retries, pacing and a circuit breaker
+def make_resilient_session(pool_size=POOL_SIZE):
+    limiter = TokenBucket(
+        float(RATE) if RATE else None,
+        max_rate=float(MAX_RATE) if MAX_RATE else None,
+        adaptive=True,
+    )
+    return ResilientSession(
+        make_session(pool_size),
+        retry=RetryPolicy(RETRIES),
+        limiter=limiter,
+        breaker=CircuitBreaker(BREAKER_FAILURES, BREAKER_RESET),
+    )
+
+
+# 🔁 The process-wide session, made on first use
+def get_session():
+    global session
+    if session is None:
+        with session_lock:
+            if session is None:
+                session = make_resilient_session()
+    return session
+
+
+# 💾 The process-wide response cache, or None when HTTP_CACHE is ""
+def get_cache():
+    global cache
+    if cache is None and CACHE_PATH:
+        http = get_session()
+        with session_lock:
+            if cache is None:
+                cache = HTTPCache(CACHE_PATH, CACHE_TTL, http=http)
+    return cache
+
+
+# 📦 The "data" object of a FreeAPI response
+def user_from(response):
+    try:
+        data = response.json()
+    except ValueError:
+        raise FetchError(f"HTTP {response.status_code}: response is not JSON")
+    if response.ok and data.get("success") and "data" in data:
+        return data["data"]
+    raise FetchError(f"HTTP {response.status_code}: {data.get('message', 'no user in response')}")
+
+
+# 👤 One random user's full record
+def fetch_user(base_url=BASE_URL, timeout=TIMEOUT, http=None):
+    http = get_session() if http is None else http
+    return user_from(http.get(base_url + RANDOM_USER_PATH, timeout=timeout))
+
+
+# 🪪 A user by id, through the cache (cache=False: straight to the network)
+def fetch_user_by_id(user_id, base_url=BASE_URL, timeout=TIMEOUT, http=None, cache=None):
+    http = get_session() if http is None else http
+    cache = get_cache() if cache is None else cache
+    url = base_url + USER_PATH.format(user_id)
+    if cache:
+        return user_from(cache.get(url, timeout=timeout, http=http))
+    return user_from(http.get(url, timeout=timeout))
+
+
+def fetch_random_user_freeapi(base_url=BASE_URL, timeout=TIMEOUT):
+    try:
+        user_data = fetch_user(base_url, timeout)
+    except (requests.RequestException, FetchError) as error:
+        raise FetchError(f"Failed to fetch user data from FreeAPI: {error}") from error
+    username = user_data["login"]["username"]
+    country = user_data["location"]["country"]
+    return username, country
+
+
+# 🚀 fetch(job) for every job on `concurrency` threads, yielded as each one finishes
+#
+# At most 2 x concurrency jobs are queued at any time, so asking for a
+# million users doesn't create a million futures, and `jobs` may be endless
+# (stop iterating when you have enough: the queued jobs are dropped). A
+# failed request raises (after the ones in flight finish) unless
+# `on_error(error)` is given, in which case it is reported there and the
+# rest carry on.
+def fan_out(fetch, jobs, concurrency, on_error=None):
+    jobs = iter(jobs)
+    window = 2 * concurrency
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="freeapi") as pool:
+        pending = set()
+        exhausted = False
+        try:
+            while not exhausted or pending:
+                while not exhausted and len(pending) < window:
+                    job = next(jobs, MISSING)
+                    if job is MISSING:
+                        exhausted = True
+                    else:
+                        pending.add(pool.submit(fetch, job))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        yield future.result()
+                    except (requests.RequestException, FetchError) as error:
+                        if on_error is None:
+                            raise
+                        on_error(error)
+        finally:
+            for future in pending:  # failed, or the caller stopped early
+                future.cancel()
+
+
+# 🎲 `n` random users
+def fetch_random_users(
+    n, concurrency=8, base_url=BASE_URL, timeout=TIMEOUT, on_error=None, http=None
+):
+    http = get_session() if http is None else http
+    return fan_out(lambda _: fetch_user(base_url, timeout, http), range(n), concurrency, on_error)
+
 
+# 🪪 The users with these ids, in the order they arrive
+def fetch_users_by_id(
+    user_ids, concurrency=8, base_url=BASE_URL, timeout=TIMEOUT, on_error=None, http=None, cache=None
+):
+    http = get_session() if http is None else http
+    cache = get_cache() if cache is None else cache
 
-def fetch_random_user_freeapi():
-    url = "https://api.freeapi.app/api/v1/public/randomusers/user/random"
-    response = requests.get(url)
-    data = response.json()
+    def fetch(user_id):
+        return fetch_user_by_id(user_id, base_url, timeout, http, cache)
 
-    if data["success"] and "data" in data:
-        user_data = data["data"]
-        username = user_data["login"]["username"]
-        country = user_data["location"]["country"]
-        return username, country
-    else:
-        raise Exception("Failed to fetch user data from FreeAPI")
+    return fan_out(fetch, user_ids, concurrency, on_error)
 
 
 def main():
@@ -0,0 +1,315 @@
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import time as timer
+
+from freeapi_username import BASE_URL, fan_out, fetch_user, get_session
+
+# 🌾 Harvest N random users into JSONL or CSV, resumably
+#
+#   python harvest.py 100000 users/                            # login.username, location.country
+#   python harvest.py 100000 users/ --format csv --fields login.username location.country email
+#   python harvest.py 100000 users/ --fields user=login.username age=dob.age
+#   python harvest.py 100000 users/                            # again after a crash: carries on
+#
+# Only the chosen fields are kept ("name=path" renames a column; a missing
+# field is written as null / an empty cell). Records are written in batches
+# of --batch as they arrive, so memory stays at one batch.
+#
+# 📂 users/ holds segments of --segment records each:
+#   users-00000.jsonl ...     finished segments, never touched again
+#   users-00007.jsonl.part    the segment being written
+#   checkpoint.json           how far the harvest got
+#
+# ⏯ After each batch the .part file is flushed to disk (fsync) and the
+#    checkpoint records its length. A full segment (or the last, short one)
+#    is renamed to its final name: atomic, so readers of *.jsonl / *.csv
+#    see a whole segment or none of it. A killed job restarts by cutting the
+#    .part file back to the checkpointed length (dropping at most the one
+#    batch that was being written) and fetching the rest. Resuming with
+#    other fields, format or segment size is refused; a bigger total just
+#    carries on into new segments.
+
+FIELDS = ["login.username", "location.country"]
+BATCH_SIZE = 500
+SEGMENT_SIZE = 10_000
+MAX_FAILURES = 50  # failed requests in a row before giving up (the checkpoint stays)
+CHECKPOINT = "checkpoint.json"
+
+
+class HarvestError(Exception):
+    pass
+
+
+# "user=login.username" -> ("user", ["login", "username"]); "dob.age" -> ("dob.age", ...)
+def parse_field(spec):
+    name, _, path = spec.rpartition("=")
+    return name or path, path.split(".")
+
+
+def extract(record, fields):
+    row = {}
+    for name, path in fields:
+        value = record
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        row[name] = value
+    return row
+
+
+# ✍️ Records -> text, one segment file at a time
+class JsonlFormat:
+    extension = "jsonl"
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def header(self):
+        return ""
+
+    def lines(self, rows):
+        return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+class CsvFormat:
+    extension = "csv"
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def render(self, rows, header=False):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, self.columns, lineterminator="\n")
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    def header(self):
+        return self.render([], header=True)  # every segment is a CSV on its own
+
+    def lines(self, rows):
+        return self.render(rows)
+
+
+FORMATS = {"jsonl": JsonlFormat, "csv": CsvFormat}
+
+
+# 💾 Write to a temporary file, fsync, then rename over `path`
+def write_atomic(path, text):
+    temp = path + ".tmp"
+    with open(temp, "w", encoding="utf-8") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp, path)
+
+
+class Harvest:
+    def __init__(
+        self,
+        folder,
+        total,
+        fields=FIELDS,
+        format="jsonl",
+        batch_size=BATCH_SIZE,
+        segment_size=SEGMENT_SIZE,
+        prefix="users",
+    ):
+        self.folder = folder
+        self.total = total
+        self.specs = list(fields)
+        self.fields = [parse_field(spec) for spec in self.specs]
+        self.format = FORMATS[format]([name for name, _ in self.fields])
+        self.format_name = format
+        self.batch_size = batch_size
+        self.segment_size = segment_size
+        self.prefix = prefix
+        self.segments = 0  # finished segments
+        self.finished = 0  # records in them
+        self.partial = 0  # records in the .part file
+        self.part_bytes = 0  # its checkpointed length
+        self.file = None
+        os.makedirs(folder, exist_ok=True)
+        self.resume()
+
+    @property
+    def done(self):
+        return self.finished + self.partial
+
+    def segment_path(self, index):
+        return os.path.join(self.folder, f"{self.prefix}-{index:05d}.{self.format.extension}")
+
+    def part_path(self, index):
+        return self.segment_path(index) + ".part"
+
+    def settings(self):
+        return {
+            "fields": self.specs,
+            "format": self.format_name,
+            "segment_size": self.segment_size,
+            "prefix": self.prefix,
+        }
+
+    def save_checkpoint(self):
+        state = {
+            **self.settings(),
+            "total": self.total,
+            "segments": self.segments,
+            "finished": self.finished,
+            "partial": self.partial,
+            "part_bytes": self.part_bytes,
+            "updated": timer.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        write_atomic(os.path.join(self.folder, CHECKPOINT), json.dumps(state, indent=2) + "\n")
+
+    # ⏯ Pick up where the checkpoint says the last run got to
+    def resume(self):
+        path = os.path.join(self.folder, CHECKPOINT)
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as file:
+            state = json.load(file)
+        settings = {key: state.get(key) for key in self.settings()}
+        if settings != self.settings():
+            raise HarvestError(
+                f"{self.folder} holds a harvest with {settings}; use another folder or the same settings"
+            )
+        self.segments, self.finished = state["segments"], state["finished"]
+        self.partial, self.part_bytes = state["partial"], state["part_bytes"]
+        last = self.segments - 1
+        if last >= 0 and os.path.exists(self.part_path(last)):
+            # killed between checkpointing a full segment and renaming it
+            os.replace(self.part_path(last), self.segment_path(last))
+        if self.partial and not os.path.exists(self.part_path(self.segments)):
+            raise HarvestError(
+                f"{self.part_path(self.segments)} is missing: the checkpoint expects {self.partial} records in it"
+            )
+
+    def open_part(self):
+        if self.partial:
+            self.file = open(self.part_path(self.segments), "r+b")
+            self.file.truncate(self.part_bytes)  # drop a batch the checkpoint never saw
+            self.file.seek(self.part_bytes)
+        else:
+            self.file = open(self.part_path(self.segments), "wb")
+            self.file.write(self.format.header().encode("utf-8"))
+
+    # ✍️ One batch: append, fsync, checkpoint. A full segment is checkpointed as
+    #    finished first and renamed after, so resume() can redo a lost rename
+    def write_batch(self, rows):
+        while rows:
+            if self.file is None:
+                self.open_part()
+            room = self.segment_size - self.partial
+            chunk, rows = rows[:room], rows[room:]
+            self.file.write(self.format.lines(chunk).encode("utf-8"))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.partial += len(chunk)
+            self.part_bytes = self.file.tell()
+            if self.partial < self.segment_size and self.done < self.total:
+                self.save_checkpoint()
+                continue
+            self.file.close()
+            self.file = None
+            index = self.segments
+            self.segments += 1
+            self.finished += self.partial
+            self.partial = self.part_bytes = 0
+            self.save_checkpoint()
+            os.replace(self.part_path(index), self.segment_path(index))
+
+    # 🚜 Pull records until `total` are written; returns how many this run added
+    def run(self, records):
+        start = self.done
+        batch = []
+        for record in records:
+            if self.done + len(batch) >= self.total:
+                break
+            batch.append(extract(record, self.fields))
+            if len(batch) >= self.batch_size:
+                self.write_batch(batch)
+                batch = []
+        if batch:
+            self.write_batch(batch)
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        return self.done - start
+
+
+def harvest(
+    total,
+    folder,
+    fields=FIELDS,
+    format="jsonl",
+    batch_size=BATCH_SIZE,
+    segment_size=SEGMENT_SIZE,
+    concurrency=8,
+    base_url=BASE_URL,
+    max_failures=MAX_FAILURES,
+    http=None,
+):
+    job = Harvest(folder, total, fields, format, batch_size, segment_size)
+    if job.done >= total:
+        return job, 0
+    http = get_session() if http is None else http
+    failures = [0]  # in a row
+
+    def fetch(_):
+        user = fetch_user(base_url, http=http)
+        failures[0] = 0
+        return user
+
+    def on_error(error):
+        failures[0] += 1
+        if failures[0] >= max_failures:
+            raise HarvestError(f"{failures[0]} requests failed in a row, last: {error}") from error
+
+    records = fan_out(fetch, itertools.count(), concurrency, on_error)
+    try:
+        added = job.run(records)
+    finally:
+        records.close()
+    return job, added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Harvest random users into JSONL/CSV segments")
+    parser.add_argument("total", type=int, help="records wanted in all")
+    parser.add_argument("folder", help="output folder (segments + checkpoint.json)")
+    parser.add_argument("--fields", nargs="+", default=FIELDS, help="dotted paths, optionally name=path")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="jsonl")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="records per write + checkpoint")
+    parser.add_argument("--segment", type=int, default=SEGMENT_SIZE, help="records per output file")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--base-url", default=BASE_URL)
+    args = parser.parse_args()
+
+    start = timer.perf_counter()
+    try:
+        job, added = harvest(
+            args.total,
+            args.folder,
+            args.fields,
+            args.format,
+            args.batch,
+            args.segment,
+            args.concurrency,
+            args.base_url,
+        )
+    except HarvestError as error:
+        raise SystemExit(f"❌ {error}")
+    elapsed = timer.perf_counter() - start
+    print(
+        f"🌾 {job.done:,} / {job.total:,} records in {job.segments} segment(s)"
+        f" ({added:,} this run, {added / elapsed if elapsed else 0:,.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
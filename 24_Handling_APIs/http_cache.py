@@ -0,0 +1,239 @@
+import json
+import sqlite3
+import threading
+import time as timer
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 💾 On-disk cache for GET responses (one SQLite file)
+#
+#   cache = HTTPCache("http_cache.sqlite3", ttl=3600, max_entries=5000)
+#   response = cache.get(url, params={"page": 2})   # miss -> network, then kept
+#   response = cache.get(url, params={"page": 2})   # hit  -> no round trip
+#   cache.cache_info()                              # {"hits", "hit_ratio", ...}
+#
+# The key is the full URL with the params sorted, so {"a": 1, "b": 2} and
+# {"b": 2, "a": 1} share one entry. The file outlives the process, so the
+# next run of a batch job starts warm.
+#
+# ⏳ Freshness:
+#   younger than `ttl`     -> served from disk, no request at all
+#   older, has validators  -> conditional GET (If-None-Match / If-Modified-Since):
+#                             a 304 costs a round trip but no body, and the
+#                             entry is fresh for another `ttl`
+#   older, no validators   -> fetched again
+#
+# 🛟 `stale_if_error`: when the upstream times out, can't be reached or
+#    answers 5xx, a stale entry is served instead of failing.
+#
+# 🧹 Size: at most `max_entries` responses and `max_bytes` of bodies; the
+#    least recently used go first (every hit updates `used_at`). Only 200s
+#    without `Cache-Control: no-store` are kept.
+#
+# One connection behind a lock serves every thread; requests go out with
+# the lock released. Another process may share the file (WAL, busy timeout),
+# but each one only counts its own entries towards the size limits.
+
+CACHE_PATH = "http_cache.sqlite3"
+TTL = 3600  # seconds
+MAX_ENTRIES = 10_000
+MAX_BYTES = 64 * 1024 * 1024
+# The stored body is already decompressed and complete
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key           TEXT PRIMARY KEY,
+    status        INTEGER NOT NULL,
+    headers       TEXT NOT NULL,
+    body          BLOB NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    stored_at     REAL NOT NULL,
+    used_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+"""
+
+
+def cache_key(url, params=None):
+    items = sorted(params.items()) if isinstance(params, dict) else params
+    return requests.Request("GET", url, params=items).prepare().url
+
+
+def stored_headers(headers):
+    return {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS}
+
+
+# 📦 A stored entry as a requests.Response (`.json()`, `.headers`, ... work as usual)
+def build_response(key, status, headers, body):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(json.loads(headers))
+    response._content = body
+    response.url = key
+    response.from_cache = True
+    return response
+
+
+class HTTPCache:
+    def __init__(
+        self,
+        path=CACHE_PATH,
+        ttl=TTL,
+        max_entries=MAX_ENTRIES,
+        max_bytes=MAX_BYTES,
+        stale_if_error=True,
+        http=None,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_if_error = stale_if_error
+        self.http = http or requests.Session()
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.entries, self.bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+        ).fetchone()
+        self.hits = self.revalidated = self.misses = self.stale = 0
+        self.evictions = 0
+
+    def lookup(self, key):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+    # 🌐 GET through the cache; returns a requests.Response either way
+    def get(self, url, params=None, timeout=None, http=None):
+        key = cache_key(url, params)
+        row = self.lookup(key)
+        if row is not None and timer.time() - row[5] < self.ttl:
+            self.touch(key, refresh=False)
+            self.count("hits")
+            return build_response(key, *row[:3])
+
+        headers = {}
+        if row is not None and row[3]:
+            headers["If-None-Match"] = row[3]
+        if row is not None and row[4]:
+            headers["If-Modified-Since"] = row[4]
+        try:
+            response = (http or self.http).get(key, headers=headers, timeout=timeout)
+        except requests.RequestException:
+            if row is None or not self.stale_if_error:
+                raise
+            self.count("stale")
+            return build_response(key, *row[:3])
+
+        if response.status_code == 304 and row is not None:
+            self.touch(key, refresh=True, validators=response.headers)
+            self.count("revalidated")
+            return build_response(key, *row[:3])
+        if response.status_code >= 500 and row is not None and self.stale_if_error:
+            self.count("stale")
+            return build_response(key, *row[:3])
+        self.count("misses")
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self.store(key, response)
+        return response
+
+    def store(self, key, response):
+        body = response.content
+        now = timer.time()
+        with self.lock:
+            old = self.conn.execute(
+                "SELECT LENGTH(body) FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(stored_headers(response.headers)),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                ),
+            )
+            if old is None:
+                self.entries += 1
+            self.bytes += len(body) - (old[0] if old else 0)
+            self.evict()
+
+    # 🧹 Drop least recently used entries until both limits hold (lock held)
+    def evict(self):
+        while self.entries > self.max_entries or self.bytes > self.max_bytes:
+            excess = max(self.entries - self.max_entries, 1)
+            rows = self.conn.execute(
+                "DELETE FROM responses WHERE key IN"
+                " (SELECT key FROM responses ORDER BY used_at LIMIT ?)"
+                " RETURNING LENGTH(body)",
+                (excess,),
+            ).fetchall()
+            if not rows:
+                self.entries = self.bytes = 0
+                return
+            self.entries -= len(rows)
+            self.bytes -= sum(size for (size,) in rows)
+            self.evictions += len(rows)
+
+    # ⏱ Mark an entry used; after a 304 also restart its ttl and take any new validators
+    def touch(self, key, refresh, validators=None):
+        now = timer.time()
+        with self.lock:
+            if not refresh:
+                self.conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+                return
+            self.conn.execute(
+                "UPDATE responses SET used_at = ?, stored_at = ?,"
+                " etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)"
+                " WHERE key = ?",
+                (now, now, validators.get("ETag"), validators.get("Last-Modified"), key),
+            )
+
+    def count(self, outcome):
+        with self.lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def cache_info(self):
+        with self.lock:
+            lookups = self.hits + self.revalidated + self.misses + self.stale
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "stale": self.stale,
+                # no request at all / no body downloaded
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "saved_ratio": (self.hits + self.revalidated + self.stale) / lookups if lookups else 0.0,
+                "size": self.entries,
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.entries = self.bytes = 0
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,342 @@
+import email.utils
+import random
+import threading
+import time as timer
+
+import requests
+
+# 🛡️ Retries, rate limiting and a circuit breaker for API calls
+#
+#   http = ResilientSession(
+#       requests.Session(),
+#       retry=RetryPolicy(attempts=5),
+#       limiter=TokenBucket(adaptive=True),
+#       breaker=CircuitBreaker(failures=5, reset_after=30),
+#   )
+#   response = http.get(url, timeout=(3.05, 10))   # same call as Session.get
+#   http.info()                                    # {"retries", "throttled", ...}
+#
+# 🔁 RetryPolicy: connection errors, timeouts, 429 and 5xx are tried again
+#    after a backoff (fine for GETs; don't retry a POST that isn't
+#    idempotent). Unlike a fixed doubling sleep (13_Loops/10_Solution.py),
+#    each wait is random in [0, min(cap, base * 2**attempt)] ("full jitter"),
+#    so clients that failed together don't all come back together. A
+#    Retry-After header (seconds or an HTTP date) replaces the computed wait.
+#    When the attempts run out, the last response is returned (or the last
+#    error raised) for the caller to deal with.
+#
+# 🪣 TokenBucket: at most `rate` requests per second, bursts up to `burst`
+#    (rate=None: no limit). With adaptive=True it tunes itself, like TCP's
+#    congestion window. Without a starting rate nothing is held back until
+#    the first 429, which starts the rate just under what got through in
+#    the last second; with one, the rate doubles every second until then.
+#    After that it grows by `increase` requests/s per second, slowing to a
+#    tenth of that near the rate that drew the last 429 (so it sits just
+#    under the limit), and never goes above `max_rate` if one is given.
+#    Every 429 multiplies it by `decrease` (at most once per `cooldown`, so
+#    one burst of 429s from requests already in flight counts once), never
+#    below `min_rate`. A Retry-After also pauses the bucket, so every thread
+#    waits, not just the one that was told to. The rate settles just under
+#    what the server allows: the most throughput without living on 429s.
+#
+# ⚡ CircuitBreaker: after `failures` failures in a row (connection errors,
+#    timeouts, 5xx; a 429 means busy, not down) calls fail at once with
+#    CircuitOpenError for `reset_after` seconds. Then a single trial call
+#    goes through: success closes the circuit, failure opens it again.
+#    CircuitOpenError is a requests.ConnectionError, so code that already
+#    handles network failures (HTTPCache's stale-if-error, fan_out's
+#    on_error) handles it too.
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.ConnectionError):
+    pass
+
+
+# ⏳ Seconds to wait from a Retry-After header, or None
+def retry_after(response):
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, moment.timestamp() - timer.time())
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts=5,
+        base=0.5,
+        cap=30.0,
+        statuses=RETRY_STATUSES,
+        exceptions=(requests.ConnectionError, requests.Timeout),
+        max_retry_after=120.0,
+        rng=None,
+    ):
+        self.attempts = attempts  # total tries, the first one included
+        self.base = base
+        self.cap = cap
+        self.statuses = statuses
+        self.exceptions = exceptions
+        self.max_retry_after = max_retry_after
+        self.rng = rng or random.Random()
+
+    # Wait before try number `attempt + 1` (attempt 0 = the first retry)
+    def backoff(self, attempt, response=None):
+        told = retry_after(response)
+        if told is not None:
+            return min(told, self.max_retry_after)
+        return self.rng.uniform(0, min(self.cap, self.base * 2**attempt))
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate=None,
+        burst=None,
+        max_rate=None,
+        min_rate=None,
+        increase=None,
+        decrease=0.75,
+        cooldown=1.0,
+        adaptive=False,
+    ):
+        self.rate = None if rate is None else float(rate)  # None = no limit (yet)
+        self.burst = burst
+        self.max_rate = max_rate  # None = no cap
+        self.min_rate = min_rate
+        self.increase = increase  # requests/s gained per second; None = ceiling / 50
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.adaptive = adaptive
+        self.tokens = self.capacity
+        self.updated = self.grown = timer.monotonic()
+        self.paused_until = 0.0
+        self.last_cut = None  # no 429 yet: still in slow start
+        self.ceiling = None  # the rate that drew the last 429
+        self.window, self.sent, self.observed = self.updated, 0, None  # while unlimited
+        self.lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self.burst or max(1.0, self.rate or 1.0)
+
+    # No tokens pile up while paused: a burst right after a Retry-After would
+    # just earn the next 429
+    def refill(self, now):
+        start = max(self.updated, self.paused_until)
+        if self.rate is not None and now > start:
+            self.tokens = min(self.capacity, self.tokens + (now - start) * self.rate)
+        self.updated = now
+
+    # 🎟 Take a token, sleeping (outside the lock) until one is free
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = timer.monotonic()
+                self.refill(now)
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.rate is None:
+                        return
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            timer.sleep(wait)
+
+    def pause(self, seconds):
+        with self.lock:
+            self.paused_until = max(self.paused_until, timer.monotonic() + seconds)
+            self.tokens = 0.0
+
+    # 📈 Unlimited: only measures the rate actually reached. Otherwise it
+    #    doubles every second until the first 429, then climbs `increase`
+    #    per second up to 95% of the rate that drew it, and a tenth of that
+    #    beyond
+    def on_success(self):
+        if not self.adaptive:
+            return
+        with self.lock:
+            now = timer.monotonic()
+            if self.rate is None:
+                self.sent += 1
+                if now - self.window >= 1.0:
+                    self.observed = self.sent / (now - self.window)
+                    self.window, self.sent = now, 0
+                return
+            elapsed, self.grown = now - self.grown, now
+            if self.last_cut is None:
+                rate = self.rate * 2**elapsed
+            else:
+                increase = self.increase or self.ceiling / 50
+                if self.rate < 0.95 * self.ceiling:
+                    rate = self.rate + increase * elapsed
+                else:
+                    rate = self.rate + increase / 10 * elapsed
+            self.refill(now)
+            self.rate = rate if self.max_rate is None else min(self.max_rate, rate)
+
+    # 📉 Cut the rate by `decrease` (the first 429 while unlimited cuts the
+    #    rate measured over the last second)
+    def on_throttled(self):
+        if not self.adaptive:
+            return
+        with self.lock:
+            now = timer.monotonic()
+            if self.last_cut is None or now - self.last_cut >= self.cooldown:
+                self.refill(now)
+                if self.rate is None:
+                    measured = self.observed or self.sent / max(now - self.window, 0.1)
+                    self.rate = max(1.0, measured)
+                self.ceiling = self.rate
+                if self.min_rate is None:
+                    self.min_rate = self.ceiling / 20
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.tokens = min(self.tokens, 1.0)  # no burst straight after a 429
+                self.last_cut = self.grown = now
+
+
+class CircuitBreaker:
+    def __init__(self, failures=5, reset_after=30.0):
+        self.threshold = failures
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None  # None = closed
+        self.probing = False  # a half-open trial call is in flight
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self.lock:
+            if self.opened_at is None:
+                return "closed"
+            if timer.monotonic() - self.opened_at >= self.reset_after:
+                return "half-open"
+            return "open"
+
+    # 🚦 Raise CircuitOpenError unless this call may go through
+    def before(self):
+        with self.lock:
+            if self.opened_at is None:
+                return
+            waited = timer.monotonic() - self.opened_at
+            if waited >= self.reset_after and not self.probing:
+                self.probing = True
+                return
+            self.rejected += 1
+            left = max(0.0, self.reset_after - waited)
+        raise CircuitOpenError(f"circuit open: upstream failing, next try in {left:.1f}s")
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.threshold:
+                self.opened_at = timer.monotonic()
+            self.probing = False
+
+
+class ResilientSession:
+    def __init__(self, session, retry=None, limiter=None, breaker=None):
+        self.session = session
+        self.retry = retry or RetryPolicy(attempts=1)
+        self.limiter = limiter
+        self.breaker = breaker
+        self.lock = threading.Lock()
+        self.requests = self.retries = self.throttled = self.failed = 0
+        self.slept = 0.0
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        for attempt in range(self.retry.attempts):
+            last = attempt == self.retry.attempts - 1
+            if self.breaker is not None:
+                self.breaker.before()  # fail fast: never retried
+            if self.limiter is not None:
+                self.limiter.acquire()
+            self.count("requests")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except self.retry.exceptions:
+                self.outcome(failed=True)
+                if last:
+                    raise
+                self.wait(self.retry.backoff(attempt))
+                continue
+            except Exception:
+                self.outcome(failed=True)
+                raise
+
+            if response.status_code == 429:
+                self.outcome(throttled=True)
+                if self.limiter is not None:
+                    self.limiter.on_throttled()
+                    told = retry_after(response)
+                    if told is not None:
+                        self.limiter.pause(min(told, self.retry.max_retry_after))
+            else:
+                self.outcome(failed=response.status_code >= 500)
+            if response.status_code not in self.retry.statuses or last:
+                return response
+            response.close()  # hand the connection back to the pool
+            self.wait(self.retry.backoff(attempt, response))
+
+    def outcome(self, failed=False, throttled=False):
+        if throttled:
+            self.count("throttled")
+        elif failed:
+            self.count("failed")
+        if self.breaker is not None:  # a 429 is an answer: the upstream is up
+            if failed:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        if self.limiter is not None and not (failed or throttled):
+            self.limiter.on_success()
+
+    def wait(self, seconds):
+        self.count("retries")
+        with self.lock:
+            self.slept += seconds
+        timer.sleep(seconds)
+
+    def count(self, name):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def info(self):
+        with self.lock:
+            info = {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "failed": self.failed,
+                "slept": round(self.slept, 3),
+            }
+        if self.limiter is not None:
+            rate = self.limiter.rate
+            info["rate"] = None if rate is None else round(rate, 2)
+        if self.breaker is not None:
+            info["circuit"] = self.breaker.state
+            info["rejected"] = self.breaker.rejected
+        return info
+
+    def close(self):
+        self.session.close()
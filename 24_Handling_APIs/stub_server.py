@@ -0,0 +1,231 @@
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 🧪 Local stand-in for FreeAPI's random-user endpoint (no internet needed)
+#
+#   python stub_server.py --port 8000 --latency 0.05
+#   python stub_server.py --rate-limit 50 --error-rate 0.05   # a flaky, throttling API
+#   BASE_URL=http://127.0.0.1:8000 python freeapi_username.py
+#
+#   with StubServer(latency=0.02) as base_url:
+#       users = list(fetch_random_users(100, base_url=base_url))
+#
+# Answers GET /api/v1/public/randomusers/user/random and /randomusers/<id>
+# with the same JSON shape as the real API. A user by id is always the same
+# record and carries an ETag and Last-Modified, so a conditional GET gets a
+# body-less 304. It speaks HTTP/1.1 keep-alive, so a client that reuses its
+# connections is measured doing exactly that. `latency` (seconds) stands in
+# for the network and the real server's work.
+
+RANDOM_USER_PATH = "/api/v1/public/randomusers/user/random"
+USER_PATH = "/api/v1/public/randomusers/"
+LAST_MODIFIED = "Mon, 06 Jan 2025 00:00:00 GMT"  # every stub user dates from here
+
+FIRST_NAMES = ["Aiden", "Maya", "Omar", "Lena", "Kenji", "Sofia", "Ravi", "Emma"]
+LAST_NAMES = ["Khan", "Silva", "Novak", "Tanaka", "Okafor", "Meyer", "Rossi", "Lee"]
+COUNTRIES = ["Pakistan", "Brazil", "Germany", "Japan", "Nigeria", "Canada", "India", "Spain"]
+
+
+def random_user(rng, user_id):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "id": user_id,
+        "gender": rng.choice(["female", "male"]),
+        "name": {"title": "", "first": first, "last": last},
+        "location": {
+            "city": f"{last}ville",
+            "country": rng.choice(COUNTRIES),
+            "postcode": rng.randint(10000, 99999),
+        },
+        "email": f"{first}.{last}{user_id}@example.com".lower(),
+        "login": {"uuid": f"{rng.getrandbits(128):032x}", "username": f"{first}{user_id}".lower()},
+        "dob": {"age": rng.randint(18, 80)},
+        "phone": f"0{rng.randint(100000000, 999999999)}",
+        "nat": "XX",
+    }
+
+
+def found(user):
+    return {"statusCode": 200, "data": user, "message": "User fetched successfully", "success": True}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # Headers and body go out as two writes; with Nagle on, the second one
+    # waits for the client's delayed ACK (~40 ms) on a reused connection
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        failure = server.failure()
+        if failure is not None:
+            status, headers = failure
+            self.send(status, json.dumps({"statusCode": status, "success": False}).encode(), headers)
+            return
+        path = self.path.split("?")[0]
+        with server.lock:
+            server.served += 1
+            user = random_user(server.rng, server.served) if path == RANDOM_USER_PATH else None
+        if user is not None:
+            self.reply(200, found(user))
+        elif path.startswith(USER_PATH) and path[len(USER_PATH) :].isdigit():
+            self.reply_user(int(path[len(USER_PATH) :]))
+        else:
+            self.reply(404, {"statusCode": 404, "success": False, "message": "Not found"})
+
+    # 🏷 A fixed user, with validators; 304 when the client already has it
+    def reply_user(self, user_id):
+        body = json.dumps(found(random_user(random.Random(user_id), user_id))).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        validators = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+        if self.headers.get("If-None-Match") == etag or (
+            "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since") == LAST_MODIFIED
+        ):
+            with self.server.lock:
+                self.server.not_modified += 1
+            self.send(304, b"", validators)
+        else:
+            self.send(200, body, validators)
+
+    def reply(self, status, payload):
+        self.send(status, json.dumps(payload).encode())
+
+    def send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the benchmark output
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # a burst of new connections mustn't be refused
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)  # a client that timed out and hung up is fine
+
+    # 💥 (status, headers) to answer instead of the real response, or None
+    def failure(self):
+        with self.lock:
+            if self.down:
+                self.errors += 1
+                return 503, {}
+            if self.rate_limit:
+                window = int(time.monotonic())
+                if window != self.window:
+                    self.window, self.window_used = window, 0
+                self.window_used += 1
+                if self.window_used > self.rate_limit:
+                    self.throttled += 1
+                    return 429, {"Retry-After": "1"} if self.retry_after else {}
+            if self.error_rate and self.rng.random() < self.error_rate:
+                self.errors += 1
+                return self.rng.choice((500, 502, 503)), {}
+        return None
+
+
+class StubServer:
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        seed=None,
+        rate_limit=None,
+        error_rate=0.0,
+        retry_after=True,
+    ):
+        self.httpd = StubHTTPServer((host, port), StubHandler)
+        self.httpd.latency = latency
+        self.httpd.rate_limit = rate_limit
+        self.httpd.error_rate = error_rate
+        self.httpd.retry_after = retry_after
+        self.httpd.down = False
+        self.httpd.window = self.httpd.window_used = 0
+        self.httpd.throttled = self.httpd.errors = 0
+        self.httpd.rng = random.Random(seed)
+        self.httpd.lock = threading.Lock()
+        self.httpd.served = 0
+        self.httpd.not_modified = 0
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def served(self):
+        return self.httpd.served
+
+    @property
+    def not_modified(self):
+        return self.httpd.not_modified
+
+    @property
+    def throttled(self):
+        return self.httpd.throttled
+
+    @property
+    def errors(self):
+        return self.httpd.errors
+
+    @property
+    def down(self):
+        return self.httpd.down
+
+    @down.setter
+    def down(self, value):
+        self.httpd.down = value
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--rate-limit", type=int, help="requests per second before 429s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered 5xx")
+    args = parser.parse_args()
+    server = StubServer(
+        args.host, args.port, args.latency, rate_limit=args.rate_limit, error_rate=args.error_rate
+    )
+    print(f"🧪 Stub FreeAPI on {server.base_url}{RANDOM_USER_PATH}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()